@@ -0,0 +1,65 @@
+"""
+Compares config attribute reads through generated per-field slots
+with previous `__getattribute__` proxy implementation.
+
+    PYTHONPATH=. python benchmarks/bench_attribute_access.py
+"""
+
+from timeit import repeat
+from dataclasses import dataclass
+
+from helloconfig import PythonConfig
+
+
+class Config(PythonConfig):
+    NUMBER: int
+    STRING: str
+
+    DEFAULT_NUMBER = 15
+
+
+@dataclass(frozen=True)
+class _Data:
+    NUMBER: int
+    STRING: str
+
+
+class ProxyConfig:
+    """Attribute access as it was done before descriptors"""
+
+    DEFAULT_NUMBER = 15
+
+    def __init__(self, data_obj) -> None:
+        object.__setattr__(self, '_data_object', data_obj)
+
+    def __getattribute__(self, __name: str):
+        try:
+            data_obj = object.__getattribute__(self, '_data_object')
+            return getattr(data_obj, __name)
+        except AttributeError:
+            pass
+
+        return object.__getattribute__(self, __name)
+
+
+def bench(label: str, stmt: str, namespace: dict, number: int):
+    best = min(repeat(stmt, globals=namespace, number=number, repeat=5))
+    print(f'{label:<40} {best / number * 1e9:8.1f} ns/read')
+
+
+def main(number: int = 1_000_000):
+    config = Config.from_obj({'NUMBER': 1, 'STRING': 'a'})
+    proxy = ProxyConfig(_Data(NUMBER=1, STRING='a'))
+    data = _Data(NUMBER=1, STRING='a')
+
+    ns = {'config': config, 'proxy': proxy, 'data': data}
+
+    bench('dataclass attribute (baseline)', 'data.NUMBER', ns, number)
+    bench('slot field', 'config.NUMBER', ns, number)
+    bench('proxy field', 'proxy.NUMBER', ns, number)
+    bench('slotted config class attribute', 'config.DEFAULT_NUMBER', ns, number)
+    bench('proxy class attribute', 'proxy.DEFAULT_NUMBER', ns, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+`from_obj` throughput with generated loader (`compiled_loader = True`),
+compared to cached dataclass_factory parser and new `Factory().load`.
+
+    PYTHONPATH=. python benchmarks/bench_compiled_loader.py
+"""
+
+from typing import List
+from timeit import repeat
+
+from dataclass_factory import Factory
+
+from helloconfig import JsonConfig
+from helloconfig.parsers import JsonParser
+
+
+def make_config_cls(compiled: bool):
+    class Config(JsonConfig):
+        compiled_loader = compiled
+
+        host: str
+        port: int
+        workers: int
+        debug: bool
+        tags: list
+        weights: List[float]
+
+        class database:
+            url: str
+            pool_size: int
+            timeout: float
+
+            class retry:
+                attempts: int
+                backoff: float
+
+        class cache:
+            url: str
+            ttl: int
+
+    return Config
+
+
+Config = make_config_cls(compiled=False)
+CompiledConfig = make_config_cls(compiled=True)
+
+RAW_OBJ = JsonParser().parse_string("""{
+    "host": "localhost", "port": 8080, "workers": 4, "debug": false,
+    "tags": ["a", "b", "c"], "weights": [0.1, 0.2, 0.7],
+    "database": {
+        "url": "postgres://localhost/db", "pool_size": 10, "timeout": 1.5,
+        "retry": {"attempts": 3, "backoff": 0.5}
+    },
+    "cache": {"url": "redis://localhost", "ttl": 60}
+}""")
+
+
+def load_factory(raw_obj):
+    inst = Config()
+    inst._set_data(Factory().load(raw_obj, Config._dataclass))
+    return inst
+
+
+def bench(label: str, func, number: int):
+    best = min(repeat(lambda: func(RAW_OBJ), number=number, repeat=5))
+    print(f'{label:<30} {number / best:10.0f} loads/s')
+
+
+def main(number: int = 20_000):
+    bench('Factory().load', load_factory, number // 10)
+    bench('from_obj, cached parser', Config.from_obj, number)
+    bench('from_obj, compiled loader', CompiledConfig.from_obj, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Finding changed fields of reloaded config with large unchanged section:
+first diff of new snapshots computes fingerprints of their sections,
+next diffs (and comparisons) use cached fingerprints.
+
+    PYTHONPATH=. python benchmarks/bench_diff.py
+"""
+
+from typing import Dict, List
+from time import perf_counter
+from timeit import repeat
+
+from helloconfig import JsonConfig
+from helloconfig.diff import diff_configs
+
+
+class Config(JsonConfig):
+    name: str
+
+    class routes:
+        table: Dict[str, List[str]]
+
+    class retry:
+        attempts: int
+
+
+def make_raw_obj(count: int, attempts: int) -> dict:
+    return {
+        'name': 'service',
+        'routes': {'table': {f'/api/{n}': [f'backend-{n % 16}'] for n in range(count)}},
+        'retry': {'attempts': attempts},
+    }
+
+
+def bench(label: str, func, number: int):
+    best = min(repeat(func, number=number, repeat=5))
+    print(f'{label:<30} {best / number * 1000:9.3f} ms')
+
+
+def main(count: int = 50_000, number: int = 10):
+    old = Config.from_obj(make_raw_obj(count, 3))
+    new = Config.from_obj(make_raw_obj(count, 5))
+
+    start = perf_counter()
+    diff_configs(old, new)
+    print(f'{"diff, first":<30} {(perf_counter() - start) * 1000:9.3f} ms')
+
+    bench('diff, known fingerprints', lambda: diff_configs(old, new), number)
+    bench('compare, known fingerprints', lambda: old == new, number)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Adding missing fields to every level of deeply nested python config
+with libcst `FieldUpdater`, compared to full libcst parse and codegen.
+
+    PYTHONPATH=. python benchmarks/bench_field_updater.py
+"""
+
+from time import perf_counter
+
+import libcst
+
+from helloconfig.parsers import PythonParser
+from helloconfig.parsers.base import NameSpace
+
+
+def make_config(depth: int, width: int) -> str:
+    lines = []
+    for level in range(depth):
+        indent = (level + 1) * '    '
+        lines.append(level * '    ' + f'class ns{level}:')
+        lines.extend(f'{indent}value_{n} = {n}' for n in range(width))
+    return '\n'.join(lines) + '\n'
+
+
+def make_missing(depth: int) -> dict:
+    missing = {'added': 1}
+    for level in reversed(range(depth)):
+        missing = {f'ns{level}': NameSpace(missing), 'added': 1}
+    return missing
+
+
+def bench(label: str, func, *args):
+    start = perf_counter()
+    func(*args)
+    elapsed = perf_counter() - start
+    print(f'{label:<32} {elapsed * 1000:9.1f} ms')
+
+
+def main(width: int = 200):
+    parser = PythonParser()
+
+    for depth in (5, 20, 60):
+        config = make_config(depth, width)
+        missing = make_missing(depth)
+        print(f'depth {depth}, config size: {len(config) / 1024:.0f} KB')
+
+        bench('  parse + codegen', lambda: libcst.parse_module(config).code)
+        bench('  update_config', parser.update_config, config, missing)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Memory of 10k tenant configs, which differ in few fields and share
+database, retry and feature sections, without and with `interning`.
+
+    PYTHONPATH=. python benchmarks/bench_interning.py
+"""
+
+import gc
+import json
+import tracemalloc
+
+from typing import Dict, List
+from time import perf_counter
+
+from helloconfig import JsonConfig
+
+
+class TenantConfig(JsonConfig):
+    tenant: str
+    tenant_id: int
+    tags: List[str]
+
+    class database:
+        host: str
+        port: int
+        options: dict
+
+    class retry:
+        attempts: int
+        backoff: List[float]
+
+    class features:
+        flags: Dict[str, bool]
+        routes: dict
+
+
+class InternedTenantConfig(JsonConfig):
+    interning = True
+
+    tenant: str
+    tenant_id: int
+    tags: List[str]
+
+    class database:
+        host: str
+        port: int
+        options: dict
+
+    class retry:
+        attempts: int
+        backoff: List[float]
+
+    class features:
+        flags: Dict[str, bool]
+        routes: dict
+
+
+def make_configs(count: int) -> 'list[str]':
+    features = {
+        'flags': {f'feature_{n}': bool(n % 3) for n in range(50)},
+        'routes': {f'/api/v1/resource_{n}': {'backend': f'service-{n % 8}', 'timeout': 30}
+                   for n in range(50)},
+    }
+    configs = []
+    for n in range(count):
+        configs.append(json.dumps({
+            'tenant': f'tenant-{n}',
+            'tenant_id': n,
+            'tags': ['production', f'region-{n % 4}'],
+            # four database clusters, same retry and features everywhere
+            'database': {'host': f'db-{n % 4}.internal', 'port': 5432,
+                         'options': {'pool_size': 20, 'timeout': 5, 'ssl': True}},
+            'retry': {'attempts': 5, 'backoff': [0.1, 0.5, 1.0, 5.0]},
+            'features': features,
+        }))
+    return configs
+
+
+def measure(config_cls: type, configs: 'list[str]') -> 'tuple[float, float]':
+    """Memory of loaded configs (MiB) and loading time (seconds)"""
+
+    start = perf_counter()
+    loaded = [config_cls.from_str(data) for data in configs]
+    elapsed = perf_counter() - start
+    del loaded
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = [config_cls.from_str(data) for data in configs]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return size / 2 ** 20, elapsed
+
+
+def main(count: int = 10_000):
+    configs = make_configs(count)
+
+    plain_size, plain_time = measure(TenantConfig, configs)
+    interned_size, interned_time = measure(InternedTenantConfig, configs)
+
+    print(f'{"tenants":<20} {count}')
+    print(f'{"without interning":<20} {plain_size:9.1f} MiB {plain_time:7.2f} s')
+    print(f'{"with interning":<20} {interned_size:9.1f} MiB {interned_time:7.2f} s')
+    print(f'{"saved":<20} {plain_size - interned_size:9.1f} MiB '
+          f'({(1 - interned_size / plain_size) * 100:.0f}%)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Peak memory (tracemalloc) and time of loading large JSON config,
+compared to previous pipeline: dict built in pairs hook and copied
+into ImmutableDict, then whole tree copied by new dataclass_factory.Factory.
+
+    PYTHONPATH=. python benchmarks/bench_json_memory.py
+"""
+
+import json
+import tracemalloc
+
+from time import perf_counter
+
+from dataclass_factory import Factory
+
+from helloconfig import JsonConfig
+from helloconfig.immutable import ImmutableDict, ImmutableList
+
+
+class Config(JsonConfig):
+    routes: list
+    limits: dict
+
+
+def make_config(count: int) -> str:
+    return json.dumps({
+        'routes': [
+            {'path': f'/api/{n}', 'methods': ['GET', 'POST'], 'weights': [[n, 1], [2, 3]]}
+            for n in range(count)
+        ],
+        'limits': {f'tenant_{n}': {'rps': n, 'burst': [n, n * 2]} for n in range(count)},
+    })
+
+
+def old_pairs_hook(pairs):
+    result = {}
+    for name, value in pairs:
+        if isinstance(value, list):
+            value = ImmutableList(value)
+        result[name] = value
+    return ImmutableDict(result)
+
+
+def load_old(data: str):
+    raw_obj = json.loads(data, object_pairs_hook=old_pairs_hook)
+    inst = Config()
+    inst._set_data(Factory().load(raw_obj, Config._dataclass))
+    return inst
+
+
+def measure(label: str, func, data: str):
+    tracemalloc.start()
+    start = perf_counter()
+    result = func(data)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{label:<8} peak {peak / (1 << 20):8.1f} MB  {elapsed * 1000:8.1f} ms')
+    return result
+
+
+def main(count: int = 50_000):
+    data = make_config(count)
+    print(f'config size: {len(data) / (1 << 20):.1f} MB')
+    measure('old', load_old, data)
+    measure('new', Config.from_str, data)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Reloading config merged from several layers after one small section
+changed in override layer: merging all layers and loading whole config
+again, compared to `ConfigLayers`, which merges and loads only that section.
+
+    PYTHONPATH=. python benchmarks/bench_layers.py
+"""
+
+from typing import Dict, List
+from timeit import repeat
+
+from helloconfig import ConfigLayers, JsonConfig
+from helloconfig.layers import merge_layers
+
+
+class Config(JsonConfig):
+    name: str
+
+    class routes:
+        table: Dict[str, List[str]]
+
+    class retry:
+        attempts: int
+        delay: float
+
+
+def make_layers(count: int) -> list:
+    base = {
+        'name': 'service',
+        'routes': {'table': {f'/api/{n}': [f'backend-{n % 16}'] for n in range(count)}},
+        'retry': {'attempts': 3, 'delay': 0.5},
+    }
+    environment = {'routes': {'table': {f'/env/{n}': ['env'] for n in range(count // 10)}}}
+    return [base, environment, {'retry': {'attempts': 5}}]
+
+
+def bench(label: str, func, number: int):
+    best = min(repeat(func, number=number, repeat=5))
+    print(f'{label:<30} {best / number * 1000:9.3f} ms')
+
+
+def main(count: int = 20_000, number: int = 20):
+    layers = make_layers(count)
+    config_layers = ConfigLayers(Config, layers)
+    attempts = iter(range(10 ** 9))
+
+    def full_reload():
+        raw_objs = layers[:2] + [{'retry': {'attempts': next(attempts)}}]
+        return Config.from_obj(merge_layers(raw_objs))
+
+    def incremental_reload():
+        return config_layers.set_layer(2, {'retry': {'attempts': next(attempts)}})
+
+    bench('merge + load all', full_reload, number)
+    bench('ConfigLayers, one section', incremental_reload, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Loading config with large sections, which are not read by application,
+eager mode compared to `lazy_sections`.
+
+    PYTHONPATH=. python benchmarks/bench_lazy_sections.py
+"""
+
+from typing import Dict, List
+from timeit import repeat
+
+from helloconfig import JsonConfig
+from helloconfig.parsers import JsonParser
+
+
+class EagerConfig(JsonConfig):
+    name: str
+    workers: int
+
+    class routes:
+        table: Dict[str, List[str]]
+
+    class flags:
+        values: Dict[str, bool]
+
+
+class LazyConfig(JsonConfig):
+    lazy_sections = True
+
+    name: str
+    workers: int
+
+    class routes:
+        table: Dict[str, List[str]]
+
+    class flags:
+        values: Dict[str, bool]
+
+
+def make_raw_obj(count: int) -> dict:
+    return JsonParser().parse_string(JsonParser().update_config('', {
+        'name': 'worker',
+        'workers': 4,
+        'routes': {'table': {f'/api/{n}': [f'backend-{n % 16}'] for n in range(count)}},
+        'flags': {'values': {f'flag_{n}': bool(n % 2) for n in range(count)}},
+    }))
+
+
+def bench(label: str, func, number: int):
+    best = min(repeat(func, number=number, repeat=5))
+    print(f'{label:<30} {best / number * 1000:9.3f} ms')
+
+
+def main(count: int = 20_000, number: int = 10):
+    raw_obj = make_raw_obj(count)
+
+    bench('eager, load', lambda: EagerConfig.from_obj(raw_obj).workers, number)
+    bench('lazy, load', lambda: LazyConfig.from_obj(raw_obj).workers, number)
+    bench('lazy, load + one section',
+          lambda: LazyConfig.from_obj(raw_obj).flags.values, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Repeated `from_obj` / `from_str` throughput with cached per-class loader,
+compared to creating new dataclass_factory.Factory on every call.
+
+    PYTHONPATH=. python benchmarks/bench_loading.py
+"""
+
+from timeit import repeat
+
+from dataclass_factory import Factory
+
+from helloconfig import JsonConfig
+
+
+class Config(JsonConfig):
+    host: str
+    port: int
+    workers: int
+    tags: list
+
+    class database:
+        url: str
+        pool_size: int
+
+        class retry:
+            attempts: int
+            backoff: float
+
+
+RAW_OBJ = {
+    'host': 'localhost',
+    'port': 8080,
+    'workers': 4,
+    'tags': ['a', 'b', 'c'],
+    'database': {
+        'url': 'postgres://localhost/db',
+        'pool_size': 10,
+        'retry': {'attempts': 3, 'backoff': 0.5},
+    },
+}
+
+RAW_STR = """{
+    "host": "localhost", "port": 8080, "workers": 4, "tags": ["a", "b", "c"],
+    "database": {
+        "url": "postgres://localhost/db", "pool_size": 10,
+        "retry": {"attempts": 3, "backoff": 0.5}
+    }
+}"""
+
+
+def load_uncached(raw_obj):
+    inst = Config()
+    inst._set_data(Factory().load(raw_obj, Config._dataclass))
+    return inst
+
+
+def bench(label: str, func, arg, number: int):
+    best = min(repeat(lambda: func(arg), number=number, repeat=5))
+    print(f'{label:<30} {number / best:10.0f} loads/s')
+
+
+def main(number: int = 10_000):
+    bench('from_obj, new Factory', load_uncached, RAW_OBJ, number)
+    bench('from_obj, cached loader', Config.from_obj, RAW_OBJ, number)
+    bench('from_str, cached loader', Config.from_str, RAW_STR, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Memory retained by loaded config (tracemalloc) and iteration speed
+of large `List[int]` / `List[float]` fields loaded as lists
+and with `numeric_arrays` modes.
+
+    PYTHONPATH=. python benchmarks/bench_numeric_arrays.py
+"""
+
+import json
+import tracemalloc
+
+from typing import List
+from timeit import repeat
+
+from helloconfig import JsonConfig
+
+
+class ListConfig(JsonConfig):
+    allowlist: List[int]
+    weights: List[float]
+
+
+class ArrayConfig(JsonConfig):
+    numeric_arrays = 'array'
+
+    allowlist: List[int]
+    weights: List[float]
+
+
+class NumpyConfig(JsonConfig):
+    numeric_arrays = 'numpy'
+
+    allowlist: List[int]
+    weights: List[float]
+
+
+def measure(label: str, config_cls, data: str):
+    tracemalloc.start()
+    config = config_cls.from_str(data)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    iterate = min(repeat(lambda: sum(config.weights), number=5, repeat=3)) / 5
+    lookup = min(repeat(lambda: 123_456 in config.allowlist, number=5, repeat=3)) / 5
+    print(f'{label:<8} {type(config.allowlist).__name__:<16} '
+          f'{size / (1 << 20):7.1f} MB  sum {iterate * 1000:7.2f} ms  '
+          f'`in` {lookup * 1000:7.2f} ms')
+
+
+def main(count: int = 500_000):
+    data = json.dumps({
+        'allowlist': list(range(1_000_000, 1_000_000 + count)),
+        'weights': [n / 7 for n in range(count)],
+    })
+
+    measure('list', ListConfig, data)
+    measure('array', ArrayConfig, data)
+    measure('numpy', NumpyConfig, data)
+
+
+if __name__ == '__main__':
+    main()
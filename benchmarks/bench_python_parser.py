@@ -0,0 +1,145 @@
+"""
+Parse throughput of PythonParser (stdlib ast) compared to
+libcst concrete syntax tree, which is used only for rewriting files.
+
+    PYTHONPATH=. python benchmarks/bench_python_parser.py [--full]
+
+libcst takes minutes on 10 MB file, so it's measured there only with --full.
+"""
+
+import sys
+
+from time import perf_counter
+
+import libcst
+
+from helloconfig.parsers import PythonParser
+from helloconfig.immutable import ImmutableDict, ImmutableList, ImmutableSet
+
+
+LIBCST_SIZE_LIMIT = 1 << 20
+
+SIZES = {
+    '1 KB': 1 << 10,
+    '100 KB': 100 << 10,
+    '10 MB': 10 << 20,
+}
+
+CHUNK = '''
+class section_{n}:
+    host_{n} = 'host-{n}.example.com'
+    port_{n} = {n}
+    ratio_{n} = 0.{n}
+    tags_{n} = ['a', 'b', 'c', {n}]
+    limits_{n} = {{'rps': {n}, 'burst': 2}}
+'''
+
+
+_literal_expr_types = (
+    libcst.Integer,
+    libcst.Float,
+    libcst.SimpleString
+)
+
+
+def _get_dict_elt(expr: 'libcst.StarredDictElement | libcst.DictElement'):
+    if isinstance(expr, libcst.StarredDictElement):
+        raise ValueError('Starred elements are not supported')
+    if not isinstance(expr.key, _literal_expr_types):
+        raise ValueError('Dictionary key must be a literal')
+    return (_get_expr_value(expr.key), _get_expr_value(expr.value))
+
+
+def _get_seq_elt(expr: libcst.BaseElement):
+    if isinstance(expr, libcst.StarredElement):
+        raise ValueError('Starred elements are not supported')
+    return _get_expr_value(expr.value)
+
+
+def _get_expr_value(expr: libcst.BaseExpression):
+    if isinstance(expr, _literal_expr_types):
+        return expr.evaluated_value
+
+    if isinstance(expr, libcst.List):
+        return ImmutableList([_get_seq_elt(item) for item in expr.elements])
+
+    if isinstance(expr, libcst.Set):
+        return ImmutableSet({_get_seq_elt(item) for item in expr.elements})
+
+    if isinstance(expr, libcst.Dict):
+        return ImmutableDict([
+            _get_dict_elt(item) for item in expr.elements  # type: ignore
+        ])
+
+    if isinstance(expr, libcst.Tuple):
+        return tuple(_get_seq_elt(item) for item in expr.elements)
+
+    raise ValueError(f'Unsupported expression type ({expr!r})')
+
+
+class CstFieldLoader(libcst.CSTVisitor):
+    """Former libcst based loader of PythonParser, kept for comparison"""
+
+    def __init__(self) -> None:
+        self.fields = {}
+        self.stack = [self.fields]
+
+    @property
+    def current_ns(self):
+        return self.stack[-1]
+
+    def visit_Assign(self, node: libcst.Assign):
+        for assign_target in node.targets:
+            target = assign_target.target
+            if not isinstance(target, libcst.Name):
+                raise ValueError('Multiple assign is '
+                                 'not supported in config files')
+            self.current_ns[target.value] = _get_expr_value(node.value)
+
+    def visit_ClassDef(self, node: libcst.ClassDef):
+        namespace = {}
+        self.current_ns[node.name.value] = namespace
+        self.stack.append(namespace)
+
+    def leave_ClassDef(self, node: libcst.ClassDef):
+        self.stack.pop()
+
+
+def make_config(size: int) -> str:
+    chunks = []
+    total = n = 0
+    while total < size:
+        chunk = CHUNK.format(n=n)
+        chunks.append(chunk)
+        total += len(chunk)
+        n += 1
+    return ''.join(chunks)
+
+
+def parse_cst(data: str):
+    visitor = CstFieldLoader()
+    libcst.parse_module(data).visit(visitor)
+    return visitor.fields
+
+
+def bench(label: str, func, data: str):
+    number = max(1, (1 << 20) // len(data))
+    start = perf_counter()
+    for _ in range(number):
+        func(data)
+    elapsed = (perf_counter() - start) / number
+    print(f'{label:<20} {len(data) / elapsed / (1 << 20):8.2f} MB/s')
+
+
+def main(full: bool = False):
+    parser = PythonParser()
+    for label, size in SIZES.items():
+        data = make_config(size)
+        bench(f'{label} ast', parser.parse_string, data)
+        if full or size <= LIBCST_SIZE_LIMIT:
+            assert parser.parse_string(data) == parse_cst(data)
+            bench(f'{label} libcst', parse_cst, data)
+
+
+if __name__ == '__main__':
+    main(full='--full' in sys.argv)
@@ -0,0 +1,55 @@
+"""
+Worker startup: loading config from file, compared to reading
+snapshot published to shared memory by master process.
+
+    PYTHONPATH=. python benchmarks/bench_shared_config.py
+"""
+
+import os
+import json
+import tempfile
+
+from timeit import repeat
+
+from helloconfig import JsonConfig, SharedConfigPublisher, SharedConfigReader
+
+
+class Config(JsonConfig):
+    name: str
+
+    class routes:
+        table: dict
+
+
+def bench(label: str, func, number: int):
+    best = min(repeat(func, number=number, repeat=5))
+    print(f'{label:<24} {best / number * 1000:9.3f} ms')
+
+
+def main(count: int = 20_000, number: int = 10):
+    data = json.dumps({'name': 'app', 'routes': {'table': {
+        f'/api/{n}': {'upstream': f'backend-{n % 16}', 'weights': [n, 1]}
+        for n in range(count)
+    }}})
+
+    fd, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(fd, 'w') as file:
+        file.write(data)
+
+    try:
+        config = Config.from_file(path)
+        with SharedConfigPublisher(Config, size=len(data) * 2) as publisher:
+            publisher.publish(config)
+
+            def read_snapshot():
+                with SharedConfigReader(Config, publisher.name) as reader:
+                    return reader.get()
+
+            bench('from_file', lambda: Config.from_file(path), number)
+            bench('shared memory snapshot', read_snapshot, number)
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
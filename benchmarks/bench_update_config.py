@@ -0,0 +1,54 @@
+"""
+Adding one missing field to large config file: old full
+reparse and dump compared to appending only new field.
+
+    PYTHONPATH=. python benchmarks/bench_update_config.py
+"""
+
+import json
+
+from time import perf_counter
+
+from helloconfig.parsers import JsonParser, PythonParser
+
+
+def make_config(count: int) -> dict:
+    return {
+        f'ROUTE_{n}': {
+            'path': f'/api/v1/resource_{n}',
+            'upstream': f'http://backend-{n % 16}:8080',
+            'methods': ['GET', 'POST'],
+            'retries': n % 3,
+        }
+        for n in range(count)
+    }
+
+
+def json_reparse(config: str, fields: dict) -> str:
+    obj = json.loads(config)
+    obj.update(fields)
+    return json.dumps(obj, ensure_ascii=False, indent=4)
+
+
+def bench(label: str, func, config: str, fields: dict):
+    start = perf_counter()
+    func(config, fields)
+    elapsed = perf_counter() - start
+    print(f'{label:<24} {elapsed * 1000:9.2f} ms')
+
+
+def main(routes: int = 60000):
+    missing = {'NEW_FIELD': 'value'}
+
+    json_config = json.dumps(make_config(routes), indent=4)
+    print(f'json config size: {len(json_config) / (1 << 20):.1f} MB')
+    bench('json reparse', json_reparse, json_config, missing)
+    bench('json append', JsonParser().update_config, json_config, missing)
+
+    python_config = PythonParser().update_config('', make_config(routes))
+    print(f'python config size: {len(python_config) / (1 << 20):.1f} MB')
+    bench('python append', PythonParser().update_config, python_config, missing)
+
+
+if __name__ == '__main__':
+    main()
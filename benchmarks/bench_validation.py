@@ -0,0 +1,49 @@
+"""
+Validation of large list field: validator with python call per item,
+compared to batch `validate_range`.
+
+    PYTHONPATH=. python benchmarks/bench_validation.py
+"""
+
+from typing import List
+from timeit import repeat
+
+from helloconfig import JsonConfig, validate, validate_range
+
+
+class PlainConfig(JsonConfig):
+    weights: List[float]
+
+
+class PerItemConfig(JsonConfig):
+    weights: List[float]
+
+    @validate('weights')
+    def check_weights(value):
+        for item in value:
+            if not 0 <= item <= 1:
+                raise ValueError(f'Weight {item} out of range')
+        return value
+
+
+class BatchConfig(JsonConfig):
+    weights: List[float]
+
+    weights_range = validate_range('weights', min=0, max=1)
+
+
+def bench(label: str, config_cls, raw_obj: dict, number: int):
+    best = min(repeat(lambda: config_cls.from_obj(raw_obj), number=number, repeat=5))
+    print(f'{label:<24} {best / number * 1000:9.2f} ms')
+
+
+def main(count: int = 500_000, number: int = 5):
+    raw_obj = {'weights': [n / count for n in range(count)]}
+
+    bench('no validation', PlainConfig, raw_obj, number)
+    bench('per item validator', PerItemConfig, raw_obj, number)
+    bench('validate_range', BatchConfig, raw_obj, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+YamlParser load / dump speed with libyaml bindings
+compared to pure python PyYAML implementation.
+
+    PYTHONPATH=. python benchmarks/bench_yaml_parser.py
+"""
+
+from time import perf_counter
+
+from helloconfig.parsers import YamlParser
+from helloconfig.parsers.yaml import CSafeLoader
+
+
+def make_routes(count: int) -> dict:
+    return {
+        'routes': [
+            {
+                'path': f'/api/v1/resource_{n}',
+                'upstream': f'http://backend-{n % 16}:8080',
+                'timeout': 0.5 + n % 10,
+                'methods': ['GET', 'POST'],
+                'retries': n % 3,
+            }
+            for n in range(count)
+        ]
+    }
+
+
+def bench(label: str, func, arg, size: int):
+    start = perf_counter()
+    func(arg)
+    elapsed = perf_counter() - start
+    print(f'{label:<24} {elapsed * 1000:9.1f} ms  {size / elapsed / (1 << 20):6.2f} MB/s')
+
+
+def main(routes: int = 2000):
+    obj = make_routes(routes)
+    data = YamlParser(pure_python=True).update_config('', obj)
+    print(f'config size: {len(data) / 1024:.0f} KB')
+
+    modes = [('pure python', True)]
+    if CSafeLoader is not None:
+        modes.insert(0, ('libyaml', False))
+
+    for label, pure_python in modes:
+        parser = YamlParser(pure_python=pure_python)
+        bench(f'load {label}', parser.parse_string, data, len(data))
+        bench(f'dump {label}', lambda o: parser.update_config('', o), obj, len(data))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,18 @@
-from helloconfig import DotEnvConfig
-from dataclass_factory import validate
+from helloconfig import (
+    DotEnvConfig, validate, validate_pattern, validate_range
+)
 
 
 class Config(DotEnvConfig):
     host: str
+    port: int
+
+    @validate('host')
+    def strip_host(value):
+        return value.strip()
+
+    host_pattern = validate_pattern('host', pattern=r'[\w.-]+')
+    port_range = validate_range('port', min=1, max=65535)
+
+
+config = Config.from_file('.env')
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from .config_bases import (
     DotEnvConfig,
     PythonConfig,
@@ -8,9 +10,24 @@ from .config_bases import (
 
 from .exceptions import (
     ConfigError,
-    FieldsMissing
+    FieldsMissing,
+    ValidationError,
+)
+
+from .validation import (
+    validate,
+    validate_range,
+    validate_length,
+    validate_pattern,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    # imported on demand by `__getattr__`
+    from .cache import ConfigCache
+    from .layers import ConfigLayers
+    from .diff import ConfigSubscriptions
+    from .shared import SharedConfigPublisher, SharedConfigReader
+
 
 __all__ = (
     'DotEnvConfig',
@@ -18,6 +35,39 @@ __all__ = (
     'YamlConfig',
     'JsonConfig',
 
+    'ConfigCache',
+    'ConfigLayers',
+    'ConfigSubscriptions',
+    'SharedConfigPublisher',
+    'SharedConfigReader',
+
     'ConfigError',
-    'FieldsMissing'
+    'FieldsMissing',
+    'ValidationError',
+
+    'validate',
+    'validate_range',
+    'validate_length',
+    'validate_pattern',
 )
+
+
+def __getattr__(name: str):
+    # helpers using hashlib, pickle, etc. are imported on demand
+    if name == 'ConfigCache':
+        from .cache import ConfigCache
+        return ConfigCache
+
+    if name == 'ConfigLayers':
+        from .layers import ConfigLayers
+        return ConfigLayers
+
+    if name == 'ConfigSubscriptions':
+        from .diff import ConfigSubscriptions
+        return ConfigSubscriptions
+
+    if name in ('SharedConfigPublisher', 'SharedConfigReader'):
+        from . import shared
+        return getattr(shared, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,69 @@
+from typing import Any, Iterable, Iterator, NamedTuple, Optional, Tuple, Type
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+
+from helloconfig.parsers.base import AbstractParser
+
+
+class LoadResult(NamedTuple):
+    path: str
+    config: Any
+    error: Optional[Exception]
+
+
+def parse_file(parser_cls: Type[AbstractParser], path: str) -> Tuple[str, Any]:
+    """Runs in worker, returns file contents and raw object parsed from it"""
+
+    with open(path, encoding='utf-8') as file:
+        raw_config = file.read()
+    return raw_config, parser_cls().parse_string(raw_config)
+
+
+def _get_executor(mode: str, workers: Optional[int]) -> Executor:
+    if mode == 'process':
+        return ProcessPoolExecutor(workers)
+    if mode == 'thread':
+        return ThreadPoolExecutor(workers)
+    raise ValueError(f'Unknown mode {mode!r}, expected \'process\' or \'thread\'')
+
+
+def load_many(
+        config_cls: Any,
+        paths: Iterable[str],
+        workers: Optional[int] = None,
+        mode: str = 'process',
+) -> Iterator[LoadResult]:
+    executor = _get_executor(mode, workers)
+    parser_cls = config_cls._PARSER_CLS
+
+    futures: 'dict[Future, str]' = {}
+    try:
+        for path in paths:
+            futures[executor.submit(parse_file, parser_cls, path)] = path
+
+        for future in as_completed(futures):
+            path = futures.pop(future)
+            yield _get_result(config_cls, parser_cls, path, future)
+    finally:
+        # consumer may stop iterating early
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _get_result(config_cls: Any, parser_cls: Type[AbstractParser],
+                path: str, future: Future) -> LoadResult:
+    parser = parser_cls()
+
+    try:
+        try:
+            raw_config, raw_obj = future.result()
+        except FileNotFoundError:
+            config_cls._create_default_file(path, parser)
+
+        config = config_cls._from_parsed_file(path, parser, raw_config, raw_obj)
+    except Exception as exc:
+        return LoadResult(path, None, exc)
+
+    return LoadResult(path, config, None)
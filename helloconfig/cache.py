@@ -0,0 +1,105 @@
+import os
+import pickle
+import hashlib
+
+from typing import Any, Callable, Tuple
+
+
+# bump when layout of cache entries changes
+CACHE_FORMAT = 1
+
+
+class ConfigCache:
+    """
+    On-disk cache of parsed config files, something like .pyc for configs.
+
+    Entry keeps raw object returned by parser and is looked up by absolute
+    file path, config class and its schema. Entry is served only if file
+    mtime, size and content hash are the same, so stale data never returned.
+
+    Entries are stored with pickle, so cache directory must be trusted.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}({self.directory!r}, '
+                f'hits={self.hits}, misses={self.misses}, stale={self.stale})')
+
+    def _get_entry_path(self, config_cls: type, path: str) -> str:
+        parser_cls = config_cls._PARSER_CLS  # type: ignore
+        key = '\0'.join([
+            str(CACHE_FORMAT),
+            os.path.abspath(path),
+            f'{config_cls.__module__}.{config_cls.__qualname__}',
+            f'{parser_cls.__module__}.{parser_cls.__qualname__}',
+            config_cls._schema.key,  # type: ignore
+        ])
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, name + '.cache')
+
+    def _get_digest(self, data: str) -> bytes:
+        return hashlib.blake2b(data.encode('utf-8')).digest()
+
+    def load(self, config_cls: type, path: str, stat: os.stat_result,
+             data: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Returns raw object for file contents, calling `parse`
+        and storing its result if there is no valid entry
+        """
+
+        entry_path = self._get_entry_path(config_cls, path)
+        digest = self._get_digest(data)
+
+        found, raw_obj = self._get(entry_path, stat, digest)
+        if found:
+            self.hits += 1
+            return raw_obj
+
+        self.misses += 1
+        raw_obj = parse(data)
+        self._put(entry_path, stat, digest, raw_obj)
+        return raw_obj
+
+    def _get(self, entry_path: str, stat: os.stat_result,
+             digest: bytes) -> Tuple[bool, Any]:
+        try:
+            with open(entry_path, 'rb') as file:
+                mtime, size, entry_digest, raw_obj = pickle.load(file)
+        except FileNotFoundError:
+            return False, None
+        except Exception:
+            # broken or incompatible entry, it will be overwritten
+            self.stale += 1
+            return False, None
+
+        if (mtime != stat.st_mtime_ns
+                or size != stat.st_size
+                or entry_digest != digest):
+            self.stale += 1
+            return False, None
+
+        return True, raw_obj
+
+    def _put(self, entry_path: str, stat: os.stat_result,
+             digest: bytes, raw_obj: Any) -> None:
+        entry = (stat.st_mtime_ns, stat.st_size, digest, raw_obj)
+        tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+
+        try:
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+            # other processes see either old entry or new one
+            os.replace(tmp_path, entry_path)
+        except OSError:  # pragma: no cover
+            # cache is only optimization, config is loaded anyway
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -0,0 +1,142 @@
+"""
+Generates python source of loader specialized for dataclass tree of one
+config class: fields are looked up by key, primitive values are checked
+and converted inline, sections are created with `object.__new__` and their
+`__dict__` is set at once. Other types are parsed by dataclass_factory.
+"""
+
+import linecache
+
+from typing import Any, Callable, Optional
+from dataclasses import MISSING
+
+from helloconfig.schema import ConfigSchema
+from helloconfig.immutable import ImmutableDict, ImmutableList
+
+
+_missing = object()
+
+# types converted by calling them, same as dataclass_factory does
+_called_types = (int, float, bool)
+# types checked with isinstance, same as dataclass_factory does
+_checked_types = (str, bytes)
+# parser values are used as is for these annotations
+_passthrough_types = {dict: ImmutableDict, list: ImmutableList}
+
+
+class LoaderCompiler:
+    def __init__(self, factory: Any) -> None:
+        self.factory = factory
+        self.namespace: 'dict[str, Any]' = {
+            '_missing': _missing,
+            '_new': object.__new__,
+            '_setattr': object.__setattr__,
+        }
+        self.functions: 'list[str]' = []
+        self.counter = 0
+
+    def add_object(self, prefix: str, obj: Any) -> str:
+        self.counter += 1
+        name = f'{prefix}_{self.counter}'
+        self.namespace[name] = obj
+        return name
+
+    def compile(self, schema: ConfigSchema, data_cls: 'Optional[type]' = None,
+                filename: str = '<helloconfig loader>') -> 'Callable[[Any], Any]':
+        """
+        Loader function for schema. If `data_cls` is specified, it's created
+        instead of schema dataclass and sections are kept raw (lazy mode)
+        """
+
+        entry_name = self.compile_section(schema, data_cls or schema.data_cls, data_cls is not None)
+        source = '\n\n'.join(self.functions) + '\n'
+
+        # so tracebacks show generated code
+        linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+        exec(compile(source, filename, 'exec'), self.namespace)
+        return self.namespace[entry_name]
+
+    def compile_section(self, schema: ConfigSchema, data_cls: type, keep_sections: bool) -> str:
+        func_name = self.add_object('load', None)
+        cls_name = self.add_object('cls', data_cls)
+        validators = {}
+        for validator in schema.validators:
+            for field_name in validator.fields:
+                validators.setdefault((field_name, validator.pre), []).append(validator.func)
+
+        lines = [
+            f'def {func_name}(data):',
+            '    if not isinstance(data, dict):',
+            f'        raise ValueError("Expected mapping for {data_cls.__qualname__}, "',
+            '                         f"got {type(data).__name__}")',
+            '    get = data.get',
+        ]
+
+        for name, field in schema.fields.items():
+            var = f'f_{name}'
+            lines.append(f'    value = get({name!r}, _missing)')
+            lines.append('    if value is _missing:')
+            if field.field.default_factory is not MISSING:
+                factory_name = self.add_object('default_factory', field.field.default_factory)
+                lines.append(f'        {var} = {factory_name}()')
+            elif field.field.default is not MISSING and not field.required:
+                default_name = self.add_object('default', field.field.default)
+                lines.append(f'        {var} = {default_name}')
+            else:
+                lines.append(f'        raise TypeError("{data_cls.__qualname__} '
+                             f'missing required field {name!r}")')
+            lines.append('    else:')
+
+            for func in validators.get((name, True), ()):
+                lines.append(f'        value = {self.add_object("pre_validator", func)}(value)')
+            lines.extend(
+                '        ' + line
+                for line in self.get_parse_lines(field.type, field.schema, keep_sections)
+            )
+            for func in validators.get((name, False), ()):
+                lines.append(f'        value = {self.add_object("validator", func)}(value)')
+            lines.append(f'        {var} = value')
+
+        items = ', '.join(f'{name!r}: f_{name}' for name in schema.fields)
+        lines.extend([
+            f'    obj = _new({cls_name})',
+            f"    _setattr(obj, '__dict__', {{{items}}})",
+            '    return obj',
+        ])
+
+        self.functions.append('\n'.join(lines))
+        return func_name
+
+    def get_parse_lines(self, field_type: Any, section: 'Optional[ConfigSchema]',
+                        keep_sections: bool) -> 'list[str]':
+        if section is not None:
+            if keep_sections:
+                return []
+            section_func = self.compile_section(section, section.data_cls, False)
+            return [f'value = {section_func}(value)']
+
+        if field_type is Any:
+            return []
+
+        if field_type in _called_types:
+            type_name = field_type.__name__
+            return [f'if type(value) is not {type_name}:',
+                    f'    value = {type_name}(value)']
+
+        if field_type in _checked_types:
+            type_name = field_type.__name__
+            return [f'if not isinstance(value, {type_name}):',
+                    f'    raise ValueError("data type is not {field_type!r}")']
+
+        parser_name = self.add_object('parser', self.factory.parser(field_type))
+        if field_type in _passthrough_types:
+            immutable_name = self.add_object('immutable', _passthrough_types[field_type])
+            return [f'if type(value) is not {immutable_name}:',
+                    f'    value = {parser_name}(value)']
+        return [f'value = {parser_name}(value)']
+
+
+def compile_loader(schema: ConfigSchema, factory: Any,
+                   data_cls: 'Optional[type]' = None) -> 'Callable[[Any], Any]':
+    filename = f'<helloconfig loader {schema.data_cls.__qualname__}>'
+    return LoaderCompiler(factory).compile(schema, data_cls, filename)
@@ -1,29 +1,219 @@
-from typing import Any, Type
-from inspect import isclass
-from dataclasses import is_dataclass, dataclass, fields, MISSING
+import os
 
-from dataclass_factory import Factory
+from types import MemberDescriptorType
+from functools import partial
+from typing import (
+    TYPE_CHECKING, Any, Callable, ClassVar, Iterable, Iterator, NoReturn, Optional, Type
+)
+from inspect import isclass
+from dataclasses import (
+    is_dataclass, dataclass, fields, field as dataclass_field, make_dataclass, MISSING
+)
 
 from helloconfig.exceptions import FieldsMissing
-from helloconfig.parsers import (
-    AbstractParser,
-    PythonParser,
-    JsonParser,
-    YamlParser,
-    EnvParser
+from helloconfig.fingerprint import (
+    get_fingerprint, get_fingerprint_hash, section_eq, section_hash
 )
+from helloconfig.schema import ConfigSchema, get_field_paths
+from helloconfig.validation import FieldValidator
+from helloconfig.parsers.base import AbstractParser
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor
+
+    from helloconfig.bulk import LoadResult
+    from helloconfig.cache import ConfigCache
+    from helloconfig.layers import LayerSpec
+    from helloconfig.watcher import ConfigWatcher
+
+
+class LazyParserClass:
+    """
+    Resolves parser class on first access, so parser backend
+    is imported only when config class reads or writes something
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.parser_cls = None
+
+    def __get__(self, instance, owner) -> Type[AbstractParser]:
+        if self.parser_cls is None:
+            from helloconfig import parsers
+            self.parser_cls = getattr(parsers, self.name)
+        return self.parser_cls
+
+
+def get_loader_schemas(
+        schema: ConfigSchema,
+        numeric_arrays: 'Optional[str]' = None,
+) -> 'dict[Any, Any]':
+    """
+    dataclass_factory copies every dict and list value while loading.
+    Values produced by parsers are already immutable, so for fields
+    annotated with plain `dict` / `list` they are used as is.
+
+    With `numeric_arrays` mode, `List[int]` and `List[float]` fields
+    are loaded as read-only arrays.
+    """
+
+    from dataclass_factory import Schema
+    from dataclass_factory.parsers import create_parser
+
+    from helloconfig.immutable import (
+        ImmutableDict, ImmutableList, get_numeric_array, get_numpy_array
+    )
+
+    from helloconfig.validation import get_validator_schema
+
+    array_parsers = {'array': get_numeric_array, 'numpy': get_numpy_array}
+    if numeric_arrays is not None and numeric_arrays not in array_parsers:
+        raise ValueError(f'Unknown numeric_arrays mode {numeric_arrays!r}, '
+                          'expected \'array\' or \'numpy\'')
+
+    def get_parser(immutable_cls: type):
+        def get_parser_impl(class_, factory, debug_path: bool):
+            parser = create_parser(factory, Schema(), debug_path, class_)
+
+            def parse(data):
+                if type(data) is immutable_cls:
+                    return data
+                return parser(data)
+            return parse
+        return get_parser_impl
+
+    schemas = {
+        dict: Schema(get_parser=get_parser(ImmutableDict)),
+        list: Schema(get_parser=get_parser(ImmutableList)),
+    }
+
+    # parametrized types would fall back to schema of their origin,
+    # but their items must be parsed, so they get default schema
+    for field_type in schema.iter_types():
+        origin = getattr(field_type, '__origin__', None)
+        if origin not in schemas:
+            continue
+
+        item_types = field_type.__args__
+        if numeric_arrays and origin is list and item_types in ((int,), (float,)):
+            schemas[field_type] = Schema(
+                parser=partial(array_parsers[numeric_arrays], item_types[0])
+            )
+        else:
+            schemas[field_type] = Schema()
+
+    # validators of every section are run by its parser
+    for section_schema in schema.iter_schemas():
+        section_names = tuple(
+            name for name, field in section_schema.fields.items() if field.schema is not None
+        )
+        if not section_schema.validators and not section_names:
+            continue
+
+        if section_schema.validators:
+            section_loader_schema = get_validator_schema(section_schema.validators)
+        else:
+            section_loader_schema = Schema()
+        if section_names:
+            section_loader_schema.pre_parse = partial(
+                check_sections, section_schema.data_cls, section_names
+            )
+        schemas[section_schema.data_cls] = section_loader_schema
+
+    return schemas
+
+
+def check_sections(data_cls: type, names: 'tuple[str, ...]', data: Any) -> Any:
+    """
+    Nested classes are defaults of their own fields, so dataclass_factory
+    would use class itself for missing section, but section is required
+    """
+
+    if isinstance(data, dict):
+        for name in names:
+            if name not in data:
+                raise TypeError(f'{data_cls.__qualname__} missing required field {name!r}')
+    return data
+
+
+def create_loader(
+        schema: ConfigSchema,
+        data_cls: 'Optional[type]' = None,
+        numeric_arrays: 'Optional[str]' = None,
+        compiled: bool = False,
+):
+    from dataclass_factory import Factory
+
+    schemas = get_loader_schemas(schema, numeric_arrays)
+    if data_cls is not None and schema.data_cls in schemas:
+        # lazy copy of dataclass has same top level validators
+        schemas[data_cls] = schemas[schema.data_cls]
 
+    factory = Factory(schemas=schemas)
+    if compiled:
+        from helloconfig.compiler import compile_loader
+        return compile_loader(schema, factory, data_cls)
+    return factory.parser(data_cls or schema.data_cls)
 
-def get_required_fields(data_cls):
-    result = {}
+
+def make_lazy_dataclass(data_cls: type, schema: ConfigSchema) -> type:
+    """
+    Copy of config dataclass, where sections are annotated with `Any`,
+    so loader keeps them as is, without conversion and validation
+    """
+
+    lazy_fields = []
     for field in fields(data_cls):
-        if field.default is MISSING and field.default_factory is MISSING:
-            result[field.name] = field.type
-    return result
+        field_type = Any if schema.fields[field.name].schema else field.type
+        lazy_fields.append((field.name, field_type, dataclass_field(
+            default=field.default, default_factory=field.default_factory,  # type: ignore
+        )))
+    return make_dataclass(f'Lazy{data_cls.__name__}', lazy_fields, frozen=True)
 
 
-def get_all_fields(data_cls):
-    return {f.name: f for f in fields(data_cls)}
+class LazySection:
+    """
+    Section field of config class with `lazy_sections` enabled. Raw section
+    is kept in slot until first access, then it's loaded and cached in slot.
+    Concurrent first access may load section twice, any result is the same.
+    """
+
+    def __init__(self, name: str, slot: Any, schema: ConfigSchema,
+                 config_cls: 'Type[ConfigBase]') -> None:
+        self.name = name
+        self.slot = slot
+        self.schema = schema
+        self.config_cls = config_cls
+        self.loader: 'Optional[Callable[[Any], Any]]' = None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = self.slot.__get__(instance, owner)
+        if isinstance(value, self.schema.data_cls):
+            return value
+
+        if self.loader is None:
+            self.loader = create_loader(
+                self.schema,
+                numeric_arrays=self.config_cls.numeric_arrays,
+                compiled=self.config_cls.compiled_loader,
+            )
+        value = self.loader(value)
+        if self.config_cls.interning:
+            from helloconfig.interning import default_interner
+            value = default_interner.intern(value)
+        self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance, value):
+        # used only while config object is filled, see `ConfigBase._set_data`
+        self.slot.__set__(instance, value)
+
+
+# what class attributes of fields are, slots or lazy sections
+_field_descriptor_types = (MemberDescriptorType, LazySection)
 
 
 def try_delattr(obj, name):
@@ -34,18 +224,10 @@ def try_delattr(obj, name):
 
 
 class ConfigBaseMeta(type):
-    # TODO
-    # нужны валидаторы полей. каким образом:
-    # делается функция обертка для DF.validate, возвращающая
-    # объект который ни с чем нельзя перепутать. метакласс ищет такие
-    # обертки и составляет из них схему. схема привязывается к
-    # конкретному классу рядом с датаклассом.
-    # все внутренние поля, соответственно, тоже должны быть
-    # подклассами ConfigBase. всё, во время парсинга данных
-    # подкладываем в фактори нужную схему и __вроде__ будет работать
-
     @staticmethod
-    def wrap_nested_classes(klass: type):
+    def wrap_nested_classes(klass: type, wrapped: 'Optional[list[type]]' = None):
+        """Makes nested classes frozen dataclasses, adds them to `wrapped`"""
+
         annotations = getattr(klass, '__annotations__', {})
         setattr(klass, '__annotations__', annotations)
 
@@ -62,7 +244,14 @@ class ConfigBaseMeta(type):
                 else:
                     nested_cls = f_value
 
-                ConfigBaseMeta.wrap_nested_classes(nested_cls)
+                if is_dataclass(nested_cls):
+                    # fields with default factory have no class attribute,
+                    # so they would become required in new dataclass
+                    for field in fields(nested_cls):
+                        if field.default_factory is not MISSING:
+                            setattr(nested_cls, field.name, field)
+
+                ConfigBaseMeta.wrap_nested_classes(nested_cls, wrapped)
 
                 # dataclass() will not overwrite existing init function, so delete it
                 # (users should not define any functions in nested config fields,
@@ -70,50 +259,253 @@ class ConfigBaseMeta(type):
                 #  dataclass constructor with old args (we updated them above))
                 try_delattr(nested_cls, '__init__')
                 annotations[f_name] = dataclass(frozen=True)(nested_cls)
+                if wrapped is not None:
+                    wrapped.append(nested_cls)
+
+    @staticmethod
+    def get_inherited_slots(bases: 'tuple[type, ...]'):
+        return {
+            slot
+            for base in bases
+            for klass in base.__mro__
+            for slot in klass.__dict__.get('__slots__', ())
+        }
 
     def __new__(cls, cls_name, bases, namespace: 'dict[str, Any]'):
         if not bases or bases[0] is ConfigBase:
             return super().__new__(cls, cls_name, bases, namespace)
 
-        klass = super().__new__(cls, cls_name, bases, namespace)
-
         dc_klass = super().__new__(cls, cls_name, (), namespace)
 
-        ConfigBaseMeta.wrap_nested_classes(dc_klass)
+        nested_classes: 'list[type]' = []
+        ConfigBaseMeta.wrap_nested_classes(dc_klass, nested_classes)
+
+        data_cls: Any = dataclass(frozen=True)(dc_klass)
+        field_names = tuple(f.name for f in fields(data_cls))
+
+        # every field value is stored in its own slot, so reading
+        # config attribute is single lookup of member descriptor.
+        # field defaults are kept by dataclass, slots can't coexist with them
+        schema = ConfigSchema.from_dataclass(data_cls)
+        lazy_sections = namespace.get('lazy_sections', bases[0].lazy_sections)
+
+        # in lazy mode sections are stored in private slots behind `LazySection`
+        slot_names = {
+            name: f'_lazy_{name}' if lazy_sections and schema.fields[name].schema else name
+            for name in field_names
+        }
+
+        inherited_slots = ConfigBaseMeta.get_inherited_slots(bases)
+        # validators are kept by dataclass, where schema finds them
+        namespace = {
+            name: value for name, value in namespace.items()
+            if name not in field_names and not isinstance(value, FieldValidator)
+        }
+        namespace['__slots__'] = tuple(
+            slot for slot in slot_names.values() if slot not in inherited_slots
+        )
+
+        # sections are compared and hashed by fingerprints, computed once.
+        # only frozen dataclasses made here are patched, dataclasses
+        # defined elsewhere and used as field types are kept as is
+        for section_cls in (data_cls, *nested_classes):
+            section_cls.__eq__ = section_eq  # type: ignore
+            section_cls.__hash__ = section_hash  # type: ignore
 
-        klass._dataclass = dataclass(frozen=True)(dc_klass)  # type: ignore
+        klass = super().__new__(cls, cls_name, bases, namespace)
+        klass._dataclass = data_cls  # type: ignore
+        klass._field_names = field_names  # type: ignore
+        klass._field_defaults = {  # type: ignore
+            f.name: f.default for f in fields(data_cls) if f.default is not MISSING
+        }
+        klass._schema = schema  # type: ignore
+
+        if lazy_sections:
+            klass._lazy_dataclass = make_lazy_dataclass(data_cls, schema)  # type: ignore
+            for name, slot in slot_names.items():
+                if slot != name:
+                    section = LazySection(
+                        name, getattr(klass, slot),
+                        schema.fields[name].schema, klass,  # type: ignore
+                    )
+                    setattr(klass, name, section)
+
+        if klass.env_prefix is not None:  # type: ignore
+            klass._env_index = schema.get_env_index(klass.env_prefix)  # type: ignore
+
+        if klass.compiled_loader:  # type: ignore
+            klass._get_loader()  # type: ignore
 
         return klass
 
+    def __getattribute__(cls, name: str) -> Any:
+        # slots of fields replace class attributes, so defaults declared
+        # in class body are returned instead of slot descriptors.
+        # reading attributes of config objects doesn't go through here
+        value = super().__getattribute__(name)
+        if isinstance(value, _field_descriptor_types) and \
+                name in super().__getattribute__('_field_names'):
+            try:
+                return super().__getattribute__('_field_defaults')[name]
+            except KeyError:
+                raise AttributeError(f'type object {cls.__name__!r} '
+                                     f'has no attribute {name!r}') from None
+        return value
+
 
 class ConfigBase(metaclass=ConfigBaseMeta):
-    _PARSER_CLS: Type[AbstractParser]
+    __slots__ = ('_data_object',)
+
+    _PARSER_CLS: 'ClassVar[Type[AbstractParser] | LazyParserClass]'
 
     _dataclass: type
+    _lazy_dataclass: 'Optional[type]' = None
+    _schema: ConfigSchema
+    _field_names: 'tuple[str, ...]' = ()
+    _field_defaults: 'dict[str, Any]' = {}
     _data_object: object
 
-    def __getattribute__(self, __name: str):
-        try:
-            data_obj = object.__getattribute__(self, '_data_object')
-            return getattr(data_obj, __name)
-        except AttributeError:
-            pass
+    # if enabled, nested sections are loaded and validated on first access,
+    # presence of required fields is checked on load anyway
+    lazy_sections = False
+
+    # 'array' to load `List[int]` and `List[float]` fields as read-only
+    # arrays of machine values, 'numpy' for read-only numpy arrays
+    # (falls back to arrays, if numpy is not installed)
+    numeric_arrays: 'Optional[str]' = None
+
+    # if enabled, loader specialized for this class is generated when
+    # class is created, instead of generic dataclass_factory parser
+    compiled_loader = False
+
+    # if set (empty string too), values from environment variables named
+    # `<env_prefix>FIELD` and `<env_prefix>SECTION__FIELD` override values
+    # from config. Index of variable names is built when class is created
+    env_prefix: 'Optional[str]' = None
+    _env_index: 'Optional[dict[str, Any]]' = None
 
-        return object.__getattribute__(self, __name)
+    # if enabled, sections, containers and strings equal to ones of already
+    # loaded configs (of any class with interning) are replaced with them,
+    # so thousands of similar configs store shared parts once
+    interning = False
 
     def __setattr__(self, __name: str, __value: Any) -> None:
         raise TypeError('Config object is immutable.')
 
+    # config objects are immutable, so copies are the objects themselves
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        Digest of config contents, same for equal configs in every process.
+        Computed on first use and cached, as fingerprints of sections,
+        `helloconfig.fingerprint.get_fingerprint(config.section)`.
+        """
+        return get_fingerprint(self)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        # not `fingerprint` property, config may have field with same name
+        return self is other or get_fingerprint(self) == get_fingerprint(other)
+
+    def __hash__(self) -> int:
+        return get_fingerprint_hash(get_fingerprint(self))
+
     def _set_data(self, value):
+        for name in self._field_names:
+            object.__setattr__(self, name, getattr(value, name))
         return super().__setattr__('_data_object', value)
 
+    @classmethod
+    def _get_loader(cls) -> 'Callable[[Any], Any]':
+        # looking only in class own namespace, subclasses have another dataclass
+        try:
+            return cls.__dict__['_loader']
+        except KeyError:
+            pass
+
+        loader = cls._loader = create_loader(
+            cls._schema, cls._lazy_dataclass, cls.numeric_arrays, cls.compiled_loader
+        )
+        return loader
+
+    @classmethod
+    def _load_data(cls, raw_obj: 'dict[str, Any]') -> Any:
+        data = cls._get_loader()(raw_obj)
+        if cls.interning:
+            from helloconfig.interning import default_interner
+            data = default_interner.intern(data)
+        return data
+
+    @classmethod
+    def get_schema(cls) -> ConfigSchema:
+        """Fields of config class, including nested sections"""
+        return cls._schema
+
+    @classmethod
+    def _apply_overlay(cls, raw_obj: 'dict[str, Any]'):
+        if cls._env_index is None:
+            return raw_obj
+
+        from helloconfig.overlay import apply_env_overlay
+
+        return apply_env_overlay(raw_obj, cls._env_index, os.environ)
+
+    @classmethod
+    def _get_missing_fields(cls, raw_obj: 'dict[str, Any]') -> 'dict[str, Any]':
+        # fields set with environment variables are not missing
+        return cls._schema.get_missing_fields(cls._apply_overlay(raw_obj))
+
     @classmethod
     def from_obj(cls, raw_obj: 'dict[str, Any]'):
-        obj = Factory().load(raw_obj, cls._dataclass)
+        raw_obj = cls._apply_overlay(raw_obj)  # type: ignore
+
+        if cls.lazy_sections and cls._schema.get_missing_fields(raw_obj):
+            # sections are not loaded yet, so their fields are checked here,
+            # error is the same as loader raises for missing fields
+            raise TypeError('Some fields are missing from config')
+
+        obj = cls._load_data(raw_obj)
         inst = cls()
         inst._set_data(obj)
         return inst
 
+    def prepare_for_fork(self):
+        """
+        Call in master process right before forking workers. Lazy sections
+        and loader are loaded here, then all objects of process are moved
+        to permanent generation of garbage collector (`gc.freeze`), so
+        collections in workers never write to memory pages of config and
+        copy-on-write doesn't duplicate them in every worker.
+
+        Reference counts of values read by workers are still updated,
+        so pages with those values are copied anyway.
+        """
+
+        import gc
+
+        # lazy sections, loaded in every worker separately, would be private
+        for name in self._field_names:
+            getattr(self, name)
+        type(self)._get_loader()
+
+        gc.collect()
+        gc.freeze()
+        return self
+
+    def diff(self, other) -> 'list[str]':
+        """Dotted paths of fields, which differ in other config of this class"""
+
+        from helloconfig.diff import diff_configs
+
+        return diff_configs(self, other)
+
     @classmethod
     def from_str(cls, data: str):
         parser = cls._PARSER_CLS()
@@ -122,45 +514,59 @@ class ConfigBase(metaclass=ConfigBaseMeta):
         try:
             return cls.from_obj(raw_obj)
         except TypeError:
-            rq_fields = get_required_fields(cls._dataclass)
-            diff = set(rq_fields).difference(raw_obj.keys())
-            if not diff:
+            missing = cls._get_missing_fields(raw_obj)
+            if not missing:
                 raise
+            diff = set(get_field_paths(missing))
             raise FieldsMissing('Some fields are missing from config '
                                f'({diff!r})') from None
 
     @classmethod
-    def from_file(cls, path: str):
+    def from_file(cls, path: str, cache: 'Optional[ConfigCache]' = None):
         parser = cls._PARSER_CLS()
 
         try:
             with open(path, encoding='utf-8') as file:
+                stat = os.fstat(file.fileno())
                 raw_config = file.read()
-                raw_obj = parser.parse_string(raw_config)
         except FileNotFoundError:
-            rq_fields = get_all_fields(cls._dataclass)
-            default_config = parser.update_config(
-                '', {name: field for name, field in rq_fields.items()}
-            )
+            cls._create_default_file(path, parser)
 
-            with open(path, 'w', encoding='utf-8') as file:
-                file.write(default_config)
+        if cache is None:
+            raw_obj = parser.parse_string(raw_config)
+        else:
+            raw_obj = cache.load(cls, path, stat, raw_config, parser.parse_string)
 
-            raise FieldsMissing(f'Config file at {path!r} not found. '
-                                 'New file with empty values created.') from None
+        return cls._from_parsed_file(path, parser, raw_config, raw_obj)
 
+    @classmethod
+    def _create_default_file(cls, path: str, parser: AbstractParser) -> NoReturn:
+        default_config = parser.update_config('', dict(cls._schema.dataclass_fields))
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(default_config)
+
+        raise FieldsMissing(f'Config file at {path!r} not found. '
+                             'New file with empty values created.') from None
+
+    @classmethod
+    def _from_parsed_file(cls, path: str, parser: AbstractParser,
+                          raw_config: str, raw_obj: 'dict[str, Any]'):
         try:
             return cls.from_obj(raw_obj)
         except TypeError:
-            rq_fields = get_required_fields(cls._dataclass)
-            diff = set(rq_fields).difference(raw_obj.keys())
-
-            if not diff:
+            missing = cls._get_missing_fields(raw_obj)
+            if not missing:
                 raise
+            diff = set(get_field_paths(missing))
+
+            # only missing fields are passed, parser adds
+            # them to existing contents without parsing it again
+            updated_config = parser.update_config(raw_config, missing)
+            if updated_config == raw_config:
+                raise FieldsMissing('Some fields are missing from config, '
+                                   f'file was not updated. (missing: {diff!r})') from None
 
-            for field_name in diff:
-                raw_obj[field_name] = rq_fields[field_name]()
-            updated_config = parser.update_config(raw_config, raw_obj)
             with open(path, 'w', encoding='utf-8') as file:
                 file.write(updated_config)
 
@@ -168,6 +574,86 @@ class ConfigBase(metaclass=ConfigBaseMeta):
                                 'File was updated with empty values, '
                                f'check them out. (missing: {diff!r})') from None
 
+    @classmethod
+    def from_layers(cls, layers: 'Iterable[LayerSpec]'):
+        """
+        Loads config merged from several layers, later override earlier:
+        raw objects (`{'port': 80}`), file paths, parsed as config class
+        format, and `(path, YamlConfig)` pairs for files of other formats.
+
+        Use `helloconfig.ConfigLayers` directly to reload changed layers.
+        """
+
+        from helloconfig.layers import ConfigLayers
+
+        return ConfigLayers(cls, layers).config
+
+    @classmethod
+    def load_many(
+            cls,
+            paths: 'Iterable[str]',
+            workers: 'Optional[int]' = None,
+            mode: str = 'process',
+    ) -> 'Iterator[LoadResult]':
+        """
+        Loads many config files of this class. Files are read and parsed
+        in process pool (or thread pool with mode='thread', which is faster
+        for small files), data is loaded into config objects in this process.
+
+        Results are yielded as soon as they are ready, in completion order.
+        Errors, including `FieldsMissing`, are reported for each path
+        in `LoadResult.error` and don't stop loading of other files.
+        """
+
+        from helloconfig.bulk import load_many
+
+        return load_many(cls, paths, workers, mode)
+
+    @classmethod
+    async def from_str_async(cls, data: str, executor: 'Optional[Executor]' = None):
+        """`from_str` running in executor (default one of event loop, if not specified)"""
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, cls.from_str, data)
+
+    @classmethod
+    async def from_file_async(
+            cls,
+            path: str,
+            cache: 'Optional[ConfigCache]' = None,
+            executor: 'Optional[Executor]' = None,
+    ):
+        """
+        `from_file` running in executor (default one of event loop, if not specified),
+        file reading, parsing and creating missing file are not blocking event loop
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(cls.from_file, path, cache=cache)
+        )
+
+    @classmethod
+    def watch(
+            cls,
+            path: str,
+            interval: float = 1.0,
+            on_reload: 'Optional[Callable[[Any], Any]]' = None,
+            on_error: 'Optional[Callable[[Exception], Any]]' = None,
+    ) -> 'ConfigWatcher':
+        """
+        Loads config from file and starts background thread, polling file
+        for changes. Current config is available as `watcher.config`.
+        """
+
+        from helloconfig.watcher import ConfigWatcher
+
+        return ConfigWatcher(cls, path, interval, on_reload, on_error).start()
+
 
 class PythonConfig(ConfigBase):
     """
@@ -175,25 +661,33 @@ class PythonConfig(ConfigBase):
     only literals supported, no imports, no code evaluation.
     """
 
-    _PARSER_CLS = PythonParser
+    __slots__ = ()
+
+    _PARSER_CLS = LazyParserClass('PythonParser')
 
 
 class JsonConfig(ConfigBase):
     """Json syntax config, comments not supported"""
 
-    _PARSER_CLS = JsonParser
+    __slots__ = ()
+
+    _PARSER_CLS = LazyParserClass('JsonParser')
 
 
 class YamlConfig(ConfigBase):
     """Yaml syntax config, supporting only safe tags"""
 
-    _PARSER_CLS = YamlParser
+    __slots__ = ()
+
+    _PARSER_CLS = LazyParserClass('YamlParser')
 
 
 class DotEnvConfig(ConfigBase):
     """
-    Uses .env files syntax.
-    Lookup only within specified file, environment variables are ignored.
+    Uses .env files syntax. Lookup only within specified file,
+    environment variables are ignored, unless `env_prefix` is set.
     """
 
-    _PARSER_CLS = EnvParser
+    __slots__ = ()
+
+    _PARSER_CLS = LazyParserClass('EnvParser')
@@ -0,0 +1,117 @@
+from typing import Any, Callable, Iterator, List, Optional
+
+from helloconfig.schema import ConfigSchema
+from helloconfig.fingerprint import get_fingerprint
+
+
+def _is_equal(old: Any, new: Any) -> bool:
+    if type(old) is not type(new):
+        return False
+    if hasattr(old, 'dtype'):
+        # numpy arrays are compared by items
+        return get_fingerprint(old) == get_fingerprint(new)
+    return old == new
+
+
+def _iter_changes(old: Any, new: Any, schema: ConfigSchema, prefix: str) -> Iterator[str]:
+    for name, field in schema.fields.items():
+        old_value = getattr(old, name)
+        new_value = getattr(new, name)
+        if old_value is new_value:
+            continue
+
+        if field.schema is not None:
+            # fingerprints are cached by sections, so sections
+            # compared before are skipped without walking them
+            if get_fingerprint(old_value) != get_fingerprint(new_value):
+                yield from _iter_changes(old_value, new_value, field.schema, f'{prefix}{name}.')
+        elif not _is_equal(old_value, new_value):
+            yield prefix + name
+
+
+def diff_configs(old: Any, new: Any) -> 'List[str]':
+    """
+    Dotted paths of fields, which differ in two config objects of the same
+    class. Only fields are compared, dict and list values are not walked.
+    """
+
+    if type(old) is not type(new):
+        raise TypeError(f'Can\'t compare {type(old).__name__} '
+                        f'with {type(new).__name__}')
+    if old is new:
+        return []
+    return list(_iter_changes(old, new, old._schema, ''))
+
+
+def _get_prefixes(path: str) -> Iterator[str]:
+    """`a.b.c` -> `a`, `a.b`, `a.b.c`"""
+
+    end = path.find('.')
+    while end != -1:
+        yield path[:end]
+        end = path.find('.', end + 1)
+    yield path
+
+
+class ConfigSubscriptions:
+    """
+    Callbacks subscribed to fields or sections of config class. On reload
+    only callbacks of changed paths run, callback of section runs once,
+    however many of its fields changed.
+
+        subscriptions = ConfigSubscriptions(Config)
+        subscriptions.subscribe('database', rebuild_pool)
+        subscriptions.notify(old_config, new_config)
+    """
+
+    def __init__(self, config_cls: type) -> None:
+        self.config_cls: Any = config_cls
+        self._callbacks: 'list[tuple[str, Callable[[Any], Any]]]' = []
+
+    def __repr__(self) -> str:
+        paths = [path for path, _ in self._callbacks]
+        return f'{self.__class__.__name__}({self.config_cls.__name__}, {paths!r})'
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def _check_path(self, path: str) -> None:
+        schema = self.config_cls._schema
+        for name in path.split('.'):
+            if schema is None or name not in schema.fields:
+                raise ValueError(f'{self.config_cls.__name__} has no field {path!r}')
+            schema = schema.fields[name].schema
+
+    def subscribe(self, path: str, callback: 'Callable[[Any], Any]') -> 'Callable[[Any], Any]':
+        """Callback receives new config, when field (or section) at path changed"""
+
+        self._check_path(path)
+        self._callbacks.append((path, callback))
+        return callback
+
+    def unsubscribe(self, path: str, callback: 'Callable[[Any], Any]') -> None:
+        self._callbacks.remove((path, callback))
+
+    def notify(self, old: Any, new: Any,
+               on_error: 'Optional[Callable[[Exception], Any]]' = None) -> 'List[str]':
+        """
+        Runs callbacks of changed paths in order of subscription, returns
+        changed paths. If `on_error` is specified, exception of callback
+        is passed to it and other callbacks still run.
+        """
+
+        changed = diff_configs(old, new)
+        if not changed or not self._callbacks:
+            return changed
+
+        prefixes = {prefix for path in changed for prefix in _get_prefixes(path)}
+        for path, callback in list(self._callbacks):
+            if path not in prefixes:
+                continue
+            try:
+                callback(new)
+            except Exception as exc:
+                if on_error is None:
+                    raise
+                on_error(exc)
+        return changed
@@ -4,3 +4,7 @@ class ConfigError(Exception):
 
 class FieldsMissing(ConfigError):
     """Not all fields specified in config or file not exists"""
+
+
+class ValidationError(ConfigError, ValueError):
+    """Field value rejected by validator"""
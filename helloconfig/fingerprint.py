@@ -0,0 +1,190 @@
+"""
+Content fingerprints of config values: blake2b digest of canonical encoding,
+so equal values have equal fingerprints, in any process. Dict items and
+set items are encoded in sorted order. Fingerprint of section (and config)
+is computed once and cached on its frozen dataclass object, equality and
+hash of config objects and sections use it.
+"""
+
+from array import array
+from operator import itemgetter
+from typing import Any, Callable, Optional
+from dataclasses import fields, is_dataclass
+
+from helloconfig.immutable import ImmutableArray
+
+
+FINGERPRINT_SIZE = 16
+
+# key in `__dict__` of section dataclass objects
+_CACHE_KEY = '__fingerprint__'
+
+
+def _new_hasher() -> Any:
+    # hashlib is imported on first use, config classes use this module
+    import hashlib
+
+    return hashlib.blake2b(digest_size=FINGERPRINT_SIZE)
+
+
+class _Chunk(bytes):
+    """Already encoded part, written to hasher as is"""
+
+
+def _encode_str(obj: str) -> bytes:
+    data = obj.encode('utf-8', 'surrogatepass')
+    return b's%d:' % len(data) + data
+
+
+# exact types, subclasses (enums, for example) are checked with isinstance
+_scalar_encoders: 'dict[type, Callable[[Any], bytes]]' = {
+    str: _encode_str,
+    int: lambda obj: b'i%d;' % obj,
+    float: lambda obj: b'f' + obj.hex().encode() + b';',
+    bool: lambda obj: b'T' if obj else b'F',
+    bytes: lambda obj: b'b%d:' % len(obj) + obj,
+    type(None): lambda obj: b'N',
+}
+
+
+def _encode_scalar(obj: Any) -> 'Optional[bytes]':
+    encoder = _scalar_encoders.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    for scalar_type in (bool, int, float, str, bytes):
+        if isinstance(obj, scalar_type):
+            return _scalar_encoders[scalar_type](obj)
+    return None
+
+
+def _get_sorted_items(obj: dict) -> 'list[tuple[bytes, Any]]':
+    """Items with encoded keys, in canonical order"""
+
+    try:
+        # keys of one type (usually strings) have total order
+        keys = sorted(obj)
+    except TypeError:
+        return sorted(
+            [(get_fingerprint(key), value) for key, value in obj.items()],
+            key=itemgetter(0),
+        )
+    if all(type(key) is str for key in keys):
+        return [(_encode_str(key), obj[key]) for key in keys]
+    return [(_encode_scalar(key) or get_fingerprint(key), obj[key]) for key in keys]
+
+
+def _update(hasher: Any, obj: Any) -> None:
+    # tree is walked without recursion, like `replace_mutable_values` does,
+    # only dict keys, set items and sections are fingerprinted separately
+    update = hasher.update
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        obj_type = type(obj)
+        if obj_type is _Chunk:
+            update(obj)
+            continue
+
+        encoder = _scalar_encoders.get(obj_type)
+        if encoder is not None:
+            update(encoder(obj))
+            continue
+
+        if isinstance(obj, (list, tuple)):
+            update(b'l%d:' % len(obj))
+            stack.extend(reversed(obj))
+
+        elif isinstance(obj, dict):
+            update(b'd%d:' % len(obj))
+            for key, value in reversed(_get_sorted_items(obj)):
+                stack.append(value)
+                stack.append(_Chunk(key))
+
+        elif isinstance(obj, (set, frozenset)):
+            update(b'S%d:' % len(obj))
+            update(b''.join(sorted(map(get_fingerprint, obj))))
+
+        elif isinstance(obj, (array, ImmutableArray)):
+            update(b'a%s%d:' % (obj.typecode.encode(), len(obj)))
+            update(obj.tobytes())
+
+        elif hasattr(obj, 'dtype') and hasattr(obj, 'tobytes'):  # numpy array
+            update(b'n%s%r:' % (obj.dtype.str.encode(), obj.shape))
+            update(obj.tobytes())
+
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            update(b'D')
+            update(get_fingerprint(obj))
+
+        else:
+            encoded = _encode_scalar(obj)
+            if encoded is None:
+                encoded = f'r{type(obj).__qualname__}:{obj!r};'.encode()
+            update(encoded)
+
+
+def _get_cache(data_obj: Any) -> 'Optional[dict[str, Any]]':
+    """`__dict__` of frozen dataclass object, values of others may change"""
+
+    params = getattr(type(data_obj), '__dataclass_params__', None)
+    if params is None or not params.frozen:
+        return None
+    return getattr(data_obj, '__dict__', None)
+
+
+def _get_section_fingerprint(data_obj: Any, names: 'tuple[str, ...]', source: Any) -> bytes:
+    cache = _get_cache(data_obj)
+    if cache is not None and _CACHE_KEY in cache:
+        return cache[_CACHE_KEY]
+
+    hasher = _new_hasher()
+    hasher.update(b'%d:' % len(names))
+    for name in names:
+        hasher.update(_encode_scalar(name))  # type: ignore
+        _update(hasher, getattr(source, name))
+
+    fingerprint = hasher.digest()
+    if cache is not None:
+        cache[_CACHE_KEY] = fingerprint
+    return fingerprint
+
+
+def get_fingerprint(obj: Any) -> bytes:
+    """
+    Digest of value, section or loaded config object. Values of fields with
+    different types (`1`, `1.0` and `True`) have different fingerprints.
+    """
+
+    encoded = _encode_scalar(obj)
+    if encoded is not None and len(encoded) < FINGERPRINT_SIZE:
+        # short scalar (dict key, set item) is unique by itself
+        return encoded.ljust(FINGERPRINT_SIZE, b'\0')
+
+    if is_dataclass(obj) and not isinstance(obj, type):
+        names = tuple(field.name for field in fields(obj))
+        return _get_section_fingerprint(obj, names, obj)
+
+    data_obj = getattr(obj, '_data_object', None)
+    if data_obj is not None:
+        # config object, lazy sections are loaded, so fingerprint
+        # is the same as of config with eagerly loaded sections
+        return _get_section_fingerprint(data_obj, getattr(obj, '_field_names'), obj)
+
+    hasher = _new_hasher()
+    _update(hasher, obj)
+    return hasher.digest()
+
+
+def get_fingerprint_hash(fingerprint: bytes) -> int:
+    """Hash of object with fingerprint, same in every process"""
+    return int.from_bytes(fingerprint[:8], 'little')
+
+
+def section_eq(self, other) -> bool:
+    if type(other) is not type(self):
+        return NotImplemented
+    return self is other or get_fingerprint(self) == get_fingerprint(other)
+
+
+def section_hash(self) -> int:
+    return get_fingerprint_hash(get_fingerprint(self))
@@ -1,18 +1,74 @@
+from array import array
+from typing import Iterable, Iterator
+from collections.abc import Sequence
+
+
+# exact types, produced by parsers. checking type is faster
+# than isinstance and skips already frozen ImmutableDict
+_mutable_types = frozenset({dict, list, set})
+
+
+def _freeze_container(obj, frozen: 'dict[int, object]'):
+    try:
+        if type(obj) is dict:
+            result = ImmutableDict(obj)
+            for key, value in obj.items():
+                if type(value) in _mutable_types:
+                    dict.__setitem__(result, key, frozen[id(value)])
+            return result
+
+        if type(obj) is list:
+            return ImmutableList([
+                frozen[id(value)] if type(value) in _mutable_types else value
+                for value in obj
+            ])
+    except KeyError:
+        # child is not frozen yet, so it's ancestor of this container
+        raise ValueError('Recursive structures are not '
+                         'supported in config files') from None
+
+    # set items are hashable, so they are already immutable
+    return ImmutableSet(obj)
+
+
 def _get_immutable_value(obj):
-    if isinstance(obj, dict):
-        for key in list(obj.keys()):
-            obj[key] = _get_immutable_value(obj[key])
-        return ImmutableDict(obj)
+    """
+    Replaces dicts, lists and sets with immutable containers.
+    Tree is walked without recursion, so depth is not limited
+    by interpreter stack. Containers referenced several times
+    (yaml anchors, for example) are frozen once and shared.
+    """
+
+    if type(obj) not in _mutable_types:
+        return obj
 
-    if isinstance(obj, list):
-        for i in range(len(obj)):
-            obj[i] = _get_immutable_value(obj[i])
-        return ImmutableList(obj)
+    frozen: 'dict[int, object]' = {}
+    visited = set()
+    # (container, children_done) pairs, container is frozen
+    # when it's popped for the second time, after all its children
+    stack = [(obj, False)]
 
-    if isinstance(obj, set):
-        return ImmutableSet(_get_immutable_value(val) for val in obj)
+    while stack:
+        container, children_done = stack.pop()
 
-    return obj
+        if children_done:
+            frozen[id(container)] = _freeze_container(container, frozen)
+            continue
+
+        if id(container) in visited:
+            continue
+        visited.add(id(container))
+        stack.append((container, True))
+
+        if type(container) is set:
+            continue
+
+        values = container.values() if type(container) is dict else container
+        for value in values:
+            if type(value) in _mutable_types and id(value) not in visited:
+                stack.append((value, False))
+
+    return frozen[id(obj)]
 
 
 def replace_mutable_values(obj: dict):
@@ -28,6 +84,9 @@ def _not_supported_method(method_name: str):
 
 
 class ImmutableDict(dict):
+    # shared dicts are stored in weak table, see `helloconfig.interning`
+    __slots__ = ('__weakref__',)
+
     pop = _not_supported_method('pop')
     clear = _not_supported_method('clear')
     update = _not_supported_method('update')
@@ -36,25 +95,63 @@ class ImmutableDict(dict):
 
     __setitem__ = _not_supported_method('__setitem__')
     __delitem__ = _not_supported_method('__delitem__')
+    __ior__ = _not_supported_method('__ior__')
+
+    # equal dicts have equal hashes regardless of order of items
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
 
+# tuple storage is allocated in one block and never over-allocated
+class ImmutableList(tuple):
+    __slots__ = ()
 
-class ImmutableList(list):
     pop = _not_supported_method('pop')
     sort = _not_supported_method('sort')
     clear = _not_supported_method('clear')
     append = _not_supported_method('append')
     extend = _not_supported_method('extend')
     insert = _not_supported_method('insert')
-    insert = _not_supported_method('insert')
     remove = _not_supported_method('remove')
     reverse = _not_supported_method('reverse')
 
     __setitem__ = _not_supported_method('__setitem__')
     __delitem__ = _not_supported_method('__delitem__')
+    __iadd__ = _not_supported_method('__iadd__')
+    __imul__ = _not_supported_method('__imul__')
+
+    # behaves like list it replaces
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return tuple.__eq__(self, tuple(other))
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def copy(self) -> list:
+        return list(self)
+
+    def __reduce__(self):
+        return (self.__class__, (tuple(self),))
 
 
 # this is more verbose, than just use frozenset
-class ImmutableSet(set):
+class ImmutableSet(frozenset):
+    __slots__ = ()
+
     add = _not_supported_method('add')
     pop = _not_supported_method('pop')
     clear = _not_supported_method('clear')
@@ -64,3 +161,135 @@ class ImmutableSet(set):
     difference_update = _not_supported_method('difference_update')
     intersection_update = _not_supported_method('intersection_update')
     symmetric_difference_update = _not_supported_method('symmetric_difference_update')
+
+    __ior__ = _not_supported_method('__ior__')
+    __iand__ = _not_supported_method('__iand__')
+    __isub__ = _not_supported_method('__isub__')
+    __ixor__ = _not_supported_method('__ixor__')
+
+    def __repr__(self) -> str:
+        return repr(set(self)) if self else 'set()'
+
+
+class ImmutableArray(Sequence):
+    """
+    Contiguous storage of machine values, 8 bytes per item without boxing.
+    Items are copied to bytes and read through memoryview cast to their
+    type, so there is no writable buffer of array. Behaves like list it replaces
+    """
+
+    __slots__ = ('_view', '__weakref__')
+
+    def __init__(self, typecode: str, data: Iterable = ()) -> None:
+        # array converts and checks items, its bytes are copied to immutable storage
+        self._view = memoryview(array(typecode, data).tobytes()).cast(typecode)  # type: ignore
+
+    @classmethod
+    def _from_view(cls, view: memoryview) -> 'ImmutableArray':
+        obj = cls.__new__(cls)
+        obj._view = view
+        return obj
+
+    @property
+    def typecode(self) -> str:
+        return self._view.format
+
+    @property
+    def itemsize(self) -> int:
+        return self._view.itemsize
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_view(self._view[index])
+        return self._view[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._view)
+
+    def __contains__(self, value) -> bool:
+        return value in self._view
+
+    def __eq__(self, other):
+        if isinstance(other, ImmutableArray):
+            return self._view == other._view
+        if isinstance(other, (list, tuple, array)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    # unhashable like list, configs and sections with arrays are hashed by fingerprint
+    __hash__ = None  # type: ignore
+
+    pop = _not_supported_method('pop')
+    append = _not_supported_method('append')
+    extend = _not_supported_method('extend')
+    insert = _not_supported_method('insert')
+    remove = _not_supported_method('remove')
+    reverse = _not_supported_method('reverse')
+    sort = _not_supported_method('sort')
+
+    __setitem__ = _not_supported_method('__setitem__')
+    __delitem__ = _not_supported_method('__delitem__')
+    __iadd__ = _not_supported_method('__iadd__')
+    __imul__ = _not_supported_method('__imul__')
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def tolist(self) -> list:
+        return self._view.tolist()
+
+    def tobytes(self) -> bytes:
+        return self._view.tobytes()
+
+    def copy(self) -> list:
+        return self.tolist()
+
+    def __reduce__(self):
+        # array is created from bytes as is
+        return (self.__class__, (self.typecode, self.tobytes()))
+
+
+_array_typecodes = {int: 'q', float: 'd'}
+
+
+def get_numeric_array(item_type: type, data):
+    """
+    Read-only array of ints or floats. Items are converted same way
+    as loader does for lists, values out of int64 range are kept in list
+    """
+
+    typecode = _array_typecodes[item_type]
+    try:
+        return ImmutableArray(typecode, data)
+    except TypeError:
+        # not exact types (strings, for example), converted one by one
+        if isinstance(data, (str, bytes)):
+            raise ValueError(f'Expected list of {item_type.__name__}') from None
+        try:
+            return ImmutableArray(typecode, map(item_type, data))
+        except OverflowError:
+            return ImmutableList(map(item_type, data))
+    except OverflowError:
+        return ImmutableList(map(item_type, data))
+
+
+def get_numpy_array(item_type: type, data):
+    """Read-only numpy array, or `ImmutableArray` if numpy is not installed"""
+
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return get_numeric_array(item_type, data)
+
+    dtype = numpy.int64 if item_type is int else numpy.float64
+    try:
+        result = numpy.array(data, dtype=dtype)
+    except OverflowError:
+        return get_numeric_array(item_type, data)
+    if result.ndim != 1:
+        raise ValueError(f'Expected list of {item_type.__name__}')
+    result.flags.writeable = False
+    return result
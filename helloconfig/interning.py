@@ -0,0 +1,109 @@
+"""
+Hash-consing of loaded config values. Sections, dicts, sets and arrays
+with equal contents (and type) are stored once, strings are interned with
+`sys.intern`. Table keeps only weak references, so entries are removed,
+when last config using them is freed.
+"""
+
+import sys
+import weakref
+
+from typing import Any
+from dataclasses import fields, is_dataclass
+
+from helloconfig.fingerprint import get_fingerprint
+from helloconfig.immutable import ImmutableArray, ImmutableDict, ImmutableList, ImmutableSet
+
+
+class ConfigInterner:
+    """
+    Table of values, looked up by type and fingerprint. Value found in table
+    is returned with its subtree as is, new value is stored after its
+    children are interned.
+
+    Lists (`ImmutableList` is tuple) and plain containers (of parametrized
+    fields) can't be weakly referenced, so they are not stored in table,
+    but are shared with dicts and sections containing them, their items
+    are interned anyway.
+    """
+
+    def __init__(self) -> None:
+        self._table: 'weakref.WeakValueDictionary[Any, Any]' = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(size={len(self)}, '
+                f'hits={self.hits}, misses={self.misses})')
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def intern(self, value: Any) -> Any:
+        """Stored value equal to given one, or value itself, stored now"""
+
+        value_type = type(value)
+        if value_type is str:
+            return sys.intern(value)
+        if value_type is ImmutableList or value_type is list:
+            return self._intern_list(value)
+        if value_type is dict:
+            return self._intern_dict(value)
+
+        if value_type in (ImmutableDict, ImmutableSet, ImmutableArray) or (
+                is_dataclass(value) and not isinstance(value, type)):
+            key = (value_type, get_fingerprint(value))
+            found = self._table.get(key)
+            if found is not None:
+                self.hits += 1
+                return found
+
+            self.misses += 1
+            value = self._intern_children(value)
+            self._table[key] = value
+        return value
+
+    def _intern_list(self, value: Any) -> Any:
+        items = [self.intern(item) for item in value]
+        if all(map(_is, items, value)):
+            return value
+        return type(value)(items)
+
+    def _intern_dict(self, value: Any) -> Any:
+        # keys must be replaced too, so new dict is created
+        items = [
+            (self.intern(key) if type(key) is str else key, self.intern(item))
+            for key, item in value.items()
+        ]
+        if all(key is old_key and item is old_item
+               for (key, item), (old_key, old_item) in zip(items, value.items())):
+            return value
+        return type(value)(items)
+
+    def _intern_children(self, value: Any) -> Any:
+        value_type = type(value)
+        if value_type is ImmutableDict:
+            return self._intern_dict(value)
+
+        if value_type is ImmutableSet:
+            return ImmutableSet(map(self.intern, value))
+
+        if value_type is ImmutableArray:
+            return value
+
+        # section is loaded just now and not shared yet, so
+        # its fields are replaced in place, cached fingerprint is kept
+        for field in fields(value):
+            item = getattr(value, field.name)
+            interned = self.intern(item)
+            if interned is not item:
+                object.__setattr__(value, field.name, interned)
+        return value
+
+
+def _is(first: Any, second: Any) -> bool:
+    return first is second
+
+
+# shared by all config classes with `interning` enabled
+default_interner = ConfigInterner()
@@ -0,0 +1,296 @@
+import os
+import hashlib
+
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Type, Union
+from inspect import isclass
+from dataclasses import replace
+
+from helloconfig.exceptions import FieldsMissing
+from helloconfig.schema import get_field_paths
+from helloconfig.parsers.base import AbstractParser
+
+
+_missing = object()
+
+# nested dict of changed keys, `None` means whole value changed
+Changes = Dict[str, Any]
+
+
+def merge_layers(raw_objs: 'Iterable[Mapping[str, Any]]') -> 'dict[str, Any]':
+    """
+    Deep merge of raw objects, later ones override earlier. Dicts are merged
+    key by key, other values (lists too) are replaced. Merged dicts are new,
+    values present in one layer only are shared with it.
+    """
+
+    merged: 'dict[str, Any]' = {}
+    for raw_obj in raw_objs:
+        for key, value in raw_obj.items():
+            previous = merged.get(key)
+            if isinstance(value, dict) and isinstance(previous, dict):
+                merged[key] = merge_layers((previous, value))
+            else:
+                merged[key] = value
+    return merged
+
+
+def diff_raw_objs(old: 'Mapping[str, Any]', new: 'Mapping[str, Any]') -> Changes:
+    """Keys which differ, nested dicts are compared recursively"""
+
+    changes: 'dict[str, Any]' = {}
+    for key in old.keys() | new.keys():
+        old_value = old.get(key, _missing)
+        new_value = new.get(key, _missing)
+        if old_value is new_value:
+            continue
+
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            nested = diff_raw_objs(old_value, new_value)
+            if nested:
+                changes[key] = nested
+        elif old_value is _missing or new_value is _missing or old_value != new_value:
+            changes[key] = None
+    return changes
+
+
+def update_merged(merged: 'Mapping[str, Any]', raw_objs: 'list[Mapping[str, Any]]',
+                  changes: Changes) -> 'dict[str, Any]':
+    """
+    Merge of `raw_objs`, made from their previous merge, where one layer
+    changed. Only changed keys are merged again, other values (and
+    unchanged nested dicts) are taken from previous merge as is.
+    """
+
+    result = dict(merged)
+    for key, nested in changes.items():
+        values = [raw_obj[key] for raw_obj in raw_objs if key in raw_obj]
+        if not values:
+            result.pop(key, None)
+            continue
+
+        # value is replaced by every non-dict value, so only
+        # dicts after last of them are merged into result
+        start = 0
+        for n, value in enumerate(values):
+            if not isinstance(value, dict):
+                start = n + 1
+        dict_values = values[start:]
+
+        previous = merged.get(key)
+        if nested is not None and dict_values and isinstance(previous, dict):
+            result[key] = update_merged(previous, dict_values, nested)
+        else:
+            result[key] = merge_layers([{key: value} for value in values])[key]
+    return result
+
+
+class RawLayer:
+    """Layer with already parsed object (built-in defaults, values from code)"""
+
+    def __init__(self, raw_obj: 'Mapping[str, Any]') -> None:
+        self.raw_obj = raw_obj
+        self.state: Any = None
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.raw_obj!r})'
+
+    def read(self) -> 'Optional[Tuple[Any, Mapping[str, Any]]]':
+        if self.state is not None:
+            return None
+        return True, self.raw_obj
+
+
+class FileLayer:
+    """
+    Config file, parsed with parser of its own format. File is parsed
+    again only if its mtime or size changed and contents hash differs.
+    Missing file of optional layer is same as empty one.
+    """
+
+    def __init__(self, path: str, parser_cls: Type[AbstractParser],
+                 optional: bool = False) -> None:
+        self.path = path
+        self.parser_cls = parser_cls
+        self.optional = optional
+        # (mtime, size, digest) of last loaded contents, () if file is missing
+        self.state: Any = None
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}({self.path!r}, '
+                f'{self.parser_cls.__name__}, optional={self.optional!r})')
+
+    def read(self) -> 'Optional[Tuple[Any, Mapping[str, Any]]]':
+        """New state and raw object, or None if file was not changed"""
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            if not self.optional:
+                raise
+            return None if self.state == () else ((), {})
+
+        if self.state and self.state[:2] == (stat.st_mtime_ns, stat.st_size):
+            return None
+
+        with open(self.path, encoding='utf-8') as file:
+            stat = os.fstat(file.fileno())
+            data = file.read()
+
+        digest = hashlib.blake2b(data.encode('utf-8')).digest()
+        state = (stat.st_mtime_ns, stat.st_size, digest)
+        if self.state and self.state[2] == digest:
+            self.state = state
+            return None
+        return state, self.parser_cls().parse_string(data)
+
+
+LayerSpec = Union[str, 'Mapping[str, Any]', 'Tuple[str, Any]', RawLayer, FileLayer]
+
+
+def get_parser_cls(parser: Any) -> Type[AbstractParser]:
+    """Parser class itself or parser of config class"""
+
+    if isclass(parser) and issubclass(parser, AbstractParser):
+        return parser
+    parser_cls = getattr(parser, '_PARSER_CLS', None)
+    if parser_cls is None:
+        raise TypeError(f'Expected parser or config class, got {parser!r}')
+    return parser_cls
+
+
+def get_layer(spec: LayerSpec, default_parser_cls: Type[AbstractParser]):
+    if isinstance(spec, (RawLayer, FileLayer)):
+        return spec
+    if isinstance(spec, str):
+        return FileLayer(spec, default_parser_cls)
+    if isinstance(spec, tuple):
+        path, parser = spec
+        return FileLayer(path, get_parser_cls(parser))
+    if isinstance(spec, Mapping):
+        return RawLayer(spec)
+    raise TypeError(f'Invalid config layer {spec!r}')
+
+
+class ConfigLayers:
+    """
+    Config merged from several layers: raw objects (defaults), files of
+    config class format and files of other formats, e.g. `('prod.yaml',
+    YamlConfig)`. Later layers override earlier ones. Environment variables
+    of config class with `env_prefix` are applied on top of merged object.
+
+    Parsed object of every layer is kept, `reload` parses only changed
+    files and merges again only keys changed in them. When only nested
+    sections changed, new config reuses unchanged sections of previous
+    one, and only changed sections are loaded.
+    """
+
+    def __init__(self, config_cls: type, layers: 'Iterable[LayerSpec]') -> None:
+        self.config_cls: Any = config_cls
+        self.layers = [get_layer(spec, config_cls._PARSER_CLS) for spec in layers]
+        self.raw_objs: 'list[Mapping[str, Any]]' = [{} for _ in self.layers]
+        self.merged: 'dict[str, Any]' = {}
+        self.config: Any = None
+        # merged object with environment variables, config was loaded from it
+        self._raw_obj: 'Mapping[str, Any]' = {}
+        self._section_loaders: 'dict[str, Any]' = {}
+
+        self.reload()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.config_cls.__name__}, {self.layers!r})'
+
+    def set_layer(self, index: int, layer: LayerSpec) -> bool:
+        """Replaces one layer, returns True if config changed"""
+
+        self.layers[index] = get_layer(layer, self.config_cls._PARSER_CLS)
+        return self.reload()
+
+    def reload(self) -> bool:
+        """
+        Reads changed layers and loads config again, if result changed.
+        Returns True if config replaced. On error previous config and
+        layers are kept, so next reload reads failed layers again.
+        """
+
+        updates = []
+        raw_objs = list(self.raw_objs)
+        merged = self.merged
+        for n, layer in enumerate(self.layers):
+            update = layer.read()
+            if update is None:
+                continue
+
+            state, raw_obj = update
+            updates.append((layer, state))
+            changes = diff_raw_objs(raw_objs[n], raw_obj)
+            raw_objs[n] = raw_obj
+            if changes:
+                merged = update_merged(merged, raw_objs, changes)
+
+        raw_obj = self.config_cls._apply_overlay(merged)
+        config = self._load(raw_obj)
+
+        for layer, state in updates:
+            layer.state = state
+        self.raw_objs = raw_objs
+        self.merged = merged
+        self._raw_obj = raw_obj
+        if config is None:
+            return False
+        self.config = config
+        return True
+
+    def _load(self, raw_obj: 'Mapping[str, Any]'):
+        config_cls = self.config_cls
+        schema = config_cls._schema
+
+        changed = [
+            name for name in schema.fields
+            if raw_obj.get(name, _missing) is not self._raw_obj.get(name, _missing)
+            and raw_obj.get(name, _missing) != self._raw_obj.get(name, _missing)
+        ]
+        if self.config is not None and not changed:
+            return None
+
+        missing = schema.get_missing_fields(raw_obj)
+        if missing:
+            diff = set(get_field_paths(missing))
+            raise FieldsMissing('Some fields are missing from config layers '
+                               f'({diff!r})')
+
+        validated = {name for validator in schema.validators for name in validator.fields}
+        if self.config is not None and all(
+                schema.fields[name].schema is not None and name not in validated
+                for name in changed
+        ):
+            # only sections changed, others are reused
+            data = replace(self.config._data_object, **{
+                name: self._load_section(name, raw_obj[name]) for name in changed
+            })
+        else:
+            data = config_cls._load_data(raw_obj)
+
+        config = config_cls()
+        config._set_data(data)
+        return config
+
+    def _load_section(self, name: str, value: Any):
+        if self.config_cls.lazy_sections:
+            # loaded on access by `LazySection`
+            return value
+
+        loader = self._section_loaders.get(name)
+        if loader is None:
+            from helloconfig.config_bases import create_loader
+
+            loader = self._section_loaders[name] = create_loader(
+                self.config_cls._schema.fields[name].schema,
+                numeric_arrays=self.config_cls.numeric_arrays,
+                compiled=self.config_cls.compiled_loader,
+            )
+
+        section = loader(value)
+        if self.config_cls.interning:
+            from helloconfig.interning import default_interner
+            section = default_interner.intern(section)
+        return section
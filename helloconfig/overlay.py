@@ -0,0 +1,58 @@
+import json
+
+from typing import Any, Dict, Mapping, Tuple
+
+from helloconfig.schema import FieldSchema
+from helloconfig.immutable import replace_mutable_values
+
+
+# typing aliases, so it's valid type on python 3.8
+EnvIndex = Dict[str, Tuple[Tuple[str, ...], FieldSchema]]
+
+
+def convert_env_value(env_name: str, value: str, field: FieldSchema) -> Any:
+    """
+    Scalar fields are converted with schema converter, other
+    fields (lists, dicts, optional values) are parsed as JSON
+    """
+
+    try:
+        if field.converter is not None:
+            return field.converter(value)
+        return replace_mutable_values(json.loads(value))
+    except ValueError as e:
+        raise ValueError(f'Invalid value of environment variable '
+                         f'{env_name!r} for field {field.name!r}: {e}') from None
+
+
+def apply_env_overlay(raw_obj: 'Mapping[str, Any]', index: EnvIndex,
+                      environ: 'Mapping[str, str]') -> 'Mapping[str, Any]':
+    """
+    Copy of raw object with values of environment variables from index.
+    Only dicts on paths of overridden fields are copied, if nothing
+    is set, raw object is returned as is.
+    """
+
+    names = index.keys() & environ.keys()
+    if not names:
+        return raw_obj
+
+    result = dict(raw_obj)
+    # copies of nested dicts, made for this overlay, by their path
+    copied: 'dict[tuple[str, ...], dict[str, Any]]' = {(): result}
+
+    for env_name in sorted(names):
+        path, field = index[env_name]
+
+        namespace = result
+        for depth, name in enumerate(path[:-1], 1):
+            if path[:depth] not in copied:
+                nested = namespace.get(name)
+                copied[path[:depth]] = namespace[name] = (
+                    dict(nested) if isinstance(nested, dict) else {}
+                )
+            namespace = copied[path[:depth]]
+
+        namespace[path[-1]] = convert_env_value(env_name, environ[env_name], field)
+
+    return result
@@ -1,2 +1,46 @@
-from .python import PythonParser
-from .parsers import *
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .base import AbstractParser
+
+
+# parser backends (libcst, yaml, json...) are slow to import,
+# so each parser module is imported on first attribute access
+_PARSER_MODULES = {
+    'PythonParser': 'python',
+    'JsonParser': 'json',
+    'YamlParser': 'yaml',
+    'IniParser': 'ini',
+    'EnvParser': 'env',
+}
+
+
+__all__ = (
+    'AbstractParser',
+
+    'PythonParser',
+    'JsonParser',
+    'YamlParser',
+    'IniParser',
+    'EnvParser',
+)
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .python import PythonParser
+    from .json import JsonParser
+    from .yaml import YamlParser
+    from .ini import IniParser
+    from .env import EnvParser
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _PARSER_MODULES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} '
+                             f'has no attribute {name!r}') from None
+
+    parser_cls = getattr(import_module(f'{__name__}.{module_name}'), name)
+    globals()[name] = parser_cls
+    return parser_cls
@@ -1,5 +1,42 @@
 from abc import ABC, abstractmethod
 from typing import Any
+from dataclasses import (
+    MISSING, is_dataclass,
+    Field as DataclassField,
+    fields as dataclass_fields,
+)
+
+
+class NameSpace(dict):
+    "Represents nested namespace, existing in config, with missing fields"
+
+
+def has_namespaces(fields: 'dict[str, Any]') -> bool:
+    return any(isinstance(value, NameSpace) for value in fields.values())
+
+
+def get_default_value(value: Any) -> Any:
+    """
+    Converts dataclass field (or nested dataclass) passed to `update_config`
+    to plain value, which is written to config file
+    """
+
+    if isinstance(value, NameSpace):
+        return {name: get_default_value(field) for name, field in value.items()}
+
+    if isinstance(value, DataclassField):
+        if value.default_factory is not MISSING:
+            return value.default_factory()
+        if value.default is not MISSING:
+            return value.default
+        if not is_dataclass(value.type):
+            return value.type()  # type: ignore
+        value = value.type
+
+    if isinstance(value, type) and is_dataclass(value):
+        return {f.name: get_default_value(f) for f in dataclass_fields(value)}
+
+    return value
 
 
 class AbstractParser(ABC):  # pragma: no cover
@@ -9,4 +46,10 @@ class AbstractParser(ABC):  # pragma: no cover
 
     @abstractmethod
     def update_config(self, config: str, fields: 'dict[str, Any]') -> str:
+        """
+        Adds fields to config. `fields` contains only fields missing from
+        config, values may be dataclass fields or nested dataclasses,
+        existing contents should be kept as is. Missing fields of nested
+        namespaces, which exist in config, are passed as `NameSpace`.
+        """
         raise NotImplementedError
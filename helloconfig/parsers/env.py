@@ -0,0 +1,25 @@
+from typing import Any
+
+from helloconfig.parsers.base import AbstractParser, get_default_value
+
+
+class EnvParser(AbstractParser):
+    def parse_string(self, data: str) -> 'dict[str, Any]':
+        result = {}
+        for line in data.splitlines():
+            name, sep, value = line.partition('=')
+            if not sep:
+                continue
+
+            result[name.strip()] = value.strip()
+
+        return result
+
+    def update_config(self, config: str, fields: 'dict[str, Any]') -> str:
+        lines = []
+        for name, value in fields.items():
+            lines.append(f'{name}={get_default_value(value)}')
+        fields_str = '\n\n'.join(lines)
+        if config:
+            return config + '\n\n' + fields_str
+        return fields_str  # pragma: no cover
@@ -0,0 +1,26 @@
+import configparser
+
+from io import StringIO
+from typing import Any
+
+from helloconfig.parsers.base import AbstractParser
+from helloconfig.immutable import replace_mutable_values
+
+
+class IniParser(AbstractParser):
+    def parse_string(self, data: str) -> 'dict[str, Any]':
+        parser = configparser.ConfigParser()
+        parser.read_string(data)
+        values = dict(parser[parser.default_section].items())
+        for section in parser.sections():
+            values.update(dict(parser[section].items()))
+        return replace_mutable_values(values)  # type: ignore
+
+    def update_config(self, config: str, fields: 'dict[str, Any]') -> str:
+        parser = configparser.ConfigParser()
+        parser.update(fields)
+        fields_str = StringIO()
+        parser.write(fields_str)
+        if config:
+            return config + '\n\n' + fields_str.getvalue()
+        return fields_str.getvalue()
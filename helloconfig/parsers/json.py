@@ -0,0 +1,164 @@
+import re
+import json
+
+from typing import Any, Iterator
+
+from helloconfig.parsers.base import AbstractParser, NameSpace, get_default_value
+from helloconfig.immutable import ImmutableDict, ImmutableList
+
+
+def _freeze_list(value: list) -> ImmutableList:
+    # lists are created by json scanner itself, so they are frozen here,
+    # objects inside them are already frozen by pairs hook
+    return ImmutableList([
+        _freeze_list(item) if type(item) is list else item
+        for item in value
+    ])
+
+
+def _object_pairs_hook(pairs: 'list[tuple[str, Any]]') -> ImmutableDict:
+    # dict is built from pairs directly, without intermediate copy,
+    # then only list values are replaced with frozen ones
+    result = ImmutableDict(pairs)
+    for name, value in pairs:
+        if type(value) is list:
+            dict.__setitem__(result, name, _freeze_list(value))
+    return result
+
+
+_decoder = json.JSONDecoder(object_pairs_hook=_object_pairs_hook)
+
+
+# decoder without hooks, values of existing members are only skipped
+_plain_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+_line_whitespace = re.compile(r'[ \t]*')
+_indented_line = re.compile(r'^([ \t]+)\S', re.MULTILINE)
+
+
+def _get_indent_unit(config: str) -> str:
+    """Indentation of first indented line, as used in file"""
+
+    match = _indented_line.search(config)
+    return match.group(1) if match else ' ' * 4
+
+
+def _get_line_indent(config: str, pos: int) -> str:
+    line_start = config.rfind('\n', 0, pos) + 1
+    return _line_whitespace.match(config, line_start).group()  # type: ignore
+
+
+class _ObjectUpdater:
+    """
+    Inserts missing members into JSON objects, so contents of file are kept
+    as is. Members of object are scanned only to find nested objects with
+    missing fields, other values are skipped, not built.
+    """
+
+    def __init__(self, config: str) -> None:
+        self.config = config
+        self.unit = _get_indent_unit(config)
+        # (start, stop, text) replacements
+        self.insertions: 'list[tuple[int, int, str]]' = []
+
+    def skip_whitespace(self, pos: int) -> int:
+        return _whitespace.match(self.config, pos).end()  # type: ignore
+
+    def expect(self, pos: int, char: str) -> int:
+        if self.config[pos:pos + 1] != char:
+            raise ValueError(f'Expected {char!r} at position {pos} of JSON config')
+        return pos + 1
+
+    def update_object(self, start: int, end: int, fields: 'dict[str, Any]') -> None:
+        """Object is `config[start:end + 1]`, from opening to closing brace"""
+
+        fields = dict(fields)
+        namespaces = {
+            name: value for name, value in fields.items() if isinstance(value, NameSpace)
+        }
+        if namespaces:
+            for name, value_start, value_end in self.iter_objects(start, end):
+                if name in namespaces:
+                    self.update_object(value_start, value_end, namespaces[name])
+                    del fields[name]
+
+        if fields:
+            self.add_members(start, end, fields)
+
+    def iter_objects(self, start: int, end: int) -> 'Iterator[tuple[str, int, int]]':
+        """Names and spans of members, which are objects"""
+
+        config = self.config
+        pos = self.skip_whitespace(start + 1)
+        while pos < end:
+            key, pos = json.decoder.scanstring(config, self.expect(pos, '"'))  # type: ignore
+            pos = self.skip_whitespace(self.expect(self.skip_whitespace(pos), ':'))
+            value_start = pos
+            _, pos = _plain_decoder.raw_decode(config, pos)
+            if config[value_start] == '{':
+                yield key, value_start, pos - 1
+
+            pos = self.skip_whitespace(pos)
+            if pos < end:
+                pos = self.skip_whitespace(self.expect(pos, ','))
+
+    def add_members(self, start: int, end: int, fields: 'dict[str, Any]') -> None:
+        config = self.config
+        object_indent = _get_line_indent(config, start)
+        # end of last member, or opening brace of empty object
+        last_end = len(config[:end].rstrip())
+        is_empty = last_end == start + 1
+
+        # new members are indented as first existing one,
+        # if it's written on its own line
+        first_key = self.skip_whitespace(start + 1)
+        line_start = config.rfind('\n', 0, first_key) + 1
+        if not is_empty and line_start > start:
+            member_indent = config[line_start:first_key]
+        else:
+            member_indent = object_indent + self.unit
+
+        members = ',\n'.join(
+            member_indent + json.dumps(name, ensure_ascii=False) + ': ' + json.dumps(
+                get_default_value(value), ensure_ascii=False, indent=self.unit,
+            ).replace('\n', '\n' + member_indent)
+            for name, value in fields.items()
+        )
+
+        # each member on its own line, closing brace on the next line
+        if is_empty:
+            self.insertions.append((start + 1, end, f'\n{members}\n{object_indent}'))
+        elif '\n' in config[last_end:end]:
+            self.insertions.append((last_end, last_end, f',\n{members}'))
+        else:
+            self.insertions.append((last_end, end, f',\n{members}\n{object_indent}'))
+
+    def update(self, fields: 'dict[str, Any]') -> str:
+        start = self.skip_whitespace(0)
+        end = len(self.config.rstrip()) - 1
+        if self.config[start:start + 1] != '{' or self.config[end] != '}':
+            raise ValueError('JSON config must be an object')
+        self.update_object(start, end, fields)
+
+        config = self.config
+        for insert_start, stop, text in sorted(self.insertions, reverse=True):
+            config = config[:insert_start] + text + config[stop:]
+        return config
+
+
+class JsonParser(AbstractParser):
+    def parse_string(self, data: str) -> 'dict[str, Any]':
+        obj = _decoder.decode(data)
+        if type(obj) is list:
+            return _freeze_list(obj)  # type: ignore
+        return obj
+
+    def update_config(self, config: str, fields: 'dict[str, Any]') -> str:
+        if not config.strip():
+            values = {name: get_default_value(value) for name, value in fields.items()}
+            return json.dumps(values, ensure_ascii=False, indent=4)
+
+        # new members are inserted before closing braces of top level object
+        # and nested ones, with indentation of existing members,
+        # everything else is kept as is
+        return _ObjectUpdater(config).update(fields)
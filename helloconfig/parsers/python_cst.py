@@ -0,0 +1,149 @@
+"""
+libcst based part of python parser, used only for lossless rewriting
+of existing config files. Importing libcst is expensive, so this module
+is loaded on demand by `PythonParser.update_config`.
+"""
+
+from typing import Any, Callable, Optional
+
+import libcst
+
+from helloconfig.parsers.base import NameSpace, get_default_value
+
+
+def _update_dict(node: libcst.Dict, missing_fields: 'dict[str, Any]') -> libcst.Dict:
+    """Adds missing items to section written as dict literal"""
+
+    elements = list(node.elements)
+    present = set()
+    for n, element in enumerate(elements):
+        if not isinstance(element, libcst.DictElement) or \
+                not isinstance(element.key, libcst.SimpleString):
+            continue
+        key = element.key.evaluated_value
+        if not isinstance(key, str):
+            # bytes key, never name of field
+            continue
+        present.add(key)
+        nested_missing = missing_fields.get(key)
+        if isinstance(nested_missing, NameSpace) and isinstance(element.value, libcst.Dict):
+            elements[n] = element.with_changes(value=_update_dict(element.value, nested_missing))
+
+    new_elements = [
+        libcst.DictElement(
+            libcst.SimpleString(repr(name)),
+            libcst.parse_expression(repr(get_default_value(value))),
+        )
+        for name, value in missing_fields.items() if name not in present
+    ]
+    if not new_elements:
+        return node.with_changes(elements=elements)
+
+    # items are separated like existing ones, one per line in multiline dict
+    if isinstance(node.lbrace.whitespace_after, libcst.ParenthesizedWhitespace):
+        separator = libcst.Comma(whitespace_after=node.lbrace.whitespace_after)
+    else:
+        separator = libcst.Comma(whitespace_after=libcst.SimpleWhitespace(' '))
+    # trailing comma is kept
+    last_comma = elements[-1].comma if elements else libcst.MaybeSentinel.DEFAULT
+    if elements:
+        elements[-1] = elements[-1].with_changes(comma=separator)
+
+    new_elements = [element.with_changes(comma=separator) for element in new_elements]
+    new_elements[-1] = new_elements[-1].with_changes(comma=last_comma)
+    return node.with_changes(elements=[*elements, *new_elements])
+
+
+class FieldUpdater(libcst.CSTTransformer):
+    """
+    Adds missing fields to module and its nested classes in one traversal.
+    `missing_fields` values are new fields and `NameSpace` objects with
+    missing fields of nested classes, which already exist in config.
+    New statements are produced by `dump_field(name, value, stack)`.
+    """
+
+    def __init__(self, missing_fields: 'dict[str, Any]',
+                 dump_field: 'Callable[[str, Any, list], str]') -> None:
+        super().__init__()
+        self.dump_field = dump_field
+        # names assigned in every namespace being visited
+        self.stack: 'list[dict[str, Any]]' = [{}]
+        # missing fields of every namespace being visited, None if
+        # nothing is missing there, goes in parallel with `self.stack`
+        self.missing_stack: 'list[Optional[dict[str, Any]]]' = [missing_fields]
+
+    @property
+    def current_ns(self) -> 'dict[str, Any]':
+        return self.stack[-1]
+
+    def visit_Assign(self, node: libcst.Assign) -> 'bool | None':
+        # config was already parsed, so only assigned names are collected,
+        # values are neither evaluated nor visited
+        for assign_target in node.targets:
+            target = assign_target.target
+            if isinstance(target, libcst.Name):
+                self.current_ns[target.value] = None
+        return False
+
+    def leave_Assign(self, original_node: libcst.Assign, updated_node: libcst.Assign):
+        # nested namespace may be written as dict literal, like `db = {'url': ''}`
+        missing_ns = self.missing_stack[-1]
+        target = updated_node.targets[-1].target
+        if not missing_ns or not isinstance(target, libcst.Name):
+            return updated_node
+
+        nested_missing = missing_ns.get(target.value)
+        if isinstance(nested_missing, NameSpace) and isinstance(updated_node.value, libcst.Dict):
+            return updated_node.with_changes(value=_update_dict(updated_node.value, nested_missing))
+        return updated_node
+
+    def visit_ClassDef(self, node: libcst.ClassDef) -> 'bool | None':
+        name = node.name.value
+        namespace = self.current_ns[name] = {}
+        self.stack.append(namespace)
+
+        missing_ns = self.missing_stack[-1]
+        nested_missing = missing_ns.get(name) if missing_ns else None
+        if not isinstance(nested_missing, NameSpace):
+            nested_missing = None
+        self.missing_stack.append(nested_missing)
+
+    def leave_ClassDef(self, original_node: libcst.ClassDef, updated_node: libcst.ClassDef):
+        new_nodes = self._pop_missing_nodes()
+        if not new_nodes:
+            return updated_node
+
+        body = updated_node.body
+        if isinstance(body, libcst.SimpleStatementSuite):
+            # one line class body, like `class a: pass`
+            body = libcst.IndentedBlock([libcst.SimpleStatementLine(body.body)])
+
+        new_nodes = [
+            node.with_changes(leading_lines=[libcst.EmptyLine(indent=False)])
+            if isinstance(node, libcst.ClassDef) else node
+            for node in new_nodes
+        ]
+        return updated_node.with_changes(
+            body=body.with_changes(body=[*body.body, *new_nodes])
+        )
+
+    def leave_Module(self, original_node: libcst.Module, updated_node: libcst.Module):
+        new_nodes = self._pop_missing_nodes()
+        if not new_nodes:
+            return updated_node
+
+        new_nodes[0] = new_nodes[0].with_changes(leading_lines=[libcst.EmptyLine(indent=False)])
+        return updated_node.with_changes(body=[*updated_node.body, *new_nodes])
+
+    def _pop_missing_nodes(self) -> 'list[libcst.BaseStatement]':
+        missing_ns = self.missing_stack.pop()
+        current_ns = self.stack.pop()
+
+        if not missing_ns:
+            return []
+
+        return [
+            libcst.parse_statement(self.dump_field(name, value, []))
+            for name, value in missing_ns.items()
+            if name not in current_ns and not isinstance(value, NameSpace)
+        ]
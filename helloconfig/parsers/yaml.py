@@ -0,0 +1,114 @@
+from typing import Any
+
+import yaml
+
+from helloconfig.parsers.base import AbstractParser, NameSpace, get_default_value
+from helloconfig.immutable import replace_mutable_values
+
+
+# libyaml bindings are available only if PyYAML was built with them
+CSafeLoader = getattr(yaml, 'CSafeLoader', None)
+CSafeDumper = getattr(yaml, 'CSafeDumper', None)
+
+
+def _get_end(node: Any) -> int:
+    """Position after last value of node, block collections end after comments"""
+
+    while isinstance(node, (yaml.MappingNode, yaml.SequenceNode)) \
+            and not node.flow_style and node.value:
+        node = node.value[-1]
+        if isinstance(node, tuple):
+            node = node[1]
+    return node.end_mark.index
+
+
+def _get_line_end(config: str, pos: int) -> int:
+    if pos and config[pos - 1] == '\n':
+        # block scalar ends at start of next line
+        return pos - 1
+    end = config.find('\n', pos)
+    return len(config) if end == -1 else end
+
+
+class YamlParser(AbstractParser):
+    # set to True (on class or with constructor argument) to always use
+    # pure python PyYAML implementation, even if libyaml is available
+    pure_python = False
+
+    def __init__(self, pure_python: 'bool | None' = None) -> None:
+        if pure_python is not None:
+            self.pure_python = pure_python
+
+    @property
+    def loader(self) -> type:
+        if self.pure_python or CSafeLoader is None:
+            return yaml.SafeLoader
+        return CSafeLoader
+
+    @property
+    def dumper(self) -> type:
+        if self.pure_python or CSafeDumper is None:
+            return yaml.SafeDumper
+        return CSafeDumper
+
+    def parse_string(self, data: str) -> 'dict[str, Any]':
+        obj = yaml.load(data, Loader=self.loader)
+        return replace_mutable_values(obj)  # type: ignore
+
+    def _dump_values(self, fields: 'dict[str, Any]', **kwargs: Any) -> str:
+        values = {name: get_default_value(value) for name, value in fields.items()}
+        return yaml.dump(values, Dumper=self.dumper, indent=4, **kwargs)
+
+    def _insert_fields(self, config: str, node: Any, fields: 'dict[str, Any]',
+                       insertions: list, depth: int = 0) -> None:
+        """Collects (position, depth, text) of fields missing from mapping node"""
+
+        fields = dict(fields)
+        for key_node, value_node in node.value:
+            value = fields.get(key_node.value)
+            if isinstance(value, NameSpace) and isinstance(value_node, yaml.MappingNode):
+                self._insert_fields(config, value_node, value, insertions, depth + 1)
+                del fields[key_node.value]
+        if not fields:
+            return
+
+        if node.flow_style or not node.value:
+            # `{a: 1}`, members are added before closing brace
+            text = self._dump_values(fields, default_flow_style=True, width=2 ** 30)
+            text = text.strip()[1:-1]
+            pos = node.end_mark.index - 1
+            insertions.append((pos, depth, ', ' + text if node.value else text))
+            return
+
+        # block mapping, lines are added after its last value,
+        # with indentation of its first key
+        indent = ' ' * node.value[0][0].start_mark.column
+        text = ''.join(
+            '\n' + indent + line for line in self._dump_values(fields).splitlines()
+        )
+        insertions.append((_get_line_end(config, _get_end(node)), depth, text))
+
+    def update_config(self, config: str, fields: 'dict[str, Any]') -> str:
+        namespaces = {
+            name: value for name, value in fields.items() if isinstance(value, NameSpace)
+        }
+        if config and namespaces:
+            # missing fields of nested mappings are inserted into them,
+            # other lines of file are kept as is
+            root = yaml.compose(config, Loader=self.loader)
+            insertions: 'list[tuple[int, int, str]]' = []
+            self._insert_fields(config, root, namespaces, insertions)
+            # at the same position text of nested mapping goes first
+            for pos, _, text in sorted(insertions, key=lambda item: (item[0], -item[1]),
+                                       reverse=True):
+                config = config[:pos] + text + config[pos:]
+
+            fields = {name: value for name, value in fields.items() if name not in namespaces}
+            if not fields:
+                return config
+
+        values = {name: get_default_value(value) for name, value in fields.items()}
+        fields_str = yaml.dump(values, Dumper=self.dumper, indent=4)
+        if config:
+            return config + '\n\n' + fields_str
+        return fields_str
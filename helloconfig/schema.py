@@ -0,0 +1,223 @@
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping, NamedTuple, Optional
+from inspect import isclass
+from dataclasses import (
+    MISSING, is_dataclass,
+    Field as DataclassField,
+    fields as dataclass_fields,
+)
+
+from helloconfig.validation import FieldValidator
+from helloconfig.parsers.base import NameSpace, get_default_value
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in ('1', 'true', 'yes', 'on'):
+        return True
+    if lowered in ('0', 'false', 'no', 'off', ''):
+        return False
+    raise ValueError(f'Invalid boolean value {value!r}')
+
+
+# converters of string values (from environment, command line, etc.)
+# to field type, only for scalar types, other fields have no converter
+_converters: 'dict[Any, Callable[[str], Any]]' = {
+    str: str,
+    int: int,
+    float: float,
+    bool: parse_bool,
+    bytes: str.encode,
+}
+
+
+def get_type_name(field_type: Any) -> str:
+    if isclass(field_type) and not getattr(field_type, '__args__', None):
+        return field_type.__name__
+    return repr(field_type).replace('typing.', '')
+
+
+class FieldSchema(NamedTuple):
+    name: str
+    type: Any
+    field: DataclassField
+    required: bool
+    converter: 'Optional[Callable[[str], Any]]'
+    schema: 'Optional[ConfigSchema]'
+
+    @classmethod
+    def from_field(cls, field: DataclassField) -> 'FieldSchema':
+        # nested classes are kept in class namespace, so they are
+        # defaults of their own fields, but still must be in config
+        section_cls: Any = field.type if is_dataclass(field.type) else None
+        if isclass(field.default) and is_dataclass(field.default):
+            section_cls = field.default
+
+        required = section_cls is not None or (
+            field.default is MISSING and field.default_factory is MISSING
+        )
+
+        return cls(
+            name=field.name,
+            type=field.type,
+            field=field,
+            required=required,
+            converter=_converters.get(field.type),
+            schema=None if section_cls is None else ConfigSchema.from_dataclass(section_cls),
+        )
+
+    @property
+    def has_default(self) -> bool:
+        return (
+            self.field.default is not MISSING
+            or self.field.default_factory is not MISSING
+        )
+
+    def get_default(self) -> Any:
+        """Value written to sample config file for this field"""
+        return get_default_value(self.field)
+
+
+class ConfigSchema(NamedTuple):
+    """
+    Fields of config class, computed once when class is created.
+    Nested sections have their own schemas.
+    """
+
+    data_cls: type
+    fields: 'Mapping[str, FieldSchema]'
+    required: 'frozenset[str]'
+    # dataclass fields, in form accepted by `AbstractParser.update_config`
+    dataclass_fields: 'Mapping[str, DataclassField]'
+    key: str
+    # declared in section body, run by loader
+    validators: 'tuple[FieldValidator, ...]'
+
+    @classmethod
+    def from_dataclass(cls, data_cls: type) -> 'ConfigSchema':
+        schema_fields = {
+            field.name: FieldSchema.from_field(field)
+            for field in dataclass_fields(data_cls)
+        }
+
+        key_parts = []
+        for name, field in schema_fields.items():
+            if field.schema is not None:
+                key_parts.append(f'{name}:{{{field.schema.key}}}')
+            else:
+                key_parts.append(f'{name}:{field.type!r}')
+
+        validators = tuple(
+            value for value in vars(data_cls).values()
+            if isinstance(value, FieldValidator)
+        )
+        for validator in validators:
+            unknown = set(validator.fields).difference(schema_fields)
+            if unknown:
+                raise ValueError(f'{validator!r} refers to unknown fields {unknown!r} '
+                                 f'of {data_cls.__qualname__}')
+
+        return cls(
+            data_cls=data_cls,
+            fields=MappingProxyType(schema_fields),
+            required=frozenset(
+                name for name, field in schema_fields.items() if field.required
+            ),
+            dataclass_fields=MappingProxyType({
+                name: field.field for name, field in schema_fields.items()
+            }),
+            key=','.join(key_parts),
+            validators=validators,
+        )
+
+    def iter_schemas(self) -> 'Iterator[ConfigSchema]':
+        """This schema and schemas of all nested sections"""
+
+        schemas: 'list[ConfigSchema]' = [self]
+        while schemas:
+            schema = schemas.pop()
+            yield schema
+            schemas.extend(field.schema for field in schema.fields.values() if field.schema)
+
+    def iter_types(self) -> Iterator[Any]:
+        """All field types, including nested sections and type arguments"""
+
+        stack = [
+            field.type
+            for schema in self.iter_schemas()
+            for field in schema.fields.values()
+        ]
+
+        while stack:
+            field_type = stack.pop()
+            yield field_type
+            stack.extend(getattr(field_type, '__args__', None) or ())
+
+    def get_missing_fields(self, raw_obj: 'Mapping[str, Any]') -> 'dict[str, Any]':
+        """
+        Required fields absent from parsed config. Nested namespaces, which
+        exist in config, but lack some fields, are returned as `NameSpace`
+        with their missing fields.
+        """
+
+        missing = {}
+        for name, field in self.fields.items():
+            if name not in raw_obj:
+                if field.required:
+                    missing[name] = field.field
+            elif field.schema is not None and isinstance(raw_obj[name], dict):
+                nested_missing = field.schema.get_missing_fields(raw_obj[name])
+                if nested_missing:
+                    missing[name] = NameSpace(nested_missing)
+        return missing
+
+    def get_env_index(self, prefix: str = '', separator: str = '__',
+                      ) -> 'dict[str, tuple[tuple[str, ...], FieldSchema]]':
+        """
+        Environment variable names of all fields, including nested ones
+        (`<prefix>SECTION__FIELD`), mapped to field path and field schema
+        """
+
+        index: 'dict[str, tuple[tuple[str, ...], FieldSchema]]' = {}
+        stack: 'list[tuple[tuple[str, ...], ConfigSchema]]' = [((), self)]
+        while stack:
+            path, schema = stack.pop()
+            for name, field in schema.fields.items():
+                field_path = path + (name,)
+                if field.schema is not None:
+                    stack.append((field_path, field.schema))
+                    continue
+
+                env_name = prefix + separator.join(field_path).upper()
+                if env_name in index:
+                    raise ValueError(f'Fields {".".join(index[env_name][0])!r} and '
+                                     f'{".".join(field_path)!r} have same '
+                                     f'environment variable {env_name!r}')
+                index[env_name] = (field_path, field)
+        return index
+
+    def to_dict(self) -> 'dict[str, Any]':
+        """Description of schema made of plain values, for tooling"""
+
+        result = {}
+        for name, field in self.fields.items():
+            description: 'dict[str, Any]' = {
+                'type': 'section' if field.schema else get_type_name(field.type),
+                'required': field.required,
+            }
+            if field.schema is not None:
+                description['fields'] = field.schema.to_dict()
+            elif field.has_default:
+                description['default'] = field.get_default()
+            result[name] = description
+        return result
+
+
+def get_field_paths(missing: 'Mapping[str, Any]', prefix: str = '') -> Iterator[str]:
+    """Dotted paths of fields returned by `ConfigSchema.get_missing_fields`"""
+
+    for name, value in missing.items():
+        if isinstance(value, NameSpace):
+            yield from get_field_paths(value, f'{prefix}{name}.')
+        else:
+            yield prefix + name
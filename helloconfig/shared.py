@@ -0,0 +1,191 @@
+import time
+import pickle
+import struct
+
+from typing import Any, Optional, Type
+from multiprocessing.shared_memory import SharedMemory
+
+from helloconfig.schema import ConfigSchema
+
+
+# magic, version, payload size. Version is odd while snapshot is written
+_header = struct.Struct('<4sQQ')
+_MAGIC = b'HCFG'
+
+
+def get_raw_obj(data_obj: Any, schema: ConfigSchema) -> 'dict[str, Any]':
+    """Field values of config (or section) object, with sections as dicts"""
+
+    return {
+        name: (
+            get_raw_obj(getattr(data_obj, name), field.schema)
+            if field.schema is not None else getattr(data_obj, name)
+        )
+        for name, field in schema.fields.items()
+    }
+
+
+def _get_buffer(shm: SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:  # pragma: no cover
+        raise ValueError(f'Shared memory segment {shm.name!r} is closed')
+    return buf
+
+
+class SharedConfigPublisher:
+    """
+    Publishes snapshots of loaded config to shared memory segment, which
+    is read by `SharedConfigReader` in other processes. Segment has fixed
+    size, snapshot must fit into it. Only one publisher per segment.
+    """
+
+    def __init__(self, config_cls: type, size: int = 1 << 20,
+                 name: 'Optional[str]' = None) -> None:
+        self.config_cls = config_cls
+        self.shm = SharedMemory(name, create=True, size=_header.size + size)
+        self.buf = _get_buffer(self.shm)
+        self.version = 0
+        _header.pack_into(self.buf, 0, _MAGIC, 0, 0)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def publish(self, config) -> int:
+        """Writes new snapshot, returns its version"""
+
+        if not isinstance(config, self.config_cls):
+            raise TypeError(f'Expected {self.config_cls.__name__} object, '
+                            f'got {type(config).__name__}')
+
+        payload = pickle.dumps(
+            get_raw_obj(config, config._schema), protocol=pickle.HIGHEST_PROTOCOL
+        )
+        if _header.size + len(payload) > self.shm.size:
+            raise ValueError(f'Config snapshot ({len(payload)} bytes) does not '
+                             f'fit into shared memory segment ({self.shm.size} bytes)')
+
+        # readers retry while version is odd or changed during read
+        buf = self.buf
+        _header.pack_into(buf, 0, _MAGIC, self.version + 1, 0)
+        buf[_header.size:_header.size + len(payload)] = payload
+        self.version += 2
+        _header.pack_into(buf, 0, _MAGIC, self.version, len(payload))
+        return self.version
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        """Removes segment, readers attached to it keep their mapping"""
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.unlink()
+
+
+class SharedConfigReader:
+    """
+    Attaches to segment of `SharedConfigPublisher`. Snapshot is pickled raw
+    config object, it's unpickled from read-only view of shared memory,
+    so payload isn't copied into bytes first, but every reader still builds
+    its own config objects. Config is rebuilt only if newer one was published.
+
+    Before python 3.13 `SharedMemory` can't be attached without registering
+    segment in resource tracker, so reader registers it too. Tracker of
+    process, which is not a child of publisher, removes segment (with
+    warning about leak), when that process exits, so there readers should
+    be started by publisher process, like pool workers are.
+    """
+
+    def __init__(self, config_cls: type, name: str, timeout: float = 1.0) -> None:
+        self.config_cls: Type[Any] = config_cls
+        # seconds to wait for snapshot being published
+        self.timeout = timeout
+        try:
+            # segment is owned by publisher, reader must not remove it on exit
+            self.shm = SharedMemory(name, track=False)  # type: ignore
+        except TypeError:
+            # before python 3.13 segment is registered in resource tracker,
+            # which is shared with publisher by pool workers and other children
+            self.shm = SharedMemory(name)
+        self.buf = _get_buffer(self.shm).toreadonly()
+
+        magic, _, _ = _header.unpack_from(self.buf)
+        if magic != _MAGIC:
+            self.close()
+            raise ValueError(f'Shared memory segment {name!r} has no config')
+
+        self.loaded_version = 0
+        self.config = None
+
+    @property
+    def version(self) -> int:
+        """Version of latest complete snapshot, 0 if nothing published"""
+        return _header.unpack_from(self.buf)[1] & ~1
+
+    @property
+    def changed(self) -> bool:
+        return self.version != self.loaded_version
+
+    def get_raw(self) -> 'tuple[int, dict[str, Any]]':
+        """Version and raw object of latest snapshot"""
+
+        deadline = time.monotonic() + self.timeout
+        delay = 0.0001
+        while True:
+            header = _header.unpack_from(self.buf)
+            version = header[1]
+            if version == 0:
+                raise LookupError('Config was not published yet')
+            if not version % 2:
+                raw_obj = self._read(header)
+                if raw_obj is not None:
+                    return version, raw_obj
+
+            # snapshot is being written, publisher is waited with backoff
+            if time.monotonic() > deadline:
+                raise TimeoutError('Config is being published too often to read it')
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
+
+    def _read(self, header: 'tuple[bytes, int, int]') -> 'Optional[dict[str, Any]]':
+        """Unpickled snapshot, None if it was rewritten while reading"""
+
+        size = header[2]
+        try:
+            with self.buf[_header.size:_header.size + size] as payload:
+                raw_obj = pickle.loads(payload)
+        except Exception:
+            # header is not written atomically, new version may be read
+            # with old size, so error is real only if header is the same
+            if _header.unpack_from(self.buf) == header:
+                raise
+            return None
+
+        if _header.unpack_from(self.buf) != header:
+            return None
+        return raw_obj
+
+    def get(self):
+        """Latest published config, loaded again only if it changed"""
+
+        if self.config is None or self.changed:
+            version, raw_obj = self.get_raw()
+            self.config = self.config_cls.from_obj(raw_obj)
+            self.loaded_version = version
+        return self.config
+
+    def close(self):
+        self.buf.release()
+        self.shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -0,0 +1,145 @@
+import re
+
+from typing import Any, Callable, Optional, Pattern, Union
+
+from helloconfig.exceptions import ValidationError
+
+
+class FieldValidator:
+    """
+    Validator declared in config class (or nested section) body.
+    Collected by `ConfigSchema`, validators of every section are
+    compiled into loader, so they run while config is loaded.
+    """
+
+    __slots__ = ('func', 'fields', 'pre')
+
+    def __init__(self, func: 'Callable[[Any], Any]', fields: 'tuple[str, ...]',
+                 pre: bool = False) -> None:
+        if not fields:
+            raise TypeError('At least one field name must be specified')
+        self.func = func
+        self.fields = fields
+        self.pre = pre
+
+    def __repr__(self) -> str:
+        name = getattr(self.func, '__qualname__', self.func)
+        return f'{self.__class__.__name__}({name}, fields={self.fields!r})'
+
+    def __call__(self, value):
+        return self.func(value)
+
+
+def validate(*fields: str, pre: bool = False):
+    """
+    Decorator for validator function in config class body. Function receives
+    field value (whole list for list fields, so items are checked in one call)
+    and returns it, possibly corrected, or raises `ValueError`. With `pre=True`
+    validator receives raw value, before it's converted to field type.
+
+        class Config(PythonConfig):
+            port: int
+
+            @validate('port')
+            def check_port(value):
+                if not 0 < value < 65536:
+                    raise ValueError('port must be in range 1-65535')
+                return value
+    """
+
+    def decorator(func: 'Callable[[Any], Any]') -> FieldValidator:
+        return FieldValidator(func, fields, pre)
+    return decorator
+
+
+def _is_sequence(value) -> bool:
+    return not isinstance(value, (str, bytes)) and hasattr(value, '__len__')
+
+
+def _get_bounds(value):
+    if hasattr(value, 'ndim'):
+        return value.min(), value.max()  # numpy array
+    return min(value), max(value)
+
+
+def validate_range(*fields: str, min: Any = None, max: Any = None) -> FieldValidator:
+    """
+    Checks that value is within bounds (inclusive). For lists all items
+    are checked with builtin `min()` / `max()`, without python call per item.
+    """
+
+    lower, upper = min, max
+    del min, max
+
+    def check_range(value):
+        if _is_sequence(value):
+            if not len(value):
+                return value
+            lowest, highest = _get_bounds(value)
+        else:
+            lowest = highest = value
+
+        if lower is not None and lowest < lower:
+            raise ValidationError(f'Value {lowest!r} is less than {lower!r}')
+        if upper is not None and highest > upper:
+            raise ValidationError(f'Value {highest!r} is greater than {upper!r}')
+        return value
+
+    return FieldValidator(check_range, fields)
+
+
+def validate_length(*fields: str, min: Optional[int] = None,
+                    max: Optional[int] = None) -> FieldValidator:
+    """Checks length of value (string, list, dict)"""
+
+    lower, upper = min, max
+    del min, max
+
+    def check_length(value):
+        length = len(value)
+        if lower is not None and length < lower:
+            raise ValidationError(f'Length {length} is less than {lower}')
+        if upper is not None and length > upper:
+            raise ValidationError(f'Length {length} is greater than {upper}')
+        return value
+
+    return FieldValidator(check_length, fields)
+
+
+def validate_pattern(*fields: str, pattern: 'Union[str, Pattern[str]]') -> FieldValidator:
+    """
+    Checks that string value fully matches regular expression. For lists
+    all items are matched with `map()` over compiled pattern method.
+    """
+
+    regex = re.compile(pattern)
+
+    def check_pattern(value):
+        if isinstance(value, str):
+            if regex.fullmatch(value) is None:
+                raise ValidationError(f'Value {value!r} does not match {regex.pattern!r}')
+            return value
+
+        if not all(map(regex.fullmatch, value)):
+            bad_value = next(item for item in value if not regex.fullmatch(item))
+            raise ValidationError(f'Value {bad_value!r} does not match {regex.pattern!r}')
+        return value
+
+    return FieldValidator(check_pattern, fields)
+
+
+def get_validator_schema(validators: 'tuple[FieldValidator, ...]'):
+    """
+    dataclass_factory schema with validators of one section, so they
+    run in field parsers, generated by factory for this section
+    """
+
+    from dataclass_factory import Schema, validate as df_validate
+
+    namespace = {}
+    for n, validator in enumerate(validators):
+        def method(self, data, _func=validator.func):
+            return _func(data)
+        namespace[f'validator_{n}'] = df_validate(*validator.fields, pre=validator.pre)(method)
+
+    return type('ValidatorSchema', (Schema,), namespace)()
@@ -0,0 +1,143 @@
+import os
+import hashlib
+import threading
+
+from typing import Any, Callable, Optional, Tuple
+
+from helloconfig.diff import ConfigSubscriptions
+
+
+class ConfigWatcher:
+    """
+    Reloads config when file changes.
+
+    File is polled with os.stat, and re-parsed only if its mtime or size
+    changed and contents hash differs from last loaded one. Every reload
+    creates new config object, which replaces `config` with single
+    reference assignment, so readers never see partially updated
+    config and no locks are taken on read path. To read several values
+    from the same snapshot, keep reference to `watcher.config`.
+
+    Failed reload (parse error, `FieldsMissing`, invalid values) keeps
+    last good snapshot and passes exception to `on_error`.
+
+    Callbacks added with `subscribe` run after reload only if their
+    field or section changed, errors of callbacks are passed to `on_error`.
+    """
+
+    def __init__(
+            self,
+            config_cls: type,
+            path: str,
+            interval: float = 1.0,
+            on_reload: 'Optional[Callable[[Any], Any]]' = None,
+            on_error: 'Optional[Callable[[Exception], Any]]' = None,
+    ) -> None:
+        self.config_cls = config_cls
+        self.path = path
+        self.interval = interval
+        self.on_reload = on_reload
+        self.on_error = on_error
+
+        self._stat_key: 'Optional[Tuple[int, int]]' = None
+        self._digest: 'Optional[bytes]' = None
+        self._stopped = threading.Event()
+        self._thread: 'Optional[threading.Thread]' = None
+        self.subscriptions = ConfigSubscriptions(config_cls)
+
+        # initial load errors are raised to caller, as from_file does
+        with open(path, encoding='utf-8') as file:
+            stat_key = self._get_stat_key(os.fstat(file.fileno()))
+            data = file.read()
+        self.config = config_cls.from_file(path)
+        self._stat_key = stat_key
+        self._digest = self._get_digest(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @staticmethod
+    def _get_stat_key(stat: os.stat_result) -> 'Tuple[int, int]':
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _get_digest(data: str) -> bytes:
+        return hashlib.blake2b(data.encode('utf-8')).digest()
+
+    def subscribe(self, path: str, callback: 'Callable[[Any], Any]') -> 'Callable[[Any], Any]':
+        """Callback receives new config, when field (or section) at path changed"""
+        return self.subscriptions.subscribe(path, callback)
+
+    def start(self) -> 'ConfigWatcher':
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f'ConfigWatcher({self.path!r})',
+                daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def check(self) -> bool:
+        """Reloads config if file was changed. Returns True if config replaced"""
+
+        try:
+            stat_key = self._get_stat_key(os.stat(self.path))
+        except OSError as exc:
+            self._report(exc)
+            return False
+
+        if stat_key == self._stat_key:
+            return False
+
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Reads file and replaces config if contents changed"""
+
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                stat_key = self._get_stat_key(os.fstat(file.fileno()))
+                data = file.read()
+
+            digest = self._get_digest(data)
+            if digest == self._digest:
+                self._stat_key = stat_key
+                return False
+
+            # from_str never writes to file, unlike from_file
+            config = self.config_cls.from_str(data)
+        except Exception as exc:
+            self._report(exc)
+            return False
+
+        previous = self.config
+        self.config = config
+        self._stat_key = stat_key
+        self._digest = digest
+
+        if self.on_reload is not None:
+            # exception must not stop polling thread, config is replaced anyway
+            try:
+                self.on_reload(config)
+            except Exception as exc:
+                self._report(exc)
+        if self.subscriptions:
+            self.subscriptions.notify(previous, config, self._report)
+        return True
+
+    def _report(self, exc: Exception) -> None:
+        if self.on_error is not None:
+            self.on_error(exc)
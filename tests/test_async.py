@@ -0,0 +1,62 @@
+import os
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from helloconfig import PythonConfig, FieldsMissing
+
+
+class Config(PythonConfig):
+    NUMBER: int
+    STRING: str
+
+
+def test_from_str_async():
+    config = asyncio.run(Config.from_str_async('NUMBER = 1\nSTRING = "a"'))
+
+    assert (config.NUMBER, config.STRING) == (1, 'a')
+
+    with pytest.raises(FieldsMissing):
+        asyncio.run(Config.from_str_async('NUMBER = 1'))
+
+
+def test_from_file_async(tmp_path):
+    paths = [str(tmp_path / f'config_{n}.pyi') for n in range(8)]
+    for n, path in enumerate(paths):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(f'NUMBER = {n}\nSTRING = "{n}"')
+
+    async def load_all():
+        return await asyncio.gather(*(
+            Config.from_file_async(path) for path in paths
+        ))
+
+    configs = asyncio.run(load_all())
+
+    assert [c.NUMBER for c in configs] == list(range(8))
+
+
+def test_missing_file_async(tmp_filename):
+    with pytest.raises(FieldsMissing):
+        asyncio.run(Config.from_file_async(tmp_filename))
+
+    assert os.path.exists(tmp_filename)
+
+
+def test_custom_executor():
+    submitted = []
+
+    class Executor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(fn)
+            return super().submit(fn, *args, **kwargs)
+
+    with Executor() as executor:
+        config = asyncio.run(
+            Config.from_str_async('NUMBER = 1\nSTRING = ""', executor)
+        )
+
+    assert len(submitted) == 1
+    assert config.NUMBER == 1
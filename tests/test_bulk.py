@@ -0,0 +1,62 @@
+import pytest
+
+from helloconfig import DotEnvConfig, YamlConfig, FieldsMissing
+
+
+class Config(YamlConfig):
+    NUMBER: int
+    STRING: str
+
+
+def make_files(tmp_path, count):
+    paths = []
+    for n in range(count):
+        path = tmp_path / f'tenant_{n}.yaml'
+        path.write_text(f'NUMBER: {n}\nSTRING: tenant_{n}\n', encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+@pytest.mark.parametrize('mode', ['process', 'thread'])
+def test_load_many(tmp_path, mode):
+    paths = make_files(tmp_path, 20)
+
+    results = list(Config.load_many(paths, workers=2, mode=mode))
+
+    assert sorted(r.path for r in results) == sorted(paths)
+    for result in results:
+        assert result.error is None
+        assert result.path.endswith(f'tenant_{result.config.NUMBER}.yaml')
+        assert result.config.STRING == f'tenant_{result.config.NUMBER}'
+
+
+def test_errors_per_path(tmp_path):
+    good, = make_files(tmp_path, 1)
+    broken = tmp_path / 'broken.yaml'
+    broken.write_text('NUMBER: [\n', encoding='utf-8')
+
+    results = {
+        r.path: r for r in
+        Config.load_many([good, str(broken)], mode='thread')
+    }
+
+    assert results[good].config.NUMBER == 0
+    assert results[str(broken)].config is None
+    assert results[str(broken)].error is not None
+
+
+def test_missing_file(tmp_path):
+    class EnvConfig(DotEnvConfig):
+        NUMBER: int
+
+    missing = tmp_path / 'missing.env'
+
+    result, = EnvConfig.load_many([str(missing)], mode='process')
+
+    assert isinstance(result.error, FieldsMissing)
+    assert missing.exists()
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        list(Config.load_many([], mode='fiber'))
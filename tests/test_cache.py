@@ -0,0 +1,72 @@
+import os
+
+from helloconfig import ConfigCache, PythonConfig, YamlConfig
+
+
+class Config(PythonConfig):
+    NUMBER: int
+    ITEMS: list
+
+
+class OtherConfig(PythonConfig):
+    NUMBER: int
+
+
+def write(path, data, mtime_ns=None):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_hit_and_miss(tmp_path):
+    path = str(tmp_path / 'config.pyi')
+    write(path, 'NUMBER = 1\nITEMS = [1, 2]\n')
+    cache = ConfigCache(str(tmp_path / 'cache'))
+
+    first = Config.from_file(path, cache=cache)
+    second = Config.from_file(path, cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.NUMBER == second.NUMBER == 1
+    assert list(second.ITEMS) == [1, 2]
+
+    OtherConfig.from_file(path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_stale_entry_not_served(tmp_path):
+    path = str(tmp_path / 'config.pyi')
+    cache = ConfigCache(str(tmp_path / 'cache'))
+
+    write(path, 'NUMBER = 1\nITEMS = []\n')
+    mtime_ns = os.stat(path).st_mtime_ns
+    Config.from_file(path, cache=cache)
+
+    # same size and mtime, only content hash differs
+    write(path, 'NUMBER = 2\nITEMS = []\n', mtime_ns)
+    config = Config.from_file(path, cache=cache)
+
+    assert config.NUMBER == 2
+    assert (cache.hits, cache.misses, cache.stale) == (0, 2, 1)
+
+    assert Config.from_file(path, cache=cache).NUMBER == 2
+    assert cache.hits == 1
+
+
+def test_broken_entry(tmp_path):
+    path = str(tmp_path / 'config.yaml')
+    cache_dir = tmp_path / 'cache'
+    cache = ConfigCache(str(cache_dir))
+
+    class Config(YamlConfig):
+        NUMBER: int
+
+    write(path, 'NUMBER: 1\n')
+    Config.from_file(path, cache=cache)
+
+    for entry in cache_dir.iterdir():
+        entry.write_bytes(b'garbage')
+
+    assert Config.from_file(path, cache=cache).NUMBER == 1
+    assert (cache.hits, cache.stale) == (0, 1)
@@ -0,0 +1,121 @@
+import traceback
+
+from typing import Dict, List, Optional
+from dataclasses import asdict, field
+
+import pytest
+
+from helloconfig import FieldsMissing, JsonConfig, validate_range
+from helloconfig.immutable import ImmutableArray
+from helloconfig.parsers import JsonParser
+
+
+def make_config_cls(compiled: bool):
+    class Config(JsonConfig):
+        compiled_loader = compiled
+
+        host: str
+        tags: list
+        weights: List[float]
+        port: int = 8080
+        ratio: float = 0.5
+        debug: bool = False
+        timeout: Optional[int] = None
+
+        port_range = validate_range('port', min=1)
+
+        class database:
+            url: str
+            options: Dict[str, int] = field(default_factory=dict)
+
+            class retry:
+                attempts: int
+
+    return Config
+
+
+Config = make_config_cls(compiled=False)
+CompiledConfig = make_config_cls(compiled=True)
+
+
+VALID = [
+    '{"host": "a", "tags": [1], "weights": [1, 0.5], '
+    '"database": {"url": "db", "retry": {"attempts": 3}}}',
+
+    '{"host": "a", "tags": [], "weights": [], "port": "80", "ratio": 1, '
+    '"debug": 1, "timeout": 5, "unknown": 1, '
+    '"database": {"url": "db", "options": {"a": "1"}, "retry": {"attempts": 3.5}}}',
+]
+
+INVALID = [
+    ('{"host": "a", "tags": [], "weights": [], '
+     '"database": {"url": "db", "retry": {}}}', FieldsMissing),
+    ('{"host": 1, "tags": [], "weights": [], '
+     '"database": {"url": "db", "retry": {"attempts": 1}}}', ValueError),
+    ('{"host": "a", "tags": [], "weights": ["x"], '
+     '"database": {"url": "db", "retry": {"attempts": 1}}}', ValueError),
+    ('{"host": "a", "tags": [], "weights": [], "port": 0, '
+     '"database": {"url": "db", "retry": {"attempts": 1}}}', ValueError),
+]
+
+
+@pytest.mark.parametrize('data', VALID)
+def test_same_result(data):
+    expected = Config.from_str(data)
+    config = CompiledConfig.from_str(data)
+
+    assert asdict(config._data_object) == asdict(expected._data_object)
+    assert type(config.database) is CompiledConfig._dataclass.__annotations__['database']
+    assert type(config.tags) is type(expected.tags)
+
+
+@pytest.mark.parametrize('config_cls', [Config, CompiledConfig], ids=['default', 'compiled'])
+def test_missing_section(config_cls):
+    with pytest.raises(FieldsMissing, match='database'):
+        config_cls.from_str('{"host": "a", "tags": [], "weights": []}')
+
+    with pytest.raises(FieldsMissing, match='retry'):
+        config_cls.from_str('{"host": "a", "tags": [], "weights": [], "database": {"url": "db"}}')
+
+
+def test_section_not_mapping():
+    with pytest.raises(ValueError, match='Expected mapping'):
+        CompiledConfig.from_str('{"host": "a", "tags": [], "weights": [], "database": [1]}')
+
+
+@pytest.mark.parametrize('data, error', INVALID)
+def test_same_errors(data, error):
+    with pytest.raises(error):
+        Config.from_str(data)
+    with pytest.raises(error):
+        CompiledConfig.from_str(data)
+
+
+def test_generated_source_in_traceback():
+    raw_obj = JsonParser().parse_string(INVALID[1][0])
+    with pytest.raises(ValueError) as exc_info:
+        CompiledConfig.from_obj(raw_obj)
+
+    formatted = ''.join(traceback.format_exception(exc_info.value))
+    assert '<helloconfig loader' in formatted
+    assert 'raise ValueError' in formatted
+
+
+def test_lazy_sections_and_arrays():
+    class LazyConfig(JsonConfig):
+        compiled_loader = True
+        lazy_sections = True
+        numeric_arrays = 'array'
+
+        ids: List[int]
+
+        class section:
+            values: List[float]
+
+    config = LazyConfig.from_str('{"ids": [1, 2], "section": {"values": [1]}}')
+
+    assert type(config.ids) is ImmutableArray
+    assert config.section.values == [1.0]
+
+    with pytest.raises(FieldsMissing):
+        LazyConfig.from_str('{"ids": [], "section": {}}')
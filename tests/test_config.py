@@ -1,3 +1,5 @@
+import copy
+
 from os import remove
 from tempfile import NamedTemporaryFile, mktemp
 from dataclasses import dataclass
@@ -113,16 +115,60 @@ def test_nested_classes():
 
 def test_attrs():
     @dataclass
-    class OneFielder:
-        hello: str = 'hi'
+    class Data:
+        NUMBER: int = 1
+        STRING: str = 'hi'
 
     config = Config()
-    config._set_data(OneFielder())
+    config._set_data(Data())
 
-    config.hello
+    assert config.STRING == 'hi'
+    assert config.DEFAULT_STRING == 'hello'
 
     with pytest.raises(AttributeError):
         config.bye
 
     with pytest.raises(TypeError):
-        config.hello = 'bye'  # type: ignore
+        config.STRING = 'bye'  # type: ignore
+
+    with pytest.raises(AttributeError):
+        config.__dict__
+
+
+def test_class_defaults():
+    class DefaultsConfig(PythonConfig):
+        required: str
+        port: int = 8080
+
+        class db:
+            url: str
+
+    assert DefaultsConfig.port == 8080
+    assert DefaultsConfig.db.__name__ == 'db'
+    with pytest.raises(AttributeError):
+        DefaultsConfig.required
+
+    config = DefaultsConfig.from_obj({'required': 'a', 'port': 1, 'db': {'url': 'x'}})
+    assert config.port == 1
+    assert config.db.url == 'x'
+
+
+def test_copy():
+    config = NestedConfig.from_str(NESTED_CFG_FILE)
+
+    assert copy.copy(config) is config
+    assert copy.deepcopy(config) is config
+    assert copy.deepcopy({'config': config})['config'] is config
+
+
+def test_loader_cached():
+    class AnotherConfig(Config):
+        OTHER: str
+
+    first = Config.from_obj({'NUMBER': 1, 'STRING': 'a'})
+    loader = Config._get_loader()
+    second = Config.from_obj({'NUMBER': 2, 'STRING': 'b'})
+
+    assert Config._get_loader() is loader
+    assert AnotherConfig._get_loader() is not loader
+    assert (first.NUMBER, second.NUMBER) == (1, 2)
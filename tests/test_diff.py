@@ -0,0 +1,93 @@
+from typing import List
+
+import pytest
+
+from helloconfig import ConfigSubscriptions, JsonConfig
+
+
+class Config(JsonConfig):
+    name: str
+    weights: List[float]
+
+    class db:
+        url: str
+        options: dict
+
+        class pool:
+            size: int = 4
+
+    class cache:
+        ttl: int = 60
+
+
+DATA = {
+    'name': 'a',
+    'weights': [0.5, 1.0],
+    'db': {'url': 'sqlite://', 'options': {'timeout': 1}, 'pool': {}},
+    'cache': {},
+}
+
+
+def load(**changes):
+    data = dict(DATA)
+    for path, value in changes.items():
+        *sections, name = path.split('__')
+        target = data
+        for section in sections:
+            target[section] = target = dict(target[section])
+        target[name] = value
+    return Config.from_obj(data)
+
+
+def test_diff():
+    old = load()
+
+    assert old.diff(load()) == []
+    assert old.diff(old) == []
+    assert old.diff(load(name='b')) == ['name']
+    assert old.diff(load(db__pool__size=8, cache__ttl=1)) == ['db.pool.size', 'cache.ttl']
+    assert old.diff(load(db__options={'timeout': 2})) == ['db.options']
+
+    with pytest.raises(TypeError):
+        old.diff(object())
+
+
+def test_subscriptions():
+    subscriptions = ConfigSubscriptions(Config)
+    calls = []
+
+    subscriptions.subscribe('db', lambda config: calls.append('db'))
+    subscriptions.subscribe('db.pool.size', lambda config: calls.append('db.pool.size'))
+    subscriptions.subscribe('cache', lambda config: calls.append('cache'))
+
+    old = load()
+    new = load(db__url='postgres://', db__pool__size=8)
+    assert subscriptions.notify(old, new) == ['db.url', 'db.pool.size']
+    assert calls == ['db', 'db.pool.size']
+
+    calls.clear()
+    subscriptions.notify(new, load(db__url='postgres://', db__pool__size=8))
+    assert calls == []
+
+    with pytest.raises(ValueError):
+        subscriptions.subscribe('db.missing', print)
+
+
+def test_callback_errors():
+    subscriptions = ConfigSubscriptions(Config)
+    errors = []
+    calls = []
+
+    def fail(config):
+        raise RuntimeError('failed')
+
+    subscriptions.subscribe('name', fail)
+    subscriptions.subscribe('name', calls.append)
+
+    new = load(name='b')
+    subscriptions.notify(load(), new, errors.append)
+    assert calls == [new]
+    assert isinstance(errors[0], RuntimeError)
+
+    with pytest.raises(RuntimeError):
+        subscriptions.notify(load(), new)
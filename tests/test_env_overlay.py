@@ -0,0 +1,82 @@
+from typing import List
+
+import pytest
+
+from helloconfig import FieldsMissing, JsonConfig
+
+
+class Config(JsonConfig):
+    env_prefix = 'APP_'
+
+    name: str
+    tags: List[str]
+    workers: int = 1
+
+    class db:
+        url: str
+        debug: bool = False
+
+
+def test_index():
+    assert set(Config._env_index) == {
+        'APP_NAME', 'APP_WORKERS', 'APP_TAGS', 'APP_DB__URL', 'APP_DB__DEBUG',
+    }
+    assert Config._env_index['APP_DB__URL'][0] == ('db', 'url')
+
+
+def test_overlay(monkeypatch):
+    monkeypatch.setenv('APP_WORKERS', '4')
+    monkeypatch.setenv('APP_DB__DEBUG', 'yes')
+    monkeypatch.setenv('APP_TAGS', '["a", "b"]')
+
+    raw_obj = {'name': 'a', 'tags': [], 'db': {'url': 'u'}}
+    config = Config.from_obj(raw_obj)
+
+    assert config.workers == 4
+    assert config.db.debug is True
+    assert config.db.url == 'u'
+    assert config.tags == ['a', 'b']
+    # raw object is not modified
+    assert raw_obj == {'name': 'a', 'tags': [], 'db': {'url': 'u'}}
+
+
+def test_overlay_fills_missing(monkeypatch):
+    monkeypatch.setenv('APP_NAME', 'env')
+    monkeypatch.setenv('APP_DB__URL', 'postgres://')
+
+    config = Config.from_str('{"tags": []}')
+    assert config.name == 'env'
+    assert config.db.url == 'postgres://'
+    assert config.db.debug is False
+
+    monkeypatch.delenv('APP_NAME')
+    with pytest.raises(FieldsMissing) as error:
+        Config.from_str('{"tags": []}')
+    assert 'name' in str(error.value)
+
+
+def test_invalid_value(monkeypatch):
+    monkeypatch.setenv('APP_WORKERS', 'many')
+
+    with pytest.raises(ValueError, match='APP_WORKERS'):
+        Config.from_str('{"name": "a", "tags": [], "db": {"url": ""}}')
+
+
+def test_disabled(monkeypatch):
+    class Plain(JsonConfig):
+        workers: int = 1
+
+    monkeypatch.setenv('WORKERS', '4')
+    assert Plain._env_index is None
+    assert Plain.from_str('{}').workers == 1
+
+
+def test_collision():
+    with pytest.raises(ValueError, match='A__B'):
+        class Bad(JsonConfig):
+            env_prefix = ''
+
+            a__b: int
+
+            class a:
+                b: int
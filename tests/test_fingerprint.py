@@ -0,0 +1,113 @@
+import os
+import sys
+import subprocess
+
+from typing import Any, Dict, List
+from dataclasses import dataclass
+
+import pytest
+
+from helloconfig import JsonConfig
+from helloconfig.immutable import ImmutableDict, ImmutableList
+from helloconfig.fingerprint import get_fingerprint
+
+
+class Config(JsonConfig):
+    name: str
+    value: Any
+    routes: Dict[str, List[str]]
+
+    class db:
+        url: str
+        options: dict
+
+
+DATA = {
+    'name': 'a',
+    'value': 1,
+    'routes': {'/a': ['x', 'y'], '/b': []},
+    'db': {'url': 'sqlite://', 'options': {'timeout': 1, 'tags': ['t']}},
+}
+
+
+def test_values():
+    assert get_fingerprint({'a': 1, 'b': [1]}) == get_fingerprint({'b': [1], 'a': 1})
+    assert get_fingerprint({1: 'a', 'b': 2}) == get_fingerprint({'b': 2, 1: 'a'})
+    assert get_fingerprint({'a', 'b'}) == get_fingerprint(frozenset({'b', 'a'}))
+
+    assert get_fingerprint(1) != get_fingerprint(1.0) != get_fingerprint(True)
+    assert get_fingerprint(-1) != get_fingerprint(-2)
+    assert get_fingerprint(['ab']) != get_fingerprint(['a', 'b'])
+    assert get_fingerprint('x' * 100) != get_fingerprint('x' * 101)
+
+
+def test_config_equality():
+    first = Config.from_obj(DATA)
+    second = Config.from_obj(dict(reversed(list(DATA.items()))))
+    other = Config.from_obj({**DATA, 'value': 1.0})
+
+    assert first.fingerprint == second.fingerprint
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != other
+    assert len({first, second, other}) == 2
+
+    assert first.db == second.db
+    assert hash(first.db) == hash(second.db)
+    assert first.db.options == other.db.options
+
+
+def test_cached():
+    config = Config.from_obj(DATA)
+    fingerprint = config.fingerprint
+
+    assert config.db.__dict__['__fingerprint__'] == get_fingerprint(config.db)
+    assert config.fingerprint is fingerprint
+
+
+def test_same_in_other_process():
+    code = (
+        'from tests.test_fingerprint import Config, DATA\n'
+        'config = Config.from_obj(DATA)\n'
+        'print(config.fingerprint.hex(), hash(config))\n'
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+            env={**os.environ, 'PYTHONHASHSEED': seed},
+        ).stdout
+        for seed in ('1', '2')
+    }
+
+    config = Config.from_obj(DATA)
+    assert outputs == {f'{config.fingerprint.hex()} {hash(config)}\n'}
+
+
+def test_immutable_hash():
+    value = ImmutableDict({'a': ImmutableList([1, ImmutableDict({'b': 2})])})
+
+    assert hash(value) == hash(ImmutableDict({'a': ImmutableList([1, ImmutableDict({'b': 2})])}))
+    assert len({value, ImmutableDict({'a': ImmutableList([1])})}) == 2
+
+
+def test_external_dataclass_not_patched():
+    @dataclass
+    class Point:
+        x: int
+        y: int
+
+    class PointConfig(JsonConfig):
+        p: Point
+
+    with pytest.raises(TypeError):
+        hash(Point(1, 2))
+
+    point = Point(1, 2)
+    assert get_fingerprint(point) == get_fingerprint(Point(1, 2))
+    point.x = 100
+    assert point != Point(1, 2)
+    assert get_fingerprint(point) != get_fingerprint(Point(1, 2))
+
+    first = PointConfig.from_obj({'p': {'x': 1, 'y': 2}})
+    assert first == PointConfig.from_obj({'p': {'x': 1, 'y': 2}})
+    assert first != PointConfig.from_obj({'p': {'x': 1, 'y': 3}})
@@ -0,0 +1,76 @@
+import os
+import gc
+import sys
+import json
+
+import pytest
+
+from helloconfig import JsonConfig
+
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith('linux') or not os.path.exists('/proc/self/smaps_rollup'),
+    reason='RSS is measured with /proc/self/smaps_rollup'
+)
+
+
+class Config(JsonConfig):
+    lazy_sections = True
+
+    class routes:
+        table: dict
+
+
+def get_private_dirty() -> int:
+    with open('/proc/self/smaps_rollup') as file:
+        for line in file:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+    raise RuntimeError('Private_Dirty not found')  # pragma: no cover
+
+
+def fork_children(config, count: int) -> int:
+    """Total memory (KB), copied by children, running garbage collection"""
+
+    read_fd, write_fd = os.pipe()
+    pids = []
+    for _ in range(count):
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            try:
+                before = get_private_dirty()
+                gc.collect()
+                assert config.routes.table
+                os.write(write_fd, f'{get_private_dirty() - before}\n'.encode())
+            finally:
+                os._exit(0)
+        pids.append(pid)
+
+    for pid in pids:
+        os.waitpid(pid, 0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        results = pipe.read().split()
+
+    assert len(results) == count
+    return sum(map(int, results))
+
+
+def test_prepare_for_fork():
+    config = Config.from_str(json.dumps({'routes': {'table': {
+        f'route_{n}': {'upstream': [n, n + 1], 'limits': {'rps': n}}
+        for n in range(50_000)
+    }}}))
+
+    try:
+        assert config.prepare_for_fork() is config
+        assert gc.get_freeze_count() > 0
+
+        frozen_copied = fork_children(config, 4)
+
+        gc.unfreeze()
+        plain_copied = fork_children(config, 4)
+    finally:
+        gc.unfreeze()
+
+    assert frozen_copied * 4 < plain_copied
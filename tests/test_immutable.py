@@ -0,0 +1,150 @@
+import sys
+import pickle
+
+from typing import List
+
+import pytest
+
+from helloconfig import JsonConfig
+from helloconfig.immutable import (
+    ImmutableArray, ImmutableDict, ImmutableList, ImmutableSet,
+    get_numeric_array, get_numpy_array, replace_mutable_values
+)
+
+
+def test_replace_mutable_values():
+    shared = [1, 2]
+    obj = replace_mutable_values({
+        'a': [shared, {'b': {3}}],
+        'c': shared,
+        'd': 'leaf',
+    })
+
+    assert obj == {'a': [[1, 2], {'b': {3}}], 'c': [1, 2], 'd': 'leaf'}
+    assert type(obj) is ImmutableDict
+    assert type(obj['a']) is ImmutableList
+    assert type(obj['a'][1]['b']) is ImmutableSet
+    # same container is frozen only once
+    assert obj['a'][0] is obj['c']
+
+
+def test_deep_structure():
+    depth = sys.getrecursionlimit() * 2
+    obj = root = []
+    for _ in range(depth):
+        child = []
+        obj.append(child)
+        obj = child
+
+    frozen = replace_mutable_values(root)  # type: ignore
+    for _ in range(depth):
+        assert type(frozen) is ImmutableList
+        frozen, = frozen
+
+
+def test_recursive_structure():
+    obj = []
+    obj.append(obj)
+
+    with pytest.raises(ValueError):
+        replace_mutable_values(obj)  # type: ignore
+
+
+def test_list_behaves_like_list():
+    value = ImmutableList([1, 2])
+
+    assert value == [1, 2]
+    assert [1, 2] == value
+    assert value != [1, 3]
+    assert value == (1, 2)
+    assert repr(value) == '[1, 2]'
+    assert hash(value) == hash((1, 2))
+
+    for method in ('append', 'extend', 'sort', '__iadd__'):
+        with pytest.raises(TypeError):
+            getattr(value, method)([3])
+
+
+def test_compact():
+    for container in (ImmutableDict(), ImmutableList(), ImmutableSet()):
+        assert not hasattr(container, '__dict__')
+
+    assert sys.getsizeof(ImmutableList(range(100))) < sys.getsizeof(list(range(100)))
+
+
+def test_pickle():
+    obj = replace_mutable_values({'a': [1, {2}], 'b': {'c': 'd'}})
+
+    assert pickle.loads(pickle.dumps(obj)) == obj
+    assert type(pickle.loads(pickle.dumps(obj))['a']) is ImmutableList
+
+
+def test_numeric_array():
+    value = get_numeric_array(int, [1, 2, 3])
+
+    assert type(value) is ImmutableArray
+    assert value == [1, 2, 3]
+    assert repr(value) == '[1, 2, 3]'
+    assert pickle.loads(pickle.dumps(value)) == value
+
+    with pytest.raises(TypeError):
+        value.append(4)
+    with pytest.raises(TypeError):
+        value[0] = 0
+    with pytest.raises(TypeError):
+        hash(value)
+
+    # storage is not writable through buffer either
+    with pytest.raises(TypeError):
+        memoryview(value)  # type: ignore
+    with pytest.raises(TypeError):
+        value._view.cast('B').cast('q')[0] = 99
+    assert value == [1, 2, 3]
+    assert value[1:] == [2, 3]
+    assert type(value[1:]) is ImmutableArray
+
+    # converted like loader converts list items
+    assert get_numeric_array(int, ['1', 2.5]) == [1, 2]
+    assert get_numeric_array(float, [1, 2.5]) == [1.0, 2.5]
+    # too large for int64
+    assert type(get_numeric_array(int, [1 << 70])) is ImmutableList
+
+    with pytest.raises(ValueError):
+        get_numeric_array(float, ['x'])
+
+
+def test_numpy_array(monkeypatch):
+    numpy = sys.modules.get('numpy')
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+    assert type(get_numpy_array(int, [1, 2])) is ImmutableArray
+
+    if numpy is None:
+        numpy = pytest.importorskip('numpy')
+    monkeypatch.setitem(sys.modules, 'numpy', numpy)
+
+    value = get_numpy_array(float, [1, 2.5])
+    assert value.dtype == numpy.float64
+    assert not value.flags.writeable
+
+
+def test_numeric_array_fields():
+    class Config(JsonConfig):
+        numeric_arrays = 'array'
+
+        ids: List[int]
+        names: List[str]
+
+        class weights:
+            values: List[float]
+
+    config = Config.from_str(
+        '{"ids": [1, 2], "names": ["a"], "weights": {"values": [0.5, 1]}}'
+    )
+
+    assert type(config.ids) is ImmutableArray
+    assert type(config.weights.values) is ImmutableArray
+    assert config.weights.values == [0.5, 1.0]
+    assert config.names == ['a']
+
+    with pytest.raises(ValueError):
+        Config.from_str('{"ids": ["a"], "names": [], "weights": {"values": []}}')
@@ -0,0 +1,40 @@
+import sys
+import subprocess
+
+
+HEAVY_MODULES = {'yaml', 'libcst', 'dataclass_factory', 'json', 'configparser'}
+
+
+def imported_modules(code: str) -> 'set[str]':
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        name = line.rpartition('|')[2].strip()
+        modules.add(name.partition('.')[0])
+    return modules
+
+
+def test_import_is_lightweight():
+    startup = imported_modules('pass')
+    imported = imported_modules('import helloconfig') - startup
+
+    assert 'helloconfig' in imported
+    assert not imported & HEAVY_MODULES
+
+
+def test_backend_imported_on_use():
+    startup = imported_modules('pass')
+    imported = imported_modules(
+        'import helloconfig\n'
+        'class Config(helloconfig.DotEnvConfig):\n'
+        '    NUMBER: int\n'
+        'Config.from_str("NUMBER=1")\n'
+    ) - startup
+
+    assert 'dataclass_factory' in imported
+    assert not imported & {'yaml', 'libcst'}
@@ -0,0 +1,94 @@
+import gc
+
+from typing import Dict, List
+
+from helloconfig import JsonConfig
+from helloconfig.interning import ConfigInterner, default_interner
+from helloconfig.immutable import ImmutableDict, ImmutableList
+
+
+class Config(JsonConfig):
+    interning = True
+
+    tenant: str
+    tags: list
+    routes: Dict[str, List[str]]
+
+    class database:
+        url: str
+        options: dict
+
+    class retry:
+        attempts: int = 3
+
+
+class OtherConfig(JsonConfig):
+    interning = True
+
+    options: dict
+
+
+def load(tenant: str, url: str = 'postgres://db') -> Config:
+    return Config.from_str(
+        f'{{"tenant": "{tenant}", "tags": ["shared", "tag"], "routes": {{"/a": ["backend"]}}, '
+        f'"database": {{"url": "{url}", "options": {{"pool": 4}}}}, "retry": {{}}}}'
+    )
+
+
+def test_shared_sections():
+    first = load('first')
+    second = load('second')
+
+    assert first.database is second.database
+    assert first.retry is second.retry
+    assert first.tags[0] is second.tags[0]
+    assert next(iter(first.routes)) is next(iter(second.routes))
+    assert first.tenant == 'first'
+
+    other = load('third', url='postgres://other')
+    assert other.database is not first.database
+    assert other.database.options is first.database.options
+
+
+def test_shared_between_classes():
+    config = load('first')
+    other = OtherConfig.from_str('{"options": {"pool": 4}}')
+
+    assert other.options is config.database.options
+
+
+def test_lazy_sections():
+    class LazyConfig(JsonConfig):
+        interning = True
+        lazy_sections = True
+
+        class database:
+            url: str
+
+    first = LazyConfig.from_str('{"database": {"url": "x"}}')
+    second = LazyConfig.from_str('{"database": {"url": "x"}}')
+    assert first.database is second.database
+
+
+def test_entries_are_weak():
+    interner = ConfigInterner()
+    value = interner.intern(ImmutableDict({'key': ImmutableList(['value'])}))
+
+    assert len(interner) == 1
+    assert interner.intern(ImmutableDict({'key': ImmutableList(['value'])})) is value
+    assert (interner.hits, interner.misses) == (1, 1)
+
+    del value
+    gc.collect()
+    assert len(interner) == 0
+
+
+def test_default_interner_frees_configs():
+    load('temporary', url='postgres://temporary')
+    gc.collect()
+
+    urls = [
+        value.url for value in list(default_interner._table.values())
+        if isinstance(value, Config._schema.fields['database'].schema.data_cls)
+    ]
+    assert 'postgres://temporary' not in urls
@@ -1,6 +1,10 @@
+from typing import List
+
 import pytest
 
+from helloconfig import JsonConfig
 from helloconfig.parsers import JsonParser
+from helloconfig.parsers.base import NameSpace
 
 
 DATA_STR = """{
@@ -48,4 +52,64 @@ def test_dumping():
     assert JsonParser().update_config(
         '{ "abc": 12 }',
         {'hello': 'world'}
-    ) == '{\n    "abc": 12,\n    "hello": "world"\n}'
\ No newline at end of file
+    ) == '{ "abc": 12,\n    "hello": "world"\n}'
+
+    # existing contents are kept byte for byte,
+    # new members use indentation of existing ones
+    assert JsonParser().update_config(
+        '{\n  "abc": [1,2],\n  "x": {}\n}\n',
+        {'hello': 'world', 'obj': {'a': [1]}}
+    ) == ('{\n  "abc": [1,2],\n  "x": {},\n  "hello": "world",\n'
+          '  "obj": {\n    "a": [\n      1\n    ]\n  }\n}\n')
+
+    assert JsonParser().update_config('{}', {'a': 1}) == '{\n    "a": 1\n}'
+    assert JsonParser().update_config('{}\n', {'a': 1, 'b': 2}) == '{\n    "a": 1,\n    "b": 2\n}\n'
+
+    with pytest.raises(ValueError):
+        JsonParser().update_config('[1]', {'a': 1})
+
+def test_nested_dumping():
+    assert JsonParser().update_config(
+        '{"a": 1, "nested": {"b": 2}}',
+        {'nested': NameSpace({'c': 3}), 'd': 4}
+    ) == '{"a": 1, "nested": {"b": 2,\n    "c": 3\n},\n    "d": 4\n}'
+
+    # other members are kept as is
+    assert JsonParser().update_config(
+        '{\n  "a": [1, 2],\n  "nested": {\n    "b": {"x": 1},\n    "e": {}\n  },\n  "z": 1\n}\n',
+        {'nested': NameSpace({'c': 3, 'e': NameSpace({'f': 1})})}
+    ) == (
+        '{\n  "a": [1, 2],\n  "nested": {\n    "b": {"x": 1},\n    "e": {\n      "f": 1\n    },\n'
+        '    "c": 3\n  },\n  "z": 1\n}\n'
+    )
+
+
+def test_deep_freeze():
+    parse_result = JsonParser().parse_string(
+        '{"LIST": [[1, [2]], {"a": [3]}]}'
+    )
+
+    nested = parse_result['LIST']
+    for value in (nested, nested[0], nested[0][1], nested[1]['a']):
+        with pytest.raises(TypeError):
+            value.append(1)
+
+    with pytest.raises(TypeError):
+        JsonParser().parse_string('[[1]]')[0].append(1)
+
+
+def test_values_not_copied():
+    class Config(JsonConfig):
+        OBJECT: dict
+        LIST: list
+        NUMBERS: List[int]
+
+    raw_obj = JsonParser().parse_string(
+        '{"OBJECT": {"a": 1}, "LIST": [1], "NUMBERS": ["1", 2]}'
+    )
+    config = Config.from_obj(raw_obj)
+
+    assert config.OBJECT is raw_obj['OBJECT']
+    assert config.LIST is raw_obj['LIST']
+    # parametrized types are still parsed item by item
+    assert config.NUMBERS == [1, 2]
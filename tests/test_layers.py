@@ -0,0 +1,160 @@
+import os
+
+import pytest
+
+from helloconfig import ConfigLayers, FieldsMissing, PythonConfig, YamlConfig
+from helloconfig.layers import diff_raw_objs, merge_layers, update_merged
+
+
+class Config(PythonConfig):
+    name: str
+    tags: list
+    workers: int = 1
+
+    class db:
+        url: str
+        pool: int = 4
+
+    class cache:
+        ttl: int = 60
+
+
+def write(path, data):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(data)
+    # make sure mtime differs even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def files(tmp_path):
+    base = tmp_path / 'base.pyi'
+    override = tmp_path / 'prod.yaml'
+    write(base, 'name = "app"\ntags = ["a"]\n\nclass db:\n    url = "sqlite://"\n\n'
+                'class cache:\n    ttl = 30\n')
+    write(override, 'db:\n  pool: 8\n')
+    return str(base), str(override)
+
+
+def test_merge():
+    merged = merge_layers([
+        {'a': 1, 'b': {'c': 1, 'd': [1]}},
+        {'b': {'d': [2]}, 'e': 1},
+    ])
+    assert merged == {'a': 1, 'b': {'c': 1, 'd': [2]}, 'e': 1}
+
+
+def test_update_merged():
+    layers = [{'a': {'b': 1, 'c': 1}, 'x': {'y': 1}}, {'a': {'b': 2}}]
+    merged = merge_layers(layers)
+
+    new_layer = {'a': {'b': 3}, 'z': 1}
+    changes = diff_raw_objs(layers[1], new_layer)
+    assert changes == {'a': {'b': None}, 'z': None}
+
+    updated = update_merged(merged, [layers[0], new_layer], changes)
+    assert updated == merge_layers([layers[0], new_layer])
+    # unchanged subtree is reused, previous merge is untouched
+    assert updated['x'] is merged['x']
+    assert merged['a'] == {'b': 2, 'c': 1}
+
+    # non-dict value replaces dicts of previous layers
+    replaced = update_merged(updated, [layers[0], {'a': 1}], diff_raw_objs(new_layer, {'a': 1}))
+    assert replaced == {'a': 1, 'x': {'y': 1}}
+
+
+def test_from_layers(files):
+    base, override = files
+    config = Config.from_layers([{'workers': 2}, base, (override, YamlConfig)])
+
+    assert config.name == 'app'
+    assert config.workers == 2
+    assert (config.db.url, config.db.pool) == ('sqlite://', 8)
+    assert config.cache.ttl == 30
+
+
+def test_reload(files):
+    base, override = files
+    layers = ConfigLayers(Config, [base, (override, YamlConfig)])
+    first = layers.config
+
+    assert not layers.reload()
+    assert layers.config is first
+
+    write(override, 'db:\n  pool: 16\n')
+    assert layers.reload()
+    config = layers.config
+
+    assert config.db.pool == 16
+    assert first.db.pool == 8
+    # unchanged sections are reused
+    assert config.cache is first.cache
+    assert config.tags is first.tags
+
+    write(base, 'name = "other"\ntags = ["a"]\n\nclass db:\n    url = "sqlite://"\n\n'
+                'class cache:\n    ttl = 30\n')
+    assert layers.reload()
+    assert layers.config.name == 'other'
+    assert layers.config.db.pool == 16
+
+
+def test_set_layer(files):
+    base, _ = files
+    layers = ConfigLayers(Config, [base, {}])
+
+    assert layers.set_layer(1, {'cache': {'ttl': 5}})
+    assert layers.config.cache.ttl == 5
+    assert not layers.set_layer(1, {'cache': {'ttl': 5}})
+
+
+def test_optional_layer(files, tmp_path):
+    base, _ = files
+    tenant = str(tmp_path / 'tenant.pyi')
+
+    from helloconfig.layers import FileLayer
+
+    layers = ConfigLayers(Config, [base, FileLayer(tenant, Config._PARSER_CLS, optional=True)])
+    assert layers.config.workers == 1
+
+    write(tenant, 'workers = 3\n')
+    assert layers.reload()
+    assert layers.config.workers == 3
+
+    os.remove(tenant)
+    assert layers.reload()
+    assert layers.config.workers == 1
+
+
+def test_failed_reload_keeps_config(files):
+    base, override = files
+    layers = ConfigLayers(Config, [base, (override, YamlConfig)])
+    config = layers.config
+
+    write(base, 'tags = []\n')
+    with pytest.raises(FieldsMissing):
+        layers.reload()
+    assert layers.config is config
+
+    # failed layer is read again
+    with pytest.raises(FieldsMissing):
+        layers.reload()
+
+
+def test_env(files, monkeypatch):
+    base, _ = files
+
+    class EnvConfig(PythonConfig):
+        env_prefix = 'APP_'
+
+        name: str
+
+        class cache:
+            ttl: int = 60
+
+    layers = ConfigLayers(EnvConfig, [base])
+    assert layers.config.cache.ttl == 30
+
+    monkeypatch.setenv('APP_CACHE__TTL', '10')
+    assert layers.reload()
+    assert layers.config.cache.ttl == 10
@@ -0,0 +1,97 @@
+from typing import Dict, List
+
+import pytest
+
+from helloconfig import FieldsMissing, JsonConfig, PythonConfig
+
+
+class Config(JsonConfig):
+    lazy_sections = True
+
+    name: str
+    workers: int = 1
+
+    class routes:
+        default: str
+        table: Dict[str, List[int]]
+
+    class flags:
+        enabled: bool = False
+
+
+def test_sections_loaded_on_access():
+    config = Config.from_str(
+        '{"name": "a", "routes": {"default": "/", "table": {"x": [1, "y"]}}, "flags": {}}'
+    )
+
+    assert config.name == 'a'
+    assert config.workers == 1
+    assert config.flags.enabled is False
+
+    # invalid section value is found only when section is read
+    with pytest.raises(ValueError):
+        config.routes
+
+
+def test_section_cached():
+    config = Config.from_str(
+        '{"name": "a", "routes": {"default": "/", "table": {"x": [1]}}, "flags": {}}'
+    )
+
+    routes = config.routes
+    assert routes is config.routes
+    assert routes.table == {'x': [1]}
+
+    with pytest.raises(TypeError):
+        config.routes = None
+
+
+def test_missing_fields_checked_eagerly():
+    with pytest.raises(FieldsMissing):
+        Config.from_str('{"name": "a", "routes": {"default": "/"}, "flags": {}}')
+
+    with pytest.raises(FieldsMissing):
+        Config.from_str('{"name": "a", "flags": {}}')
+
+    # section with defaults of all its fields is still required
+    for lazy in (False, True):
+        class FlagsConfig(JsonConfig):
+            lazy_sections = lazy
+
+            value: str
+
+            class flags:
+                enabled: bool = False
+
+        with pytest.raises(FieldsMissing, match='flags'):
+            FlagsConfig.from_str('{"value": "x"}')
+        assert FlagsConfig.from_str('{"value": "x", "flags": {}}').flags.enabled is False
+
+    with pytest.raises(ValueError):
+        Config.from_str(
+            '{"name": "a", "workers": "many", "routes": '
+            '{"default": "/", "table": {}}, "flags": {}}'
+        )
+
+
+def test_missing_file_fields(tmp_filename):
+    class Initial(PythonConfig):
+        lazy_sections = True
+
+        class section:
+            a: int
+
+    class Updated(PythonConfig):
+        lazy_sections = True
+
+        class section:
+            a: int
+            b: str
+
+    with pytest.raises(FieldsMissing):
+        Initial.from_file(tmp_filename)
+    assert Initial.from_file(tmp_filename).section.a == 0
+
+    with pytest.raises(FieldsMissing):
+        Updated.from_file(tmp_filename)
+    assert Updated.from_file(tmp_filename).section.b == ''
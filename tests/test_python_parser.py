@@ -1,9 +1,11 @@
+import sys
 import pytest
 
 from dataclasses import dataclass, field
 
 from helloconfig import PythonConfig, FieldsMissing
 from helloconfig.parsers import PythonParser
+from helloconfig.parsers.base import NameSpace
 
 
 DATA_STR = \
@@ -158,7 +160,89 @@ def test_field_update(tmp_filename):
     config = UpdatedConfig.from_file(tmp_filename)
     assert config.a1 == int()
     assert config.nested.b1 == int()
-    assert config.nested.more_nested == {'hi': 'hello'}
+    assert config.nested.more_nested.c == {'hi': 'hello'}
+
+
+def test_nested_field_update(capsys):
+    config = (
+        "a = 1  # comment\n"
+        "\n"
+        "class nested:\n"
+        "    b = 'b'\n"
+        "\n"
+        "    class more_nested: pass\n"
+        "\n"
+        "class other:\n"
+        "    c = 3\n"
+    )
+
+    updated = PythonParser().update_config(config, {
+        'a1': 2,
+        'nested': NameSpace({
+            'b1': 'b1',
+            'more_nested': NameSpace({'c': {}}),
+        }),
+    })
+
+    assert updated == (
+        "a = 1  # comment\n"
+        "\n"
+        "class nested:\n"
+        "    b = 'b'\n"
+        "\n"
+        "    class more_nested:\n"
+        "        pass\n"
+        "        c = {}\n"
+        "    b1 = 'b1'\n"
+        "\n"
+        "class other:\n"
+        "    c = 3\n"
+        "\n"
+        "a1 = 2\n"
+    )
+    assert capsys.readouterr().out == ''
+
+
+def test_dict_section_update(tmp_filename):
+    assert PythonParser().update_config(
+        "db = {\n    'url': 'x',\n    'opts': {'a': 1},\n}\n",
+        {'db': NameSpace({'port': 0, 'opts': NameSpace({'b': [1]})})},
+    ) == "db = {\n    'url': 'x',\n    'opts': {'a': 1, 'b': [1]},\n    'port': 0,\n}\n"
+
+    class Config(PythonConfig):
+        class db:
+            url: str
+            port: int
+
+    with open(tmp_filename, 'w', encoding='utf-8') as file:
+        file.write("db = {'url': 'x'}  # comment\n")
+
+    with pytest.raises(FieldsMissing, match='File was updated'):
+        Config.from_file(tmp_filename)
+
+    with open(tmp_filename, encoding='utf-8') as file:
+        assert file.read() == "db = {'url': 'x', 'port': 0}  # comment\n"
+    assert Config.from_file(tmp_filename).db.port == 0
+
+
+def test_deep_nested_field_update():
+    depth = 40
+
+    lines = []
+    for level in range(depth):
+        lines.append(level * '    ' + f'class ns{level}:')
+        lines.append((level + 1) * '    ' + 'value = 0')
+    config = '\n'.join(lines) + '\n'
+
+    missing = {'added': 1}
+    for level in reversed(range(depth)):
+        missing = {f'ns{level}': NameSpace(missing)}
+
+    updated = PythonParser().update_config(config, missing)
+    parsed = PythonParser().parse_string(updated)
+    for level in range(depth):
+        parsed = parsed[f'ns{level}']
+    assert parsed == {'value': 0, 'added': 1}
 
 
 def test_not_supported_features():
@@ -178,3 +262,31 @@ def test_not_supported_features():
 
     with pytest.raises(ValueError):
         parser.parse_string("a = {123: 123, **dict()}")
+
+    with pytest.raises(ValueError):
+        parser.parse_string("a = True")
+
+    with pytest.raises(ValueError):
+        parser.parse_string("a = [1, *b]")
+
+    with pytest.raises(ValueError):
+        parser.parse_string("try:\n    pass\nexcept Exception:\n    import os")
+
+
+def test_compound_statements():
+    parser = PythonParser()
+
+    assert parser.parse_string(
+        "try:\n    pass\nexcept Exception:\n    a = 1\nelse:\n    b = 2\nfinally:\n    c = 3"
+    ) == {'a': 1, 'b': 2, 'c': 3}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason='match statement requires python 3.10')
+def test_match_statement():
+    parser = PythonParser()
+
+    assert parser.parse_string("match 1:\n    case 1:\n        a = 1\n    case _:\n        b = 2") \
+        == {'a': 1, 'b': 2}
+
+    with pytest.raises(ValueError):
+        parser.parse_string("match 1:\n    case _:\n        import os")
@@ -0,0 +1,78 @@
+from typing import List
+from dataclasses import dataclass, field
+
+import pytest
+
+from helloconfig import PythonConfig
+from helloconfig.parsers.base import NameSpace
+from helloconfig.schema import get_field_paths, parse_bool
+
+
+class Config(PythonConfig):
+    host: str
+    port: int = 8080
+    tags: List[str] = field(default_factory=lambda: ['a'])
+
+    class db:
+        url: str
+        debug: bool = False
+
+        @dataclass
+        class pool:
+            size: int = 4
+
+
+def test_fields():
+    schema = Config.get_schema()
+
+    assert schema is Config._schema
+    assert list(schema.fields) == ['host', 'port', 'tags', 'db']
+    assert schema.required == {'host', 'db'}
+
+    assert schema.fields['port'].get_default() == 8080
+    assert schema.fields['tags'].get_default() == ['a']
+    assert not schema.fields['host'].has_default
+
+    db_schema = schema.fields['db'].schema
+    assert db_schema.required == {'url', 'pool'}
+    assert db_schema.fields['pool'].schema.fields['size'].get_default() == 4
+
+    with pytest.raises(TypeError):
+        schema.fields['new'] = schema.fields['host']
+
+
+def test_converters():
+    fields = Config.get_schema().fields
+    db_fields = fields['db'].schema.fields
+
+    assert fields['port'].converter('80') == 80
+    assert db_fields['debug'].converter('yes') is True
+    assert db_fields['debug'].converter('0') is False
+    assert fields['tags'].converter is None
+
+    with pytest.raises(ValueError):
+        parse_bool('maybe')
+
+
+def test_missing_fields():
+    schema = Config.get_schema()
+
+    assert set(schema.get_missing_fields({})) == {'host', 'db'}
+
+    missing = schema.get_missing_fields({'host': 'h', 'db': {'pool': {}}})
+    assert missing == {'db': NameSpace(url=schema.fields['db'].schema.fields['url'].field)}
+    assert list(get_field_paths(missing)) == ['db.url']
+
+    assert schema.get_missing_fields({'host': 'h', 'db': {'url': '', 'pool': {}}}) == {}
+
+
+def test_export():
+    schema = Config.get_schema()
+
+    exported = schema.to_dict()
+    assert exported['host'] == {'type': 'str', 'required': True}
+    assert exported['tags'] == {'type': 'List[str]', 'required': False, 'default': ['a']}
+    assert exported['db']['type'] == 'section'
+    assert exported['db']['fields']['pool']['fields']['size'] == {
+        'type': 'int', 'required': False, 'default': 4
+    }
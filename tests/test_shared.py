@@ -0,0 +1,124 @@
+from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from helloconfig import JsonConfig, SharedConfigPublisher, SharedConfigReader
+
+
+class Config(JsonConfig):
+    name: str
+
+    class limits:
+        rps: int
+        tenants: List[str]
+
+
+def make_config(name: str):
+    return Config.from_obj({'name': name, 'limits': {'rps': 10, 'tenants': ['a', 'b']}})
+
+
+def read_config(segment_name: str):
+    with SharedConfigReader(Config, segment_name) as reader:
+        config = reader.get()
+        return reader.version, config.name, config.limits.tenants
+
+
+def test_publish():
+    with SharedConfigPublisher(Config, size=4096) as publisher:
+        reader = SharedConfigReader(Config, publisher.name)
+
+        with pytest.raises(LookupError):
+            reader.get()
+
+        assert publisher.publish(make_config('first')) == 2
+        config = reader.get()
+        assert config.name == 'first'
+        assert config.limits.tenants == ['a', 'b']
+        assert reader.get() is config
+        assert not reader.changed
+
+        publisher.publish(make_config('second'))
+        assert reader.changed
+        assert reader.version == 4
+        assert reader.get().name == 'second'
+
+        reader.close()
+
+
+def test_process_pool():
+    with SharedConfigPublisher(Config) as publisher:
+        publisher.publish(make_config('shared'))
+
+        with ProcessPoolExecutor(2) as executor:
+            results = list(executor.map(read_config, [publisher.name] * 4))
+
+    assert results == [(2, 'shared', ['a', 'b'])] * 4
+
+
+def test_errors():
+    with SharedConfigPublisher(Config, size=16) as publisher:
+        with pytest.raises(ValueError):
+            publisher.publish(make_config('too large for segment'))
+
+        with pytest.raises(TypeError):
+            publisher.publish(object())
+
+    segment = SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            SharedConfigReader(Config, segment.name)
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def test_torn_header(monkeypatch):
+    import pickle
+    import helloconfig.shared as shared
+
+    with SharedConfigPublisher(Config, size=4096) as publisher:
+        publisher.publish(make_config('a'))
+        publisher.publish(make_config('much longer name'))
+
+        # reader sees new version with size of previous snapshot,
+        # publisher finishes writing header while it unpickles
+        _, version, size = shared._header.unpack_from(publisher.shm.buf)
+        old_size = len(pickle.dumps(shared.get_raw_obj(make_config('a'), Config._schema),
+                                    protocol=pickle.HIGHEST_PROTOCOL))
+        shared._header.pack_into(publisher.shm.buf, 0, shared._MAGIC, version, old_size)
+
+        def loads(payload):
+            shared._header.pack_into(publisher.shm.buf, 0, shared._MAGIC, version, size)
+            monkeypatch.undo()
+            return pickle.loads(payload)
+
+        monkeypatch.setattr(shared.pickle, 'loads', loads)
+        with SharedConfigReader(Config, publisher.name) as reader:
+            assert reader.get().name == 'much longer name'
+
+
+def test_wait_for_publish():
+    import threading
+    import helloconfig.shared as shared
+
+    with SharedConfigPublisher(Config, size=4096) as publisher:
+        version = publisher.publish(make_config('a'))
+        _, _, size = shared._header.unpack_from(publisher.shm.buf)
+
+        # snapshot is being written, until publisher finishes it
+        shared._header.pack_into(publisher.shm.buf, 0, shared._MAGIC, version + 1, 0)
+        timer = threading.Timer(0.05, shared._header.pack_into,
+                                (publisher.shm.buf, 0, shared._MAGIC, version, size))
+        timer.start()
+        try:
+            with SharedConfigReader(Config, publisher.name) as reader:
+                assert reader.get().name == 'a'
+        finally:
+            timer.join()
+
+        shared._header.pack_into(publisher.shm.buf, 0, shared._MAGIC, version + 1, 0)
+        with SharedConfigReader(Config, publisher.name, timeout=0.01) as reader:
+            with pytest.raises(TimeoutError):
+                reader.get()
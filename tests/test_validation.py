@@ -0,0 +1,111 @@
+from typing import List
+
+import pytest
+
+from helloconfig import (
+    JsonConfig, ValidationError,
+    validate, validate_length, validate_pattern, validate_range,
+)
+
+
+class Database(JsonConfig):
+    url: str
+
+    url_pattern = validate_pattern('url', pattern=r'postgres://\S+')
+
+
+class Config(JsonConfig):
+    port: int
+    hosts: List[str]
+    weights: List[float]
+
+    @validate('port')
+    def check_port(value):
+        if not 0 < value < 65536:
+            raise ValueError('port must be in range 1-65535')
+        return value
+
+    @validate('hosts', pre=True)
+    def lower_hosts(value):
+        return [host.lower() for host in value]
+
+    hosts_length = validate_length('hosts', min=1, max=3)
+    weights_range = validate_range('weights', min=0, max=1)
+
+    database = Database
+
+    class limits:
+        rps: int
+
+        rps_range = validate_range('rps', min=1)
+
+
+def load(**values):
+    raw_obj = {
+        'port': 80,
+        'hosts': ['A'],
+        'weights': [0.5, 1],
+        'database': {'url': 'postgres://db'},
+        'limits': {'rps': 10},
+    }
+    raw_obj.update(values)
+    return Config.from_obj(raw_obj)
+
+
+def test_valid():
+    config = load()
+
+    assert config.hosts == ['a']
+    assert config.limits.rps == 10
+    assert not hasattr(config, 'weights_range')
+
+
+@pytest.mark.parametrize('values', [
+    {'port': 0},
+    {'hosts': []},
+    {'hosts': ['a', 'b', 'c', 'd']},
+    {'weights': [0.5, 1.5]},
+    {'weights': [-1]},
+    {'database': {'url': 'mysql://db'}},
+    {'limits': {'rps': 0}},
+])
+def test_invalid(values):
+    with pytest.raises(ValueError):
+        load(**values)
+
+
+def test_validation_error():
+    with pytest.raises(ValidationError, match='less than 1'):
+        load(limits={'rps': 0})
+
+    with pytest.raises(ValidationError, match='ftp'):
+        validate_pattern('a', pattern='[a-z]+://db').func(['http://db', 'ftp:/db'])
+
+
+def test_lazy_sections():
+    class LazyConfig(JsonConfig):
+        lazy_sections = True
+
+        port: int
+        port_range = validate_range('port', max=100)
+
+        class limits:
+            rps: int
+            rps_range = validate_range('rps', min=1)
+
+    with pytest.raises(ValidationError):
+        LazyConfig.from_obj({'port': 1000, 'limits': {'rps': 1}})
+
+    config = LazyConfig.from_obj({'port': 10, 'limits': {'rps': 0}})
+    with pytest.raises(ValidationError):
+        config.limits
+
+
+def test_unknown_field():
+    with pytest.raises(ValueError):
+        class BadConfig(JsonConfig):
+            port: int
+            check = validate_range('prot', min=1)
+
+    with pytest.raises(TypeError):
+        validate()(lambda value: value)
@@ -0,0 +1,119 @@
+import os
+import time
+
+from helloconfig import PythonConfig, FieldsMissing
+
+
+class Config(PythonConfig):
+    NUMBER: int
+    STRING: str
+
+
+def write(path, data):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(data)
+    # make sure mtime differs even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_reload(tmp_filename):
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+    reloaded = []
+
+    with Config.watch(tmp_filename, interval=0.01, on_reload=reloaded.append) as watcher:
+        first = watcher.config
+        assert first.NUMBER == 1
+
+        write(tmp_filename, 'NUMBER = 2\nSTRING = "b"\n')
+
+        deadline = time.monotonic() + 5
+        while not reloaded and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert reloaded == [watcher.config]
+    assert (watcher.config.NUMBER, watcher.config.STRING) == (2, 'b')
+    # old snapshot is untouched
+    assert (first.NUMBER, first.STRING) == (1, 'a')
+
+
+def test_failed_reload_keeps_snapshot(tmp_filename):
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+    errors = []
+
+    watcher = Config.watch(tmp_filename, interval=3600, on_error=errors.append)
+    watcher.stop()
+    config = watcher.config
+
+    write(tmp_filename, 'NUMBER = 2\n')
+    assert not watcher.check()
+    assert isinstance(errors[-1], FieldsMissing)
+
+    write(tmp_filename, 'NUMBER = (\n')
+    assert not watcher.check()
+    assert isinstance(errors[-1], SyntaxError)
+
+    assert watcher.config is config
+
+    # file is not rewritten on reload
+    with open(tmp_filename, encoding='utf-8') as file:
+        assert file.read() == 'NUMBER = (\n'
+
+
+def test_unchanged_contents(tmp_filename):
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+
+    watcher = Config.watch(tmp_filename, interval=3600)
+    watcher.stop()
+    config = watcher.config
+
+    assert not watcher.check()
+
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+    assert not watcher.check()
+    assert watcher.config is config
+
+
+def test_subscriptions(tmp_filename):
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+    changed = []
+
+    watcher = Config.watch(tmp_filename, interval=3600)
+    watcher.stop()
+    watcher.subscribe('NUMBER', lambda config: changed.append(config.NUMBER))
+
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "b"\n')
+    assert watcher.check()
+    assert changed == []
+
+    write(tmp_filename, 'NUMBER = 2\nSTRING = "b"\n')
+    assert watcher.check()
+    assert changed == [2]
+
+
+def test_failed_callback_keeps_polling(tmp_filename):
+    write(tmp_filename, 'NUMBER = 1\nSTRING = "a"\n')
+    errors = []
+    reloaded = []
+
+    def on_reload(config):
+        reloaded.append(config.NUMBER)
+        if config.NUMBER == 2:
+            raise RuntimeError('failed')
+
+    with Config.watch(tmp_filename, interval=0.01, on_reload=on_reload,
+                      on_error=errors.append) as watcher:
+        write(tmp_filename, 'NUMBER = 2\nSTRING = "a"\n')
+
+        deadline = time.monotonic() + 5
+        while not errors and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        write(tmp_filename, 'NUMBER = 3\nSTRING = "a"\n')
+
+        while watcher.config.NUMBER != 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert reloaded == [2, 3]
+    assert isinstance(errors[0], RuntimeError)
+    assert watcher.config.NUMBER == 3
@@ -1,6 +1,9 @@
+import yaml
 import pytest
 
 from helloconfig.parsers import YamlParser
+from helloconfig.parsers.base import NameSpace
+from helloconfig.parsers.yaml import CSafeLoader
 
 
 DATA_STR_LIST = """LIST:\n- 1\n- 2\n- 3\n"""
@@ -21,8 +24,15 @@ DATA_OBJ = {
 }
 
 
-def test_parsing():
-    parse_result = YamlParser().parse_string('\n'.join([
+@pytest.fixture(params=[False, True], ids=['libyaml', 'pure'])
+def parser(request):
+    if not request.param and CSafeLoader is None:
+        pytest.skip('PyYAML built without libyaml')
+    return YamlParser(pure_python=request.param)
+
+
+def test_parsing(parser):
+    parse_result = parser.parse_string('\n'.join([
         DATA_STR_LIST,
         DATA_STR_FLOAT,
         DATA_STR_STRING,
@@ -39,9 +49,7 @@ def test_parsing():
         parse_result['OBJECT'].update({1: 2})
 
 
-def test_dumping():
-    parser = YamlParser()
-
+def test_dumping(parser):
     assert parser.update_config('', {"LIST": DATA_OBJ["LIST"]}) == DATA_STR_LIST
     assert parser.update_config('', {"FLOAT": DATA_OBJ["FLOAT"]}) == DATA_STR_FLOAT
     assert parser.update_config('', {"STRING": DATA_OBJ["STRING"]}) == DATA_STR_STRING
@@ -52,3 +60,48 @@ def test_dumping():
         'abc: 12 # Comment',
         {'hello': 'world'}
     ) == 'abc: 12 # Comment\n\nhello: world\n'
+
+
+def test_nested_dumping(parser):
+    config = (
+        '# database\n'
+        'db:\n'
+        '  url: x  # comment\n'
+        '  pool:\n'
+        '    text: |\n'
+        '      line\n'
+        '  opts: {a: 1}\n'
+        'z: [1, 2]\n'
+    )
+    assert parser.update_config(config, {
+        'db': NameSpace({
+            'port': 5432,
+            'pool': NameSpace({'size': 1}),
+            'opts': NameSpace({'b': 2}),
+        }),
+    }) == (
+        '# database\n'
+        'db:\n'
+        '  url: x  # comment\n'
+        '  pool:\n'
+        '    text: |\n'
+        '      line\n'
+        '    size: 1\n'
+        '  opts: {a: 1, b: 2}\n'
+        '  port: 5432\n'
+        'z: [1, 2]\n'
+    )
+
+    assert parser.update_config(
+        'db:\n    url: x', {'db': NameSpace({'port': 1}), 'debug': False}
+    ) == 'db:\n    url: x\n    port: 1\n\ndebug: false\n'
+
+
+def test_safe_tags_only(parser):
+    with pytest.raises(yaml.YAMLError):
+        parser.parse_string('a: !!python/object/apply:os.getcwd []')
+
+
+def test_pure_python_switch():
+    assert YamlParser(pure_python=True).loader.__module__ == 'yaml.loader'
+    assert YamlParser(pure_python=True).dumper.__module__ == 'yaml.dumper'